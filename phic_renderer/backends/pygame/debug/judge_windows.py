@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import Any, List
+from typing import Any, List, Optional
 
-from ....math.util import apply_expand_xy
+import numpy as np
+
+from ....core.render_args import render_args
+from ....engine.note_table import note_table_for
+from ....math.util import make_expand_xy
 from ....runtime.judge import Judge
-from ....runtime.kinematics import eval_line_state, note_world_pos
+from ....runtime.kinematics import LineStateMemo, note_world_pos
 from ....types import NoteState, RuntimeLine
 from ..rendering.draw import draw_line_rgba, draw_ring
 
@@ -23,47 +27,57 @@ def draw_debug_judge_windows(
     idx_next: int,
     RW: int,
     RH: int,
+    line_state: Optional[LineStateMemo] = None,
 ):
-    try:
-        judge_w_px = float(getattr(args, "judge_width", 0.12)) * float(W)
-    except Exception:
-        judge_w_px = 0.12 * float(W)
+    if line_state is None:
+        line_state = LineStateMemo(lines, t)
+    judge_w_px = render_args(args).judge_width * float(W)
     if judge_w_px < 1.0:
         judge_w_px = 1.0
+    half_w = judge_w_px * 0.5
+    bad_s = float(Judge.BAD)
+    good_s = float(Judge.GOOD)
+    perfect_s = float(Judge.PERFECT)
+    ov = float(overrender)
+    expand_xy = make_expand_xy(int(RW), int(RH), float(expand))
+
+    a = 120
+    col_bad = (255, 80, 80, a)
+    col_good = (255, 210, 80, a)
+    col_perf = (80, 220, 255, a)
+    w_bad = max(1, int(2 * overrender))
+    w_good = max(1, int(3 * overrender))
+    w_perf = max(1, int(4 * overrender))
 
     st0 = max(0, int(idx_next) - 60)
     st1 = min(len(states), int(idx_next) + 700)
-    for si in range(st0, st1):
-        s = states[si]
-        if s.judged or s.note.fake:
+    if st1 <= st0:
+        return
+    # Timing and fake are one mask over the note table; only notes inside the BAD
+    # window reach the per-note flag checks and drawing.
+    tab = note_table_for(states)
+    dts = np.abs(float(t) - tab.t_hit[st0:st1])
+    rows = np.flatnonzero((dts <= bad_s) & ~tab.fake[st0:st1])
+    for j, dt in zip(rows.tolist(), dts[rows].tolist()):
+        s = states[st0 + j]
+        if s.judged:
             continue
         n = s.note
-        if int(getattr(n, "kind", 1)) == 3 and getattr(s, "holding", False):
+        if n.kind == 3 and s.holding:
             continue
 
-        dt = abs(float(t) - float(n.t_hit))
-        if dt > float(Judge.BAD):
-            continue
-
-        ln = lines[n.line_id]
-        lx, ly, lr, la01, sc_now, la_raw = eval_line_state(ln, float(t))
+        lx, ly, lr, la01, sc_now, la_raw = line_state(n.line_id)
         x, y = note_world_pos(lx, ly, lr, sc_now, n, n.scroll_hit, for_tail=False)
-        ps = apply_expand_xy(float(x) * float(overrender), float(y) * float(overrender), int(RW), int(RH), expand)
-
-        half_w = float(judge_w_px) * 0.5
-        p0 = apply_expand_xy((float(x) - half_w) * float(overrender), float(y) * float(overrender), int(RW), int(RH), expand)
-        p1 = apply_expand_xy((float(x) + half_w) * float(overrender), float(y) * float(overrender), int(RW), int(RH), expand)
+        y_ov = y * ov
+        ps = expand_xy(x * ov, y_ov)
+        p0 = expand_xy((x - half_w) * ov, y_ov)
+        p1 = expand_xy((x + half_w) * ov, y_ov)
 
-        a = int(120)
-        col_bad = (255, 80, 80, a)
-        col_good = (255, 210, 80, a)
-        col_perf = (80, 220, 255, a)
-        if dt <= float(Judge.BAD):
-            draw_line_rgba(display_frame, p0, p1, col_bad, width=max(1, int(2 * overrender)))
-        if dt <= float(Judge.GOOD):
-            draw_line_rgba(display_frame, p0, p1, col_good, width=max(1, int(3 * overrender)))
-        if dt <= float(Judge.PERFECT):
-            draw_line_rgba(display_frame, p0, p1, col_perf, width=max(1, int(4 * overrender)))
+        draw_line_rgba(display_frame, p0, p1, col_bad, width=w_bad)
+        if dt <= good_s:
+            draw_line_rgba(display_frame, p0, p1, col_good, width=w_good)
+        if dt <= perfect_s:
+            draw_line_rgba(display_frame, p0, p1, col_perf, width=w_perf)
 
         draw_ring(
             display_frame,
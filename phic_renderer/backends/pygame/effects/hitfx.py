@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import math
-from typing import Any
+from typing import Any, List, Optional, Tuple
 
 import pygame
 
@@ -21,7 +21,9 @@ def draw_hitfx(
     expand: float,
     hitfx_scale_mul: float,
     overrender: float = 1.0,
+    out: Optional[List[Tuple]] = None,
 ):
+    """Draw one hit effect; respack sprite frames go to ``out`` for a batched blits() when given."""
     if not respack:
         age = t - fx.t0
         if age < 0 or age > 0.18:
@@ -73,4 +75,8 @@ def draw_hitfx(
     frame.set_alpha(a)
 
     x0, y0 = apply_expand_xy(fx.x * float(overrender), fx.y * float(overrender), W, H, expand)
-    overlay.blit(frame, (x0 - frame.get_width() / 2, y0 - frame.get_height() / 2))
+    dest = (x0 - frame.get_width() / 2, y0 - frame.get_height() / 2)
+    if out is not None:
+        out.append((frame, dest))
+    else:
+        overlay.blit(frame, dest)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Callable, List, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
 import pygame
 
+from ..performance.surface_pool import SurfaceRing
+
 
 def apply_motion_blur(
     *,
@@ -15,41 +17,52 @@ def apply_motion_blur(
     W: int,
     H: int,
     render_frame_cb: Callable[[float], Tuple[pygame.Surface, List[Any]]],
-    surface_pool: Any,
+    acc_ring: Optional[SurfaceRing] = None,
+    scratch_ring: Optional[SurfaceRing] = None,
 ):
     """Apply motion blur by sampling multiple sub-frames and accumulating.
 
     - render_frame_cb(t_sample) must return (base_surface, line_text_draw_calls)
     - The returned surface is the final W/H sized surface.
+    - acc_ring / scratch_ring, when given, supply the accumulator and the scaled
+      sample buffer instead of allocating both per frame. The returned accumulator
+      stays valid until len(acc_ring) further calls.
 
     Returns: display_frame_cur (pygame.Surface)
     """
+    W = int(W)
+    H = int(H)
     if int(mb_samples) <= 1 or float(mb_shutter) <= 1e-6:
         b0, _ = render_frame_cb(float(t))
-        f0 = pygame.transform.smoothscale(b0, (int(W), int(H)))
-        try:
-            surface_pool.release(b0)
-        except Exception:
-            pass
-        return f0
+        if b0.get_size() == (W, H):
+            return b0
+        return pygame.transform.smoothscale(b0, (W, H))
 
-    acc = pygame.Surface((int(W), int(H)), pygame.SRCALPHA)
+    acc = acc_ring.next(W, H) if acc_ring is not None else pygame.Surface((W, H), pygame.SRCALPHA)
     acc.fill((0, 0, 0, 0))
+    scratch = scratch_ring.next(W, H) if scratch_ring is not None else None
     dt_chart = float(dt_frame) * float(chart_speed)
+    n = int(mb_samples)
+    sample_alpha = int(255 / float(n))
 
-    for i in range(int(mb_samples)):
-        frac = 0.0 if int(mb_samples) <= 1 else (float(i) / float(int(mb_samples) - 1))
-        t_s = float(t) - float(mb_shutter) * float(dt_chart) * (1.0 - float(frac))
+    for i in range(n):
+        frac = float(i) / float(n - 1)
+        t_s = float(t) - float(mb_shutter) * dt_chart * (1.0 - frac)
         b_i, _ = render_frame_cb(float(t_s))
-        f_i = pygame.transform.smoothscale(b_i, (int(W), int(H)))
-        try:
-            surface_pool.release(b_i)
-        except Exception:
-            pass
+        if b_i.get_size() == (W, H):
+            # Same size: accumulate the sub-frame directly instead of copying it.
+            f_i = b_i
+        elif scratch is not None:
+            f_i = pygame.transform.smoothscale(b_i, (W, H), scratch)
+        else:
+            f_i = pygame.transform.smoothscale(b_i, (W, H))
         try:
-            f_i.set_alpha(int(255 / float(int(mb_samples))))
+            f_i.set_alpha(sample_alpha)
         except Exception:
             pass
         acc.blit(f_i, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        if f_i is b_i:
+            # Sub-frames may come from a reused ring; do not leak the sample alpha.
+            b_i.set_alpha(255)
 
     return acc
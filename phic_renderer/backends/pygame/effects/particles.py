@@ -1,12 +1,11 @@
 from __future__ import annotations
 
 from typing import List, Dict, Tuple
-from collections import defaultdict
 
 import pygame
 
 from ....runtime.effects import ParticleBurst
-from ....math.util import apply_expand_xy
+from ....math.util import make_expand_xy
 
 
 # Pre-generated particle surfaces cache
@@ -43,10 +42,11 @@ def _get_particle_surface(size: int, color: Tuple[int, int, int, int]) -> pygame
 
 def draw_particles(screen: pygame.Surface, particles: List[ParticleBurst], now_ms: int, W: int, H: int, expand: float):
     """
-    Draw particles with batching optimization.
+    Draw particles with a single blits() call.
 
-    Groups particles by (size, color) and batches blit operations
-    for improved performance.
+    Alpha, size and spread are shared by every particle of a burst, so they are
+    evaluated once per burst; only the positions are per particle. Additive
+    blending is order independent, so no grouping by (size, color) is needed.
     """
     if hasattr(pygame, "BLEND_RGBA_ADD"):
         blend_flag = pygame.BLEND_RGBA_ADD
@@ -55,30 +55,22 @@ def draw_particles(screen: pygame.Surface, particles: List[ParticleBurst], now_m
     else:
         blend_flag = 0
 
-    # Batch particles by (size, color) for efficient rendering
-    batches: Dict[Tuple[int, Tuple[int, int, int, int]], List[Tuple[float, float]]] = defaultdict(list)
+    expand_xy = make_expand_xy(int(W), int(H), float(expand))
+    exp = float(expand)
 
-    # Collect all particles into batches
+    blit_list = []
+    append = blit_list.append
     for p in particles:
-        parts = p.get_particles(now_ms)
-        for q in parts:
-            xq, yq = apply_expand_xy(q["x"], q["y"], W, H, expand)
-            sz = max(1, int(q["size"] / float(expand)))
-            color = q["color"]
-
-            # Ensure color is a tuple (RGBA)
-            if not isinstance(color, tuple):
-                color = (255, 255, 255, 255)
-            elif len(color) == 3:
-                color = (*color, 255)
-
-            batch_key = (sz, color)
-            batches[batch_key].append((xq, yq))
-
-    # Render each batch
-    for (sz, color), positions in batches.items():
-        surf = _get_particle_surface(sz, color)
-
-        # Blit all particles of this size/color in one pass
-        for xq, yq in positions:
-            screen.blit(surf, (int(xq - sz / 2), int(yq - sz / 2)), special_flags=blend_flag)
+        alpha, size, spread = p.frame(now_ms)
+        sz = max(1, int(size / exp))
+        r, g, b, _ = p.rgba
+        surf = _get_particle_surface(sz, (r, g, b, alpha))
+        half = sz / 2
+        x0 = p.x
+        y0 = p.y
+        for spd, ca, sa in p.pa:
+            dist = spd * spread / 2
+            xq, yq = expand_xy(int(x0 + dist * ca), int(y0 + dist * sa))
+            append((surf, (int(xq - half), int(yq - half)), None, blend_flag))
+    if blit_list:
+        screen.blits(blit_list, doreturn=False)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import itertools
 from typing import Any, List, Tuple
 
 import pygame
 
 from ....core.ui import compute_score, progress_ratio
-from ....core.fx import prune_particles
+from ....core.fx import prune_particles_inplace
+from ....core.render_args import render_args
 from .particles import draw_particles
 
 
@@ -14,11 +16,10 @@ def blit_line_text_draw_calls(
     target: pygame.Surface,
     line_text_draw_calls: List[Tuple[int, pygame.Surface, float, float]],
 ):
+    """Blit line labels in one blits() call; render_frame returns them already sorted by priority."""
     if not line_text_draw_calls:
         return
-    line_text_draw_calls.sort(key=lambda x: x[0])
-    for _pr, surf, x0, y0 in line_text_draw_calls:
-        target.blit(surf, (x0, y0))
+    target.blits([(surf, (x0, y0)) for _pr, surf, x0, y0 in line_text_draw_calls], doreturn=False)
 
 
 def draw_expand_border(*, screen: pygame.Surface, W: int, H: int, expand: float):
@@ -55,15 +56,16 @@ def post_render_record_headless_overlay(
     hit_debug_lines: Any,
     start_time: Any = None,
 ):
-    if getattr(args, "record_render_particles", False):
+    ra = render_args(args)
+    if ra.record_render_particles:
         try:
             now_ms = int(float(t) * 1000.0)
-            particles[:] = prune_particles(particles, now_ms)
+            prune_particles_inplace(particles, now_ms)
             draw_particles(display_frame, particles, now_ms, int(W), int(H), float(expand))
         except Exception:
             pass
 
-    if getattr(args, "record_render_text", False):
+    if ra.record_render_text:
         try:
             blit_line_text_draw_calls(target=display_frame, line_text_draw_calls=line_text_draw_calls)
         except Exception:
@@ -79,12 +81,12 @@ def post_render_record_headless_overlay(
             ui_particles_y = ui_fmt_y + small.get_linesize() + max(2, ui_pad // 2)
             ui_hitdbg_y = ui_fmt_y + small.get_linesize() + ui_pad
 
-            if getattr(args, "debug_particles", False):
+            if ra.debug_particles:
                 txt = small.render(f"particles={len(particles)}", True, (220, 220, 220))
                 display_frame.blit(txt, (ui_x, ui_particles_y))
 
             if float(chart_end) > 1e-6:
-                st = start_time if start_time is not None else getattr(args, "start_time", None)
+                st = start_time if start_time is not None else ra.start_time
                 pbar = progress_ratio(float(t), float(chart_end), advance_active=bool(advance_active), start_time=st)
                 pygame.draw.rect(display_frame, (40, 40, 40), pygame.Rect(0, 0, int(W), 6))
                 pygame.draw.rect(display_frame, (230, 230, 230), pygame.Rect(0, 0, int(int(W) * float(pbar)), 6))
@@ -108,21 +110,16 @@ def post_render_record_headless_overlay(
             display_frame.blit(fmt_txt, (ui_x, ui_fmt_y))
 
             if hit_debug and hit_debug_lines:
-                cols = max(1, int(getattr(args, "hit_debug_cols", 5) or 5))
+                cols = ra.hit_debug_cols
                 shown = 0
-                for rec in list(hit_debug_lines)[:cols]:
-                    try:
-                        dt_ms = float(rec.get("dt_ms", 0.0))
-                        nid = int(rec.get("nid", -1))
-                        jd = str(rec.get("judgement", ""))
-                        hp = rec.get("hold_percent", None)
-                        hp_s = "-" if hp is None else f"{float(hp)*100:5.1f}%"
-                        s = f"{dt_ms:+7.1f}ms  id={nid:6d}  {jd:7s}  hold={hp_s}"
-                        txt = small.render(s, True, (200, 200, 200))
-                        display_frame.blit(txt, (ui_x, ui_hitdbg_y + shown * small.get_linesize()))
-                        shown += 1
-                    except Exception:
-                        pass
+                # HitRec fields are typed by the producer; use them as-is.
+                for rec in itertools.islice(hit_debug_lines, cols):
+                    hp = rec.hold_percent
+                    hp_s = "-" if hp is None else f"{hp*100:5.1f}%"
+                    s = f"{rec.dt_ms:+7.1f}ms  id={rec.nid:6d}  {rec.judgement:7s}  hold={hp_s}"
+                    txt = small.render(s, True, (200, 200, 200))
+                    display_frame.blit(txt, (ui_x, ui_hitdbg_y + shown * small.get_linesize()))
+                    shown += 1
         except Exception:
             pass
 
@@ -140,7 +137,7 @@ def post_render_non_headless(
     draw_expand_border(screen=screen, W=int(W), H=int(H), expand=float(expand))
 
     now_ms = int(float(t) * 1000.0)
-    particles[:] = prune_particles(particles, now_ms)
+    prune_particles_inplace(particles, now_ms)
     draw_particles(screen, particles, now_ms, int(W), int(H), float(expand))
 
     blit_line_text_draw_calls(target=screen, line_text_draw_calls=line_text_draw_calls)
@@ -1,12 +1,223 @@
 from __future__ import annotations
 
+import operator
 from collections import deque
-from typing import Any, Optional, Tuple
+from typing import Any, NamedTuple, Optional, Tuple
 
+import numpy as np
 import pygame
 
 from ....math.util import clamp
 
+try:
+    from numba import njit, prange  # type: ignore
+
+    _NUMBA_OK = True
+except Exception:  # pragma: no cover
+    njit = None  # type: ignore
+    prange = range  # type: ignore
+    _NUMBA_OK = False
+
+
+class TrailConfig(NamedTuple):
+    """Trail options: runtime overrides on the state module over the args defaults."""
+
+    alpha: float
+    frames: int
+    decay: float
+    blur: int
+    dim: int
+    blur_ramp: bool
+    blend: str
+
+
+# Raw state overrides in one call; a change in this tuple means the config is stale.
+trail_state_key = operator.attrgetter(
+    "trail_alpha", "trail_frames", "trail_decay", "trail_blur", "trail_dim", "trail_blur_ramp", "trail_blend"
+)
+
+
+def resolve_trail_config(raw: Tuple[Any, ...], *, default_alpha: float, default_blur: int, default_dim: int) -> TrailConfig:
+    """Parse the trail_state_key tuple; unset or unparsable overrides fall back to the defaults."""
+    alpha_v, frames_v, decay_v, blur_v, dim_v, ramp_v, blend_v = raw
+
+    alpha = default_alpha
+    if alpha_v is not None:
+        try:
+            alpha = clamp(float(alpha_v), 0.0, 1.0)
+        except Exception:
+            pass
+
+    frames = 1
+    if frames_v is not None:
+        try:
+            frames = max(1, int(frames_v))
+        except Exception:
+            frames = 1
+
+    decay = 0.85
+    if decay_v is not None:
+        try:
+            decay = clamp(float(decay_v), 0.0, 1.0)
+        except Exception:
+            decay = 0.85
+
+    blur = default_blur
+    if blur_v is not None:
+        try:
+            blur = int(blur_v)
+        except Exception:
+            pass
+
+    dim = default_dim
+    if dim_v is not None:
+        try:
+            dim = clamp(int(dim_v), 0, 255)
+        except Exception:
+            pass
+
+    blur_ramp = False
+    if ramp_v is not None:
+        try:
+            blur_ramp = bool(ramp_v)
+        except Exception:
+            blur_ramp = False
+
+    blend = "normal"
+    if blend_v is not None:
+        try:
+            blend = str(blend_v).strip().lower()
+        except Exception:
+            blend = "normal"
+
+    return TrailConfig(alpha=alpha, frames=frames, decay=decay, blur=blur, dim=dim, blur_ramp=blur_ramp, blend=blend)
+
+
+class _TrailEntry:
+    """One history frame plus its blurred/dimmed copy and, on the kernel path, its ring slot."""
+
+    __slots__ = ("frame", "prep_key", "prepared", "ring", "slot", "ring_dim")
+
+    def __init__(self, frame: pygame.Surface):
+        self.frame = frame
+        self.prep_key: Optional[Tuple[int, int, int, int]] = None
+        self.prepared: Optional[pygame.Surface] = None
+        self.ring: Optional[np.ndarray] = None
+        self.slot = -1
+        self.ring_dim = 0
+
+
+def _blend_row(row, src, a, amask, ashift):
+    """row = pygame's SRCALPHA blit of src at surface alpha a (packed 32-bit pixels).
+
+    With sA = srcA * a // 255 each colour channel becomes ((s - d) * sA + s >> 8) + d
+    and alpha sA + dA - sA * dA // 255, or src with alpha sA where dA is 0. x // 255
+    is written (x + 1 + (x >> 8)) >> 8, exact for x <= 255 * 255, and the channel
+    term carries a +255 bias so the arithmetic stays unsigned and branch free.
+    """
+    for x in range(row.shape[0]):
+        s = src[x]
+        d = row[x]
+        sa = ((s >> ashift) & 255) * a
+        sa = (sa + 1 + (sa >> 8)) >> 8
+        da = (d >> ashift) & 255
+        p = sa * da
+        ra = sa + da - ((p + 1 + (p >> 8)) >> 8)
+        s0 = s & 255
+        d0 = d & 255
+        s1 = (s >> 8) & 255
+        d1 = (d >> 8) & 255
+        s2 = (s >> 16) & 255
+        d2 = (d >> 16) & 255
+        s3 = (s >> 24) & 255
+        d3 = (d >> 24) & 255
+        c0 = ((s0 * (sa + 1) + 65280 - d0 * sa) >> 8) + d0 - 255
+        c1 = ((s1 * (sa + 1) + 65280 - d1 * sa) >> 8) + d1 - 255
+        c2 = ((s2 * (sa + 1) + 65280 - d2 * sa) >> 8) + d2 - 255
+        c3 = ((s3 * (sa + 1) + 65280 - d3 * sa) >> 8) + d3 - 255
+        r = ((c0 | (c1 << 8) | (c2 << 16) | (c3 << 24)) & ~amask) | (ra << ashift)
+        row[x] = ((s & ~amask) | (sa << ashift)) if da == 0 else r
+
+
+def _add_row(row, src):
+    """row = pygame's BLEND_RGBA_ADD blit of src: a saturating add of all four channels."""
+    for x in range(row.shape[0]):
+        s = src[x]
+        d = row[x]
+        c0 = min((s & 255) + (d & 255), 255)
+        c1 = min(((s >> 8) & 255) + ((d >> 8) & 255), 255)
+        c2 = min(((s >> 16) & 255) + ((d >> 16) & 255), 255)
+        c3 = min(((s >> 24) & 255) + ((d >> 24) & 255), 255)
+        row[x] = c0 | (c1 << 8) | (c2 << 16) | (c3 << 24)
+
+
+def _compose_trail(out, ring, slots, alphas, blend_add, cur, ashift):
+    """Blit ring[slots[k]] at surface alpha alphas[k] (oldest first), then cur, onto out.
+
+    All arrays hold packed 32-bit pixels as (rows, cols); BLEND_RGBA_ADD ignores the
+    surface alpha. Each row is composed in a contiguous buffer, so out may be a
+    strided view (e.g. a pooled subsurface) and is still read and written once.
+    """
+    h = out.shape[0]
+    w = out.shape[1]
+    n = slots.shape[0]
+    sh = np.uint32(ashift)
+    amask = np.uint32(255) << sh
+    for y in prange(h):
+        row = np.empty(w, dtype=np.uint32)
+        row[:] = out[y]
+        for k in range(n):
+            if blend_add:
+                _add_row(row, ring[slots[k], y])
+            else:
+                _blend_row(row, ring[slots[k], y], np.uint32(alphas[k]), amask, sh)
+        _blend_row(row, cur[y], np.uint32(255), amask, sh)
+        out[y] = row
+
+
+if _NUMBA_OK:
+    _blend_row = njit(cache=True)(_blend_row)
+    _add_row = njit(cache=True)(_add_row)
+    _compose_trail_impl = njit(cache=True, parallel=True)(_compose_trail)
+else:
+    _compose_trail_impl = None
+
+
+# Single-slot cache: packed pixels of the trail history, one (H, W) slot per frame.
+_RING = {"buf": None}
+
+
+def _trail_ring(cap: int, h: int, w: int) -> np.ndarray:
+    buf = _RING["buf"]
+    if buf is None or buf.shape != (cap, h, w):
+        buf = np.empty((cap, h, w), dtype=np.uint32)
+        _RING["buf"] = buf
+    return buf
+
+
+def _store_in_ring(ent: _TrailEntry, hist: deque, ring: np.ndarray, src: pygame.Surface, dim: int) -> None:
+    """Copy src (ent.frame as drawn) into ent's ring slot, claiming a free one if needed."""
+    if ent.ring is not ring:
+        used = {e.slot for e in hist if e.ring is ring}
+        ent.slot = next(i for i in range(len(ring)) if i not in used)
+        ent.ring = ring
+    px = pygame.surfarray.pixels2d(src)
+    ring[ent.slot] = px.T
+    del px
+    ent.ring_dim = dim
+
+
+def _kernel_alpha_shift(out: pygame.Surface, cur: pygame.Surface) -> int:
+    """Alpha bit shift when out/cur are 32-bit per-pixel-alpha frames of one layout, else -1."""
+    if _compose_trail_impl is None:
+        return -1
+    for surf in (out, cur):
+        if surf.get_bitsize() != 32 or not (surf.get_flags() & pygame.SRCALPHA):
+            return -1
+    if out.get_masks() != cur.get_masks() or cur.get_alpha() not in (None, 255):
+        return -1
+    return int(out.get_shifts()[3])
+
 
 def apply_trail(
     *,
@@ -36,40 +247,90 @@ def apply_trail(
             trail_hist_cap = int(trail_frames)
 
         out = surface_pool.get(int(W), int(H), pygame.SRCALPHA)
-        hist_list = list(trail_hist)
-        for idx, frm in enumerate(hist_list):
-            age = (len(hist_list) - 1) - idx
-            w = float(trail_alpha) * (float(trail_decay) ** float(age))
-            if w <= 1e-6:
-                continue
-            src = frm
-            blur_k = int(trail_blur)
-            if trail_blur_ramp and blur_k > 1:
-                blur_k = int(max(2, blur_k * (1 + age)))
-            if blur_k and blur_k > 1:
-                bw = max(1, int(int(W) / blur_k))
-                bh = max(1, int(int(H) / blur_k))
-                src = pygame.transform.smoothscale(src, (bw, bh))
-                src = pygame.transform.smoothscale(src, (int(W), int(H)))
-            if int(trail_dim) > 0:
-                dkey = (int(W), int(H), int(trail_dim))
-                if (trail_dim_cache is None) or (trail_dim_cache_key != dkey):
-                    trail_dim_cache = pygame.Surface((int(W), int(H)), pygame.SRCALPHA)
-                    trail_dim_cache.fill((0, 0, 0, int(trail_dim)))
-                    trail_dim_cache_key = dkey
-                src = src.copy()
-                src.blit(trail_dim_cache, (0, 0))
-            else:
-                src = src.copy()
-            src.set_alpha(int(255 * clamp(w, 0.0, 1.0)))
-            if str(trail_blend) == "add":
-                out.blit(src, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-            else:
-                out.blit(src, (0, 0))
+        dim_on = int(trail_dim) > 0
+        if dim_on:
+            dkey = (int(W), int(H), int(trail_dim))
+            if (trail_dim_cache is None) or (trail_dim_cache_key != dkey):
+                trail_dim_cache = pygame.Surface((int(W), int(H)), pygame.SRCALPHA)
+                trail_dim_cache.fill((0, 0, 0, int(trail_dim)))
+                trail_dim_cache_key = dkey
+        blur_on = int(trail_blur) > 1
+        blend_add = str(trail_blend) == "add"
+        blend_flags = pygame.BLEND_RGBA_ADD if blend_add else 0
+        ashift = -1 if blur_on else _kernel_alpha_shift(out, display_frame_cur)
+        if ashift >= 0:
+            # One pass over the frame instead of a full-frame blit per history entry.
+            # Ring slots hold each frame as drawn (dimmed if dim is on), so they are
+            # only refilled when the entry is new or the dim changed.
+            ring = _trail_ring(int(trail_hist_cap), int(H), int(W))
+            dim = int(trail_dim) if dim_on else 0
+            slots = []
+            alphas = []
+            n_hist = len(trail_hist)
+            for idx, ent in enumerate(trail_hist):
+                if ent.ring is not ring or ent.ring_dim != dim:
+                    src = ent.frame
+                    if dim_on:
+                        src = src.copy()
+                        src.blit(trail_dim_cache, (0, 0))
+                    _store_in_ring(ent, trail_hist, ring, src, dim)
+                w = float(trail_alpha) * (float(trail_decay) ** float(n_hist - 1 - idx))
+                if w > 1e-6:
+                    slots.append(ent.slot)
+                    alphas.append(int(255 * clamp(w, 0.0, 1.0)))
+            out_px = pygame.surfarray.pixels2d(out)
+            cur_px = pygame.surfarray.pixels2d(display_frame_cur)
+            _compose_trail_impl(
+                out_px.T,
+                ring,
+                np.asarray(slots, dtype=np.intp),
+                np.asarray(alphas, dtype=np.int64),
+                blend_add,
+                cur_px.T,
+                ashift,
+            )
+            del out_px, cur_px
+        else:
+            hist_list = list(trail_hist)
+            for idx, ent in enumerate(hist_list):
+                age = (len(hist_list) - 1) - idx
+                w = float(trail_alpha) * (float(trail_decay) ** float(age))
+                if w <= 1e-6:
+                    continue
+                frm = ent.frame
+                src = frm
+                if blur_on or dim_on:
+                    blur_k = 0
+                    if blur_on:
+                        blur_k = int(trail_blur)
+                        if trail_blur_ramp:
+                            blur_k = int(max(2, blur_k * (1 + age)))
+                    # History frames never change, so the blurred/dimmed copy is made once
+                    # and reused while its key holds. With the ramp the blur size moves with
+                    # age and the copy is rebuilt every frame.
+                    pkey = (int(W), int(H), blur_k, int(trail_dim) if dim_on else 0)
+                    src = ent.prepared
+                    if src is None or ent.prep_key != pkey:
+                        if blur_on:
+                            bw = max(1, int(int(W) / blur_k))
+                            bh = max(1, int(int(H) / blur_k))
+                            src = pygame.transform.smoothscale(frm, (bw, bh))
+                            src = pygame.transform.smoothscale(src, (int(W), int(H)))
+                        else:
+                            src = frm.copy()
+                        if dim_on:
+                            src.blit(trail_dim_cache, (0, 0))
+                        ent.prepared = src
+                        ent.prep_key = pkey
+                src.set_alpha(int(255 * clamp(w, 0.0, 1.0)))
+                out.blit(src, (0, 0), special_flags=blend_flags)
+                if src is frm:
+                    # History frames can come back from a surface ring; leave them opaque.
+                    frm.set_alpha(255)
 
-        out.blit(display_frame_cur, (0, 0))
+            out.blit(display_frame_cur, (0, 0))
         display_frame = out
-        trail_hist.append(display_frame_cur)
+        trail_hist.append(_TrailEntry(display_frame_cur))
         return display_frame, trail_hist, trail_hist_cap, trail_dim_cache, trail_dim_cache_key
 
     display_frame = display_frame_cur
@@ -80,4 +341,5 @@ def apply_trail(
             pass
     trail_dim_cache = None
     trail_dim_cache_key = None
+    _RING["buf"] = None
     return display_frame, trail_hist, trail_hist_cap, trail_dim_cache, trail_dim_cache_key
@@ -1,12 +1,218 @@
 from __future__ import annotations
 
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, List, Optional, Tuple
 
+from ....core.render_args import render_args
 from ....math.util import clamp
-from ....runtime.kinematics import eval_line_state, note_world_pos
+from ....runtime.effects import hitfx_color
+from ....runtime.kinematics import LineStateMemo, note_world_pos
 from ....types import NoteState, RuntimeLine
 
 
+def _hold_rows(states: List[NoteState], st0: int, st1: int) -> List[int]:
+    """Non-fake hold indices in [st0, st1), skipping holds that are done for good."""
+    # Imported here: engine/__init__ imports this module through hold_system.
+    from ....engine.note_table import kind_index, note_table_for
+
+    return kind_index(note_table_for(states), 3).window(states, st0, st1)
+
+
+def _judge_half_extents(args: Any, W: int, H: int) -> Tuple[float, float]:
+    ra = render_args(args)
+    judge_w_px = ra.judge_width * float(W)
+    if judge_w_px < 1.0:
+        judge_w_px = 1.0
+    judge_h_px = ra.judge_height * float(H)
+    if judge_h_px < 1.0:
+        judge_h_px = 1.0
+    return judge_w_px * 0.5, judge_h_px * 0.5
+
+
+def _maintain_hold(
+    s: NoteState,
+    t: float,
+    hold_tail_tol: float,
+    pointers: Any,
+    judge: Any,
+    line_state: LineStateMemo,
+    half_w: float,
+    half_h: float,
+) -> None:
+    """Release a held, unjudged hold whose head no pointer covers any more."""
+    n = s.note
+    try:
+        lx, ly, lr, _la01, sc_now, _la_raw = line_state(int(n.line_id))
+        head_target_scroll = float(n.scroll_hit) if float(sc_now) <= float(n.scroll_hit) else float(sc_now)
+        hx, hy = note_world_pos(float(lx), float(ly), float(lr), float(sc_now), n, float(head_target_scroll), for_tail=False)
+    except Exception:
+        hx, hy = None, None
+
+    any_cover = False
+    try:
+        frames = pointers.frame_pointers()
+    except Exception:
+        frames = []
+    if hx is None or hy is None:
+        try:
+            any_cover = bool(pointers.any_down())
+        except Exception:
+            any_cover = False
+    else:
+        for pf in list(frames):
+            try:
+                if not bool(getattr(pf, "down", False)):
+                    continue
+                px = getattr(pf, "x", None)
+                py = getattr(pf, "y", None)
+                if px is None or py is None:
+                    continue
+                if abs(float(px) - hx) <= half_w and abs(float(py) - hy) <= half_h:
+                    any_cover = True
+                    s.hold_pointer_id = int(getattr(pf, "pointer_id", -999))
+                    break
+            except Exception:
+                continue
+
+    if (not bool(any_cover)) and float(t) < float(n.t_end) - 1e-6:
+        try:
+            dur = max(1e-6, float(n.t_end) - float(n.t_hit))
+            prog_r = clamp((float(t) - float(n.t_hit)) / dur, 0.0, 1.0)
+        except Exception:
+            prog_r = 0.0
+        s.released_early = True
+        s.release_t = float(t)
+        s.release_percent = float(prog_r)
+        if float(prog_r) < float(hold_tail_tol):
+            s.miss_t = float(t)
+            s.miss = True
+            s.judged = True
+            s.hold_failed = True
+            s.hold_finalized = True
+            s.holding = False
+            judge.mark_miss(s)
+        else:
+            s.holding = False
+    if float(t) >= float(n.t_end):
+        s.holding = False
+
+
+def _finalize_hold(
+    s: NoteState,
+    t: float,
+    hold_tail_tol: float,
+    miss_window: float,
+    judge: Any,
+    push_hit_debug_cb: Callable[..., Any],
+) -> None:
+    """Settle a hold that is not finalized yet: failed head, early release or tail reached."""
+    n = s.note
+    if (not s.hit) and (not s.hold_failed) and (float(t) > float(n.t_hit) + float(miss_window)):
+        s.hold_failed = True
+        judge.break_combo()
+
+    if s.released_early and (not s.hold_finalized):
+        dur = max(1e-6, (float(n.t_end) - float(n.t_hit)))
+        prog = clamp((float(t) - float(n.t_hit)) / dur, 0.0, 1.0)
+        if float(prog) < float(hold_tail_tol):
+            s.hold_failed = True
+            judge.break_combo()
+        else:
+            g = s.hold_grade or "PERFECT"
+            judge.acc_sum += s.hold_weight
+            judge.judged_cnt += 1
+            s.hold_finalized = True
+            push_hit_debug_cb(
+                t_now=float(t),
+                t_hit=float(n.t_hit),
+                note_id=int(getattr(n, "nid", -1)),
+                judgement=str(g),
+                hold_percent=float(prog),
+                note_kind=int(getattr(n, "kind", 0) or 0),
+                mh=bool(getattr(n, "mh", False)),
+                line_id=int(getattr(n, "line_id", -1)),
+                source="hold_finalize",
+            )
+
+    if float(t) >= float(n.t_end) and (not s.hold_finalized):
+        if s.hit and (not s.hold_failed):
+            g = s.hold_grade or "PERFECT"
+            judge.acc_sum += s.hold_weight
+            judge.judged_cnt += 1
+            dur = max(1e-6, (float(n.t_end) - float(n.t_hit)))
+            prog = clamp((float(t) - float(n.t_hit)) / dur, 0.0, 1.0)
+            push_hit_debug_cb(
+                t_now=float(t),
+                t_hit=float(n.t_hit),
+                note_id=int(getattr(n, "nid", -1)),
+                judgement=str(g),
+                hold_percent=float(prog),
+                note_kind=int(getattr(n, "kind", 0) or 0),
+                mh=bool(getattr(n, "mh", False)),
+                line_id=int(getattr(n, "line_id", -1)),
+                source="hold_finalize",
+            )
+        else:
+            judge.mark_miss(s)
+            try:
+                dur = max(1e-6, (float(n.t_end) - float(n.t_hit)))
+                prog = clamp((float(t) - float(n.t_hit)) / dur, 0.0, 1.0)
+            except Exception:
+                prog = 0.0
+            push_hit_debug_cb(
+                t_now=float(t),
+                t_hit=float(n.t_hit),
+                note_id=int(getattr(n, "nid", -1)),
+                judgement="MISS",
+                hold_percent=float(prog),
+                note_kind=int(getattr(n, "kind", 0) or 0),
+                mh=bool(getattr(n, "mh", False)),
+                line_id=int(getattr(n, "line_id", -1)),
+                source="hold_finalize",
+            )
+        s.hold_finalized = True
+        s.judged = True
+
+
+def _tick_hold_fx(
+    s: NoteState,
+    t: float,
+    now_tick: int,
+    hold_fx_interval_ms: int,
+    respack: Any,
+    hitfx: List[Any],
+    particles: List[Any],
+    HitFX_cls: Any,
+    ParticleBurst_cls: Any,
+    mark_line_hit_cb: Callable[[int, int], Any],
+    line_state: LineStateMemo,
+) -> None:
+    """Emit the periodic hit fx of a held, unjudged hold that are due by now_tick."""
+    n = s.note
+    if float(t) >= float(n.t_end):
+        return
+    if s.next_hold_fx_ms <= 0:
+        s.next_hold_fx_ms = now_tick + int(hold_fx_interval_ms)
+        return
+    interval = max(1, int(hold_fx_interval_ms))
+    if now_tick < s.next_hold_fx_ms:
+        return
+    # Every tick due this frame lands at the same place and time; resolve it once.
+    k = (now_tick - s.next_hold_fx_ms) // interval + 1
+    s.next_hold_fx_ms += k * interval
+    lx, ly, lr, la01, sc_now, la_raw = line_state(n.line_id)
+    x, y = note_world_pos(lx, ly, lr, sc_now, n, sc_now, for_tail=False)
+    g = str(s.hold_grade or "PERFECT").upper()
+    c = hitfx_color(n, respack, g)
+    var = "good" if g == "GOOD" else ""
+    with_particles = not respack.hide_particles
+    dur_ms = int(respack.hitfx_duration * 1000)
+    for _ in range(k):
+        hitfx.append(HitFX_cls(x, y, float(t), c, lr, var))
+        if with_particles:
+            particles.append(ParticleBurst_cls(x, y, now_tick, dur_ms, c))
+    mark_line_hit_cb(n.line_id, now_tick)
+
+
 def hold_maintenance(
     *,
     args: Any,
@@ -19,94 +225,17 @@ def hold_maintenance(
     lines: List[RuntimeLine],
     pointers: Any,
     judge: Any,
+    line_state: Optional[LineStateMemo] = None,
 ):
+    if line_state is None:
+        line_state = LineStateMemo(lines, t)
+    half_w, half_h = _judge_half_extents(args, W, H)
     st0 = max(0, int(idx_next) - 50)
     st1 = min(len(states), int(idx_next) + 500)
-    for si in range(st0, st1):
+    for si in _hold_rows(states, st0, st1):
         s = states[si]
-        if s.judged or s.note.fake:
-            continue
-        n = s.note
-        if n.kind == 3 and s.holding:
-            try:
-                judge_w_px = float(getattr(args, "judge_width", 0.12)) * float(W)
-            except Exception:
-                judge_w_px = 0.12 * float(W)
-            if judge_w_px < 1.0:
-                judge_w_px = 1.0
-            try:
-                judge_h_px = float(getattr(args, "judge_height", 0.06)) * float(H)
-            except Exception:
-                judge_h_px = 0.06 * float(H)
-            if judge_h_px < 1.0:
-                judge_h_px = 1.0
-
-            try:
-                ln = lines[int(n.line_id)]
-                lx, ly, lr, _la01, sc_now, _la_raw = eval_line_state(ln, float(t))
-                head_target_scroll = float(n.scroll_hit) if float(sc_now) <= float(n.scroll_hit) else float(sc_now)
-                hx, hy = note_world_pos(float(lx), float(ly), float(lr), float(sc_now), n, float(head_target_scroll), for_tail=False)
-            except Exception:
-                hx, hy = None, None
-
-            any_cover = False
-            try:
-                frames = pointers.frame_pointers()
-            except Exception:
-                frames = []
-            if hx is None or hy is None:
-                try:
-                    any_cover = bool(pointers.any_down())
-                except Exception:
-                    any_cover = False
-            else:
-                half_w = float(judge_w_px) * 0.5
-                half_h = float(judge_h_px) * 0.5
-                for pf in list(frames):
-                    try:
-                        if not bool(getattr(pf, "down", False)):
-                            continue
-                        px = getattr(pf, "x", None)
-                        py = getattr(pf, "y", None)
-                        if px is None or py is None:
-                            continue
-                        if abs(float(px) - float(hx)) <= float(half_w) and abs(float(py) - float(hy)) <= float(half_h):
-                            any_cover = True
-                            try:
-                                setattr(s, "hold_pointer_id", int(getattr(pf, "pointer_id", -999)))
-                            except Exception:
-                                pass
-                            break
-                    except Exception:
-                        continue
-
-            if (not bool(any_cover)) and float(t) < float(n.t_end) - 1e-6:
-                try:
-                    dur = max(1e-6, float(n.t_end) - float(n.t_hit))
-                    prog_r = clamp((float(t) - float(n.t_hit)) / dur, 0.0, 1.0)
-                except Exception:
-                    prog_r = 0.0
-                s.released_early = True
-                try:
-                    setattr(s, "release_t", float(t))
-                    setattr(s, "release_percent", float(prog_r))
-                except Exception:
-                    pass
-                if float(prog_r) < float(hold_tail_tol):
-                    try:
-                        setattr(s, "miss_t", float(t))
-                    except Exception:
-                        pass
-                    s.miss = True
-                    s.judged = True
-                    s.hold_failed = True
-                    s.hold_finalized = True
-                    s.holding = False
-                    judge.mark_miss(s)
-                else:
-                    s.holding = False
-            if float(t) >= float(n.t_end):
-                s.holding = False
+        if s.holding and not s.judged:
+            _maintain_hold(s, t, hold_tail_tol, pointers, judge, line_state, half_w, half_h)
 
 
 def hold_finalize(
@@ -121,88 +250,10 @@ def hold_finalize(
 ):
     st0 = max(0, int(idx_next) - 200)
     st1 = min(len(states), int(idx_next) + 800)
-    for si in range(st0, st1):
+    for si in _hold_rows(states, st0, st1):
         s = states[si]
-        n = s.note
-        if n.fake or n.kind != 3 or s.hold_finalized:
-            continue
-
-        if (not s.hit) and (not s.hold_failed) and (float(t) > float(n.t_hit) + float(miss_window)):
-            s.hold_failed = True
-            judge.break_combo()
-
-        if s.released_early and (not s.hold_finalized):
-            dur = max(1e-6, (float(n.t_end) - float(n.t_hit)))
-            prog = clamp((float(t) - float(n.t_hit)) / dur, 0.0, 1.0)
-            if float(prog) < float(hold_tail_tol):
-                s.hold_failed = True
-                judge.break_combo()
-            else:
-                g = s.hold_grade or "PERFECT"
-                judge.acc_sum += getattr(judge, "JUDGE_WEIGHT", {}).get(g, 0.0) if hasattr(judge, "JUDGE_WEIGHT") else 0.0
-                try:
-                    from ....runtime.judge import JUDGE_WEIGHT
-
-                    judge.acc_sum += JUDGE_WEIGHT.get(g, 0.0)
-                except Exception:
-                    pass
-                judge.judged_cnt += 1
-                s.hold_finalized = True
-                push_hit_debug_cb(
-                    t_now=float(t),
-                    t_hit=float(n.t_hit),
-                    note_id=int(getattr(n, "nid", -1)),
-                    judgement=str(g),
-                    hold_percent=float(prog),
-                    note_kind=int(getattr(n, "kind", 0) or 0),
-                    mh=bool(getattr(n, "mh", False)),
-                    line_id=int(getattr(n, "line_id", -1)),
-                    source="hold_finalize",
-                )
-
-        if float(t) >= float(n.t_end) and (not s.hold_finalized):
-            if s.hit and (not s.hold_failed):
-                g = s.hold_grade or "PERFECT"
-                try:
-                    from ....runtime.judge import JUDGE_WEIGHT
-
-                    judge.acc_sum += JUDGE_WEIGHT.get(g, 0.0)
-                except Exception:
-                    pass
-                judge.judged_cnt += 1
-                dur = max(1e-6, (float(n.t_end) - float(n.t_hit)))
-                prog = clamp((float(t) - float(n.t_hit)) / dur, 0.0, 1.0)
-                push_hit_debug_cb(
-                    t_now=float(t),
-                    t_hit=float(n.t_hit),
-                    note_id=int(getattr(n, "nid", -1)),
-                    judgement=str(g),
-                    hold_percent=float(prog),
-                    note_kind=int(getattr(n, "kind", 0) or 0),
-                    mh=bool(getattr(n, "mh", False)),
-                    line_id=int(getattr(n, "line_id", -1)),
-                    source="hold_finalize",
-                )
-            else:
-                judge.mark_miss(s)
-                try:
-                    dur = max(1e-6, (float(n.t_end) - float(n.t_hit)))
-                    prog = clamp((float(t) - float(n.t_hit)) / dur, 0.0, 1.0)
-                except Exception:
-                    prog = 0.0
-                push_hit_debug_cb(
-                    t_now=float(t),
-                    t_hit=float(n.t_hit),
-                    note_id=int(getattr(n, "nid", -1)),
-                    judgement="MISS",
-                    hold_percent=float(prog),
-                    note_kind=int(getattr(n, "kind", 0) or 0),
-                    mh=bool(getattr(n, "mh", False)),
-                    line_id=int(getattr(n, "line_id", -1)),
-                    source="hold_finalize",
-                )
-            s.hold_finalized = True
-            s.judged = True
+        if not s.hold_finalized:
+            _finalize_hold(s, t, hold_tail_tol, miss_window, judge, push_hit_debug_cb)
 
 
 def hold_tick_fx(
@@ -218,40 +269,81 @@ def hold_tick_fx(
     HitFX_cls: Any,
     ParticleBurst_cls: Any,
     mark_line_hit_cb: Callable[[int, int], Any],
+    line_state: Optional[LineStateMemo] = None,
 ):
     if not respack:
         return
+    if line_state is None:
+        line_state = LineStateMemo(lines, t)
+    now_tick = int(float(t) * 1000.0)
+    st0 = max(0, int(idx_next) - 200)
+    st1 = min(len(states), int(idx_next) + 800)
+    for si in _hold_rows(states, st0, st1):
+        s = states[si]
+        if s.holding and not s.judged:
+            _tick_hold_fx(
+                s, t, now_tick, hold_fx_interval_ms, respack, hitfx, particles,
+                HitFX_cls, ParticleBurst_cls, mark_line_hit_cb, line_state,
+            )
 
+
+def hold_update(
+    *,
+    args: Any,
+    states: List[NoteState],
+    idx_next: int,
+    t: float,
+    hold_tail_tol: float,
+    miss_window: float,
+    hold_fx_interval_ms: int,
+    W: int,
+    H: int,
+    lines: List[RuntimeLine],
+    pointers: Any,
+    judge: Any,
+    maintain: bool,
+    respack: Any,
+    hitfx: List[Any],
+    particles: List[Any],
+    HitFX_cls: Any,
+    ParticleBurst_cls: Any,
+    mark_line_hit_cb: Callable[[int, int], Any],
+    push_hit_debug_cb: Callable[..., Any],
+    line_state: Optional[LineStateMemo] = None,
+):
+    """hold_maintenance (when maintain), hold_finalize and hold_tick_fx in one sweep.
+
+    Each hold goes through the three steps in that order before the next hold is
+    looked at; the steps of different holds never read each other's state.
+
+    Unlike hold_maintenance, which scans [idx_next-50, idx_next+500), maintenance
+    here covers the finalize/tick window [idx_next-200, idx_next+800), so held
+    holds further from idx_next are also released when no pointer covers them.
+    Maintenance errors are caught here (per hold, or for the whole frame if the
+    judge extents cannot be resolved), so finalize and tick fx still run.
+    """
+    if line_state is None:
+        line_state = LineStateMemo(lines, t)
+    half_w, half_h = 0.0, 0.0
+    if maintain:
+        try:
+            half_w, half_h = _judge_half_extents(args, W, H)
+        except Exception:
+            maintain = False
     now_tick = int(float(t) * 1000.0)
     st0 = max(0, int(idx_next) - 200)
     st1 = min(len(states), int(idx_next) + 800)
-    for si in range(st0, st1):
+    for si in _hold_rows(states, st0, st1):
         s = states[si]
-        n = s.note
-        if n.fake or n.kind != 3 or (not s.holding) or s.judged:
-            continue
-        if float(t) >= float(n.t_end):
-            continue
-        if s.next_hold_fx_ms <= 0:
-            s.next_hold_fx_ms = now_tick + int(hold_fx_interval_ms)
-            continue
-        while now_tick >= s.next_hold_fx_ms and float(t) < float(n.t_end):
-            ln = lines[n.line_id]
-            lx, ly, lr, la01, sc_now, la_raw = eval_line_state(ln, float(t))
-            x, y = note_world_pos(lx, ly, lr, sc_now, n, sc_now, for_tail=False)
-            g = str(getattr(s, "hold_grade", None) or "PERFECT").upper()
-            c = respack.judge_colors.get(g, respack.judge_colors.get("PERFECT", (255, 255, 255, 255)))
-            if getattr(n, "tint_hitfx_rgb", None) is not None:
-                try:
-                    rr, gg, bb = n.tint_hitfx_rgb
-                    c = (int(rr), int(gg), int(bb), 255)
-                except Exception:
-                    pass
-            var = "good" if g == "GOOD" else ""
-            hitfx.append(HitFX_cls(x, y, float(t), c, lr, var))
-            if not respack.hide_particles:
-                particles.append(
-                    ParticleBurst_cls(x, y, int(float(t) * 1000.0), int(respack.hitfx_duration * 1000), c)
-                )
-            mark_line_hit_cb(n.line_id, int(float(t) * 1000.0))
-            s.next_hold_fx_ms += int(hold_fx_interval_ms)
+        if maintain and s.holding and not s.judged:
+            try:
+                _maintain_hold(s, t, hold_tail_tol, pointers, judge, line_state, half_w, half_h)
+            except Exception:
+                pass
+        if not s.hold_finalized:
+            _finalize_hold(s, t, hold_tail_tol, miss_window, judge, push_hit_debug_cb)
+        if respack and s.holding and not s.judged:
+            _tick_hold_fx(
+                s, t, now_tick, hold_fx_interval_ms, respack, hitfx, particles,
+                HitFX_cls, ParticleBurst_cls, mark_line_hit_cb, line_state,
+            )
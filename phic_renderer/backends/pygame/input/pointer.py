@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
@@ -102,22 +103,19 @@ class PointerManager:
     def _update_move(self, st: _PointerState, x: Optional[float], y: Optional[float]):
         if x is None or y is None:
             return
-        try:
-            if st._last_x is not None and st._last_y is not None:
-                dx = float(x) - float(st._last_x)
-                dy = float(y) - float(st._last_y)
-                st.moved_px += float((dx * dx + dy * dy) ** 0.5)
-        except Exception:
-            pass
-        try:
-            if st.start_y is not None:
-                st.moved_y = max(float(st.moved_y), abs(float(y) - float(st.start_y)))
-        except Exception:
-            pass
-        st._last_x = float(x)
-        st._last_y = float(y)
-        st.x = float(x)
-        st.y = float(y)
+        x = float(x)
+        y = float(y)
+        if st._last_x is not None and st._last_y is not None:
+            # Path length only feeds the debug overlay; flicks are decided on moved_y.
+            st.moved_px += math.hypot(x - st._last_x, y - st._last_y)
+        if st.start_y is not None:
+            dy0 = abs(y - st.start_y)
+            if dy0 > st.moved_y:
+                st.moved_y = dy0
+        st._last_x = x
+        st._last_y = y
+        st.x = x
+        st.y = y
 
     def sim_down(self, pointer_id: int, x: Optional[float], y: Optional[float]) -> None:
         st = self._get(int(pointer_id))
@@ -0,0 +1,119 @@
+"""
+Glyph atlas for per-frame debug/status text.
+
+Rasterizes printable ASCII once per (font, color) into a single surface so that
+strings which change every frame (timers, FPS) can be drawn as a sequence of
+sub-rect blits instead of a full FreeType render + surface allocation.
+"""
+
+import pygame
+from typing import Dict, List, Tuple
+
+_FIRST = 32
+_LAST = 126
+
+
+class GlyphAtlas:
+    """
+    Pre-rendered printable-ASCII glyph strip for one font and color.
+
+    Glyph advances are the widths of the individually rendered characters, so
+    kerning pairs are not applied; this is meant for status lines, not titles.
+    """
+
+    def __init__(self, font: pygame.font.Font, color: Tuple[int, int, int]):
+        """
+        Build the atlas surface.
+
+        Args:
+            font: Font to rasterize
+            color: Text color (glyphs are antialiased against transparency)
+        """
+        glyphs = [font.render(chr(c), True, color) for c in range(_FIRST, _LAST + 1)]
+        total_w = sum(g.get_width() for g in glyphs)
+        height = max(g.get_height() for g in glyphs)
+
+        self.height = height
+        self.surface = pygame.Surface((max(1, total_w), max(1, height)), pygame.SRCALPHA)
+        self.rects: Dict[str, pygame.Rect] = {}
+        self.advance: Dict[str, int] = {}
+
+        x = 0
+        for c, g in zip(range(_FIRST, _LAST + 1), glyphs):
+            w = g.get_width()
+            self.surface.blit(g, (x, 0))
+            ch = chr(c)
+            self.rects[ch] = pygame.Rect(x, 0, w, g.get_height())
+            self.advance[ch] = w
+            x += w
+
+    def can_draw(self, text: str) -> bool:
+        """Return True if every character of text is in the atlas."""
+        return text.isascii() and text.isprintable()
+
+    def width(self, text: str) -> int:
+        """Advance width of text in pixels (text must satisfy can_draw)."""
+        advance = self.advance
+        return sum(advance[ch] for ch in text)
+
+    def layout(self, text: str, x: int, y: int, out: List[Tuple]) -> int:
+        """
+        Append (atlas, dest, area) blit tuples for text to out.
+
+        Args:
+            text: String to draw (must satisfy can_draw)
+            x: Left edge in destination pixels
+            y: Top edge in destination pixels
+            out: Blit sequence for Surface.blits
+
+        Returns:
+            Total advance width in pixels
+        """
+        surf = self.surface
+        rects = self.rects
+        advance = self.advance
+        x0 = x
+        for ch in text:
+            if ch != " ":
+                out.append((surf, (x, y), rects[ch]))
+            x += advance[ch]
+        return x - x0
+
+
+_ATLASES: Dict[Tuple[int, Tuple[int, int, int]], Tuple[pygame.font.Font, GlyphAtlas]] = {}
+
+
+def get_glyph_atlas(font: pygame.font.Font, color: Tuple[int, int, int]) -> GlyphAtlas:
+    """Get (building on first use) the glyph atlas for a font and color."""
+    key = (id(font), tuple(color))
+    ent = _ATLASES.get(key)
+    if ent is None:
+        # Keep the font referenced so its id() cannot be reused by another font.
+        ent = (font, GlyphAtlas(font, color))
+        _ATLASES[key] = ent
+    return ent[1]
+
+
+def reset_glyph_atlases() -> None:
+    """Drop all atlases and the fonts they keep alive (call at the start of a run)."""
+    _ATLASES.clear()
+
+
+def draw_text(
+    out: List[Tuple],
+    font: pygame.font.Font,
+    text: str,
+    x: int,
+    y: int,
+    color: Tuple[int, int, int],
+) -> None:
+    """
+    Append blits for text at (x, y) to out, using the glyph atlas when possible.
+
+    Falls back to a regular font.render for characters outside printable ASCII.
+    """
+    atlas = get_glyph_atlas(font, color)
+    if atlas.can_draw(text):
+        atlas.layout(text, x, y, out)
+    else:
+        out.append((font.render(text, True, color), (x, y)))
@@ -186,6 +186,66 @@ class SurfacePool:
         self.stats_evicted = 0
 
 
+class SurfaceRing:
+    """
+    Small fixed ring of same-size surfaces for buffers redrawn every frame.
+
+    Unlike the pool, surfaces are never cleared or handed out elsewhere; the
+    caller must fully overwrite each one and must not release it to a pool.
+    A surface stays valid until ``len(ring)`` further calls to ``next``.
+    """
+
+    def __init__(self, count: int = 3, flags: int = pygame.SRCALPHA):
+        """
+        Initialize the ring.
+
+        Args:
+            count: Number of surfaces in the ring
+            flags: Pygame surface flags (default: SRCALPHA)
+        """
+        self.count = max(1, int(count))
+        self.flags = flags
+        self._size: Tuple[int, int] = (0, 0)
+        self._surfaces: List[pygame.Surface] = []
+        self._i = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def ensure(self, count: int) -> None:
+        """Grow the ring to at least count surfaces."""
+        if int(count) > self.count:
+            self.count = int(count)
+
+    def next(self, width: int, height: int) -> pygame.Surface:
+        """
+        Get the next surface in the ring, reallocating on a size change.
+
+        Args:
+            width: Surface width
+            height: Surface height
+
+        Returns:
+            A pygame.Surface with stale contents from an earlier frame
+        """
+        size = (int(width), int(height))
+        if size != self._size:
+            self._size = size
+            self._surfaces = []
+            self._i = 0
+        if len(self._surfaces) < self.count:
+            # Insert in front of the least recently used surface so growing the
+            # ring mid-stream (ensure) never hands a just-used surface out again.
+            j = self._i % len(self._surfaces) if self._surfaces else 0
+            surface = pygame.Surface(size, self.flags)
+            self._surfaces.insert(j, surface)
+            self._i = j + 1
+            return surface
+        surface = self._surfaces[self._i % len(self._surfaces)]
+        self._i += 1
+        return surface
+
+
 # Global surface pool instance
 _global_pool: SurfacePool = None
 
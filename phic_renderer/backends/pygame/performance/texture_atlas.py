@@ -244,8 +244,82 @@ class TextureAtlas:
         }
 
 
+class SpriteAtlas:
+    """
+    Multi-page atlas of already-transformed sprites, filled on demand.
+
+    Scaled and rotated note sprites are packed into a few large pages the first
+    time they are needed, so later frames can draw them as (page, dest, area)
+    entries of a single Surface.blits call without copying each sprite.
+    """
+
+    def __init__(self, page_size: int = 1024, max_pages: int = 4):
+        """
+        Initialize the sprite atlas.
+
+        Args:
+            page_size: Width and height of each page
+            max_pages: Pages kept before the atlas is flushed and refilled
+        """
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.pages: List[TextureAtlas] = []
+        self.entries: Dict[Tuple, Tuple[pygame.Surface, pygame.Rect]] = {}
+
+    def get(self, key: Tuple) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Look up a packed sprite.
+
+        Args:
+            key: Caller-defined sprite key
+
+        Returns:
+            (page surface, source rect) or None if not packed
+        """
+        return self.entries.get(key)
+
+    def put(self, key: Tuple, surface: pygame.Surface) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Pack a sprite into the current page, opening a new page when full.
+
+        Args:
+            key: Caller-defined sprite key
+            surface: Sprite to copy into the atlas
+
+        Returns:
+            (page surface, source rect), or None if the sprite is larger than a page
+        """
+        w, h = surface.get_size()
+        if w > self.page_size or h > self.page_size:
+            return None
+
+        page = self.pages[-1] if self.pages else None
+        pos = page._pack_rect(w, h) if page is not None else None
+        if pos is None:
+            if len(self.pages) >= self.max_pages:
+                self.clear()
+            page = TextureAtlas(max_size=self.page_size)
+            page.atlas_surface = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA)
+            self.pages.append(page)
+            pos = page._pack_rect(w, h)
+            if pos is None:
+                return None
+
+        # The packed region is still fully transparent, so MAX copies the sprite exactly.
+        page.atlas_surface.blit(surface, pos, special_flags=pygame.BLEND_RGBA_MAX)
+        ent = (page.atlas_surface, pygame.Rect(pos[0], pos[1], w, h))
+        self.entries[key] = ent
+        return ent
+
+    def clear(self) -> None:
+        """Drop all pages and entries."""
+        self.pages.clear()
+        self.entries.clear()
+
+
 # Global texture atlas instance
 _global_atlas: Optional[TextureAtlas] = None
+_global_sprite_atlas: Optional[SpriteAtlas] = None
 _global_texture_map: Dict[str, List[str]] = {}
 
 
@@ -288,3 +362,24 @@ def reset_global_atlas() -> None:
     global _global_atlas, _global_texture_map
     _global_atlas = None
     _global_texture_map = {}
+
+
+def get_global_sprite_atlas() -> SpriteAtlas:
+    """
+    Get the global sprite atlas instance.
+
+    Returns:
+        The global SpriteAtlas instance
+    """
+    global _global_sprite_atlas
+    if _global_sprite_atlas is None:
+        _global_sprite_atlas = SpriteAtlas()
+    return _global_sprite_atlas
+
+
+def reset_global_sprite_atlas() -> None:
+    """Reset the global sprite atlas (sprite keys use id() of respack images)."""
+    global _global_sprite_atlas
+    if _global_sprite_atlas is not None:
+        _global_sprite_atlas.clear()
+    _global_sprite_atlas = None
@@ -34,6 +34,10 @@ class TransformCache:
         # Persistent cache (LRU across frames)
         self._persistent_cache: OrderedDict[Tuple, pygame.Surface] = OrderedDict()
 
+        # Fully tinted/alpha'd note sprites (LRU across frames, returned uncopied)
+        self.max_final = 512
+        self._final_cache: OrderedDict[Tuple, pygame.Surface] = OrderedDict()
+
         # Statistics
         self.stats_frame_hits = 0
         self.stats_persistent_hits = 0
@@ -285,6 +289,80 @@ class TransformCache:
 
         self._persistent_cache[key] = result.copy()
 
+    @staticmethod
+    def quantize_tint(rgb: Tuple[int, int, int], alpha: int) -> Tuple[Tuple[int, int, int], int]:
+        """
+        Quantize a tint color and alpha to steps of 8 for get_final/put_final.
+
+        0 and 255 are kept exact, so untinted and opaque sprites are unchanged.
+
+        Args:
+            rgb: Tint color
+            alpha: Surface alpha (0-255)
+
+        Returns:
+            (quantized rgb, quantized alpha); draw with these values so the cached
+            surface matches its key
+        """
+        r, g, b = rgb
+        return (
+            (min(255, (int(r) + 4) & ~7), min(255, (int(g) + 4) & ~7), min(255, (int(b) + 4) & ~7)),
+            min(255, (int(alpha) + 4) & ~7),
+        )
+
+    def get_final(
+        self,
+        surface_id: Tuple,
+        angle: float,
+        tint: Optional[Tuple[int, int, int]],
+        alpha: int,
+    ) -> Optional[pygame.Surface]:
+        """
+        Get a cached scaled, rotated, tinted and alpha'd surface if available.
+
+        The surface is shared, not copied: callers must only blit it.
+
+        Args:
+            surface_id: Identifier of the scaled source (image id and target size)
+            angle: Rotation angle in degrees
+            tint: Quantized tint color, or None if untinted
+            alpha: Quantized surface alpha
+
+        Returns:
+            Cached surface if found, None otherwise
+        """
+        key = (surface_id, self._quantize_angle(angle), tint, int(alpha))
+        result = self._final_cache.get(key)
+        if result is None:
+            self.stats_misses += 1
+            return None
+        self._final_cache.move_to_end(key)
+        self.stats_persistent_hits += 1
+        return result
+
+    def put_final(
+        self,
+        surface_id: Tuple,
+        angle: float,
+        tint: Optional[Tuple[int, int, int]],
+        alpha: int,
+        result: pygame.Surface,
+    ) -> None:
+        """
+        Add a final sprite surface to the cache.
+
+        Args:
+            surface_id: Identifier of the scaled source (image id and target size)
+            angle: Rotation angle in degrees
+            tint: Quantized tint color, or None if untinted
+            alpha: Quantized surface alpha
+            result: Surface to cache; it must not be modified afterwards
+        """
+        key = (surface_id, self._quantize_angle(angle), tint, int(alpha))
+        if len(self._final_cache) >= self.max_final:
+            self._final_cache.popitem(last=False)
+        self._final_cache[key] = result
+
     def next_frame(self) -> None:
         """
         Clear the per-frame cache.
@@ -294,9 +372,10 @@ class TransformCache:
         self._frame_cache.clear()
 
     def clear(self) -> None:
-        """Clear both caches."""
+        """Clear all caches."""
         self._frame_cache.clear()
         self._persistent_cache.clear()
+        self._final_cache.clear()
 
     def get_stats(self) -> Dict[str, any]:
         """
@@ -319,6 +398,7 @@ class TransformCache:
             'total_hit_rate': total_hit_rate,
             'frame_cache_size': len(self._frame_cache),
             'persistent_cache_size': len(self._persistent_cache),
+            'final_cache_size': len(self._final_cache),
         }
 
     def reset_stats(self) -> None:
@@ -1,9 +1,40 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+import sys
+from typing import Any, Dict, Optional
 
+import numpy as np
 import pygame
 
+# pygame.image.tostring is the deprecated name of tobytes (added in pygame 2.1.3).
+_tobytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+
+# Single-slot cache: the RGB24 buffer handed to write_frame_bytes, reused every frame.
+# Recorders consume it before returning, so one buffer is enough.
+_RGB: Dict[str, Any] = {"size": None, "buf": None, "arr": None}
+
+
+def _rgb_frame_bytes(surf: pygame.Surface) -> Any:
+    """RGB24 pixels of surf, copied into the reused buffer when surf is 32-bit."""
+    if surf.get_bytesize() != 4:
+        return _tobytes(surf, "RGB")
+    size = surf.get_size()
+    if _RGB["size"] != size:
+        w, h = size
+        _RGB["buf"] = bytearray(w * h * 3)
+        _RGB["arr"] = np.frombuffer(_RGB["buf"], dtype=np.uint8).reshape(h, w, 3)
+        _RGB["size"] = size
+    arr = _RGB["arr"]
+    h, w = arr.shape[:2]
+    # (H, W, 4) bytes over the surface's own memory; one strided copy per channel.
+    px = np.asarray(surf.get_view("2")).T.view(np.uint8).reshape(h, w, 4)
+    for c, shift in enumerate(surf.get_shifts()[:3]):
+        b = shift // 8 if sys.byteorder == "little" else 3 - shift // 8
+        arr[:, :, c] = px[:, :, b]
+    # Release the surface lock before the frame is drawn on again.
+    del px
+    return _RGB["buf"]
+
 
 def write_record_frame(
     *,
@@ -23,17 +54,19 @@ def write_record_frame(
     try:
         # Fast path: avoid numpy conversion+transpose (very expensive)
         if hasattr(recorder, "write_frame_bytes"):
-            frame_bytes = pygame.image.tostring(display_frame, "RGB")
-            recorder.write_frame_bytes(frame_bytes)
+            recorder.write_frame_bytes(_rgb_frame_bytes(display_frame))
             return None
 
-        # Fallback: Convert pygame surface to array3d and transpose to (H, W, 3).
-        frame_array = pygame.surfarray.array3d(display_frame)
+        # Fallback: hand the recorder a contiguous (H, W, 3) array. pixels3d is a view
+        # of the surface, so the transpose and the copy happen in one pass.
         try:
-            frame_array = frame_array.transpose(1, 0, 2)
+            px = pygame.surfarray.pixels3d(display_frame)
         except Exception:
-            # As a very safe fallback, keep original (may be wrong orientation but avoids hard crash)
-            pass
+            # Formats pixels3d cannot map (e.g. 8/16-bit) still convert through a copy.
+            px = pygame.surfarray.array3d(display_frame)
+        frame_array = np.ascontiguousarray(px.swapaxes(0, 1))
+        # Release the surface lock before the frame is drawn on again.
+        del px
         recorder.write_frame(frame_array)
         return None
     except Exception as e:
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ....engine.note_table import NoteTable
+
+try:
+    from numba import njit  # type: ignore
+
+    _NUMBA_OK = True
+except Exception:  # pragma: no cover
+    njit = None  # type: ignore
+    _NUMBA_OK = False
+
+
+def _note_screen_xy(
+    lo, hi, t,
+    kind, t_hit, line_idx, x_local, y_offset, side, scroll_hit, scroll_end, speed_mul,
+    line_x, line_y, line_cos, line_sin, line_scroll,
+    flow_mul, use_speed_mul, keep_head,
+    overrender, cx, cy, inv_expand, do_expand,
+    head_x, head_y, tail_x, tail_y,
+):
+    """Screen-space head (and hold tail) positions for notes [lo, hi).
+
+    Mirrors render_frame: non-hold heads approach along the line normal; hold heads
+    stick to the line once t >= t_hit and the scroll has passed them, and tails
+    always scale by speed_mul. Output is scaled by overrender and the expand
+    transform, like apply_expand_xy.
+    """
+    for i in range(lo, hi):
+        j = i - lo
+        li = line_idx[i]
+        tx = line_cos[li]
+        ty = line_sin[li]
+        lx = line_x[li]
+        ly = line_y[li]
+        sc = line_scroll[li]
+        xl = x_local[i]
+        if kind[i] == 3:
+            target = scroll_hit[i]
+            if t >= t_hit[i] and sc > target:
+                target = sc
+            dy = (target - sc) * flow_mul
+            if keep_head and dy < 0.0:
+                dy = 0.0
+            y_local = side[i] * dy + y_offset[i]
+            hx = (lx + tx * xl - ty * y_local) * overrender
+            hy = (ly + ty * xl + tx * y_local) * overrender
+            dy = (scroll_end[i] - sc) * flow_mul
+            y_local = side[i] * dy * speed_mul[i] + y_offset[i]
+            ex = (lx + tx * xl - ty * y_local) * overrender
+            ey = (ly + ty * xl + tx * y_local) * overrender
+        else:
+            dy = (scroll_hit[i] - sc) * flow_mul
+            if use_speed_mul:
+                dy *= speed_mul[i]
+            y_local = side[i] * dy + y_offset[i]
+            hx = (lx + tx * xl - ty * y_local) * overrender
+            hy = (ly + ty * xl + tx * y_local) * overrender
+            ex = hx
+            ey = hy
+        if do_expand:
+            hx = cx + (hx - cx) * inv_expand
+            hy = cy + (hy - cy) * inv_expand
+            ex = cx + (ex - cx) * inv_expand
+            ey = cy + (ey - cy) * inv_expand
+        head_x[j] = hx
+        head_y[j] = hy
+        tail_x[j] = ex
+        tail_y[j] = ey
+
+
+_note_screen_xy_impl = njit(cache=True, fastmath=True)(_note_screen_xy) if _NUMBA_OK else None
+
+
+class LineFrame(NamedTuple):
+    """Judge line states at one draw time as parallel arrays indexed by line id."""
+
+    x: np.ndarray
+    y: np.ndarray
+    rot: np.ndarray
+    alpha01: np.ndarray
+    scroll: np.ndarray
+    alpha_raw: np.ndarray
+    cos: np.ndarray
+    sin: np.ndarray
+
+
+def build_line_frame(line_states: Sequence[Tuple[float, float, float, float, float, float]]) -> LineFrame:
+    """Pack eval_line_state results into a LineFrame; rotation trig is one ufunc pass."""
+    ls = np.asarray(line_states, dtype=np.float64).reshape(-1, 6)
+    rot = ls[:, 2]
+    return LineFrame(
+        x=ls[:, 0],
+        y=ls[:, 1],
+        rot=rot,
+        alpha01=ls[:, 3],
+        scroll=ls[:, 4],
+        alpha_raw=ls[:, 5],
+        cos=np.cos(rot),
+        sin=np.sin(rot),
+    )
+
+
+def line_note_alpha_mul(lf: LineFrame, mode: str) -> np.ndarray:
+    """Per-line multiplier applied to note alpha for line_alpha_affects_notes.
+
+    "negative_only" (default) fades notes on lines with negative alpha by 1 + alpha,
+    "always" additionally scales notes on visible lines by the line alpha, and
+    "never" leaves notes alone.
+    """
+    la = lf.alpha01
+    mul = np.ones_like(la)
+    if mode != "never":
+        mul = np.where(la < 0.0, np.clip(1.0 + la, 0.0, 1.0), mul)
+    if mode == "always":
+        mul = np.where(la >= 0.0, np.clip(la, 0.0, 1.0), mul)
+    return mul
+
+
+class NoteScreenXY(NamedTuple):
+    """Screen-space positions (float32) for a note window; row j is note lo + j."""
+
+    head_x: np.ndarray
+    head_y: np.ndarray
+    tail_x: np.ndarray
+    tail_y: np.ndarray
+
+
+def note_screen_positions(
+    tab: NoteTable,
+    lo: int,
+    hi: int,
+    lf: LineFrame,
+    t: float,
+    flow_mul: float,
+    use_speed_mul: bool,
+    keep_head: bool,
+    overrender: float,
+    RW: int,
+    RH: int,
+    expand: float,
+) -> Optional[NoteScreenXY]:
+    """
+    Screen-space head/tail positions for notes [lo, hi) in one pass.
+
+    Hold heads assume the note has not been hit early and that the respack does
+    not pin hit heads to the line; the caller recomputes those few in Python.
+    Uses the numba kernel when available, otherwise the same math in Python.
+    Returns None for an empty window or out-of-range line ids, in which case the
+    caller falls back to per-note math.
+
+    The math runs in float64 (scroll distances are differences of large integrals)
+    and only the screen-space results are stored as float32.
+    """
+    n_lines = len(lf.x)
+    if hi <= lo or n_lines == 0:
+        return None
+    li_win = tab.line_id[lo:hi]
+    if int(li_win.min()) < 0 or int(li_win.max()) >= n_lines:
+        return None
+
+    do_expand = not (expand is None or float(expand) <= 1.000001)
+    inv_expand = (1.0 / float(expand)) if do_expand else 1.0
+    cx = int(RW) * 0.5
+    cy = int(RH) * 0.5
+    ov = float(overrender)
+
+    if _note_screen_xy_impl is not None:
+        out = NoteScreenXY(
+            head_x=np.empty(hi - lo, dtype=np.float32),
+            head_y=np.empty(hi - lo, dtype=np.float32),
+            tail_x=np.empty(hi - lo, dtype=np.float32),
+            tail_y=np.empty(hi - lo, dtype=np.float32),
+        )
+        _note_screen_xy_impl(
+            int(lo), int(hi), float(t),
+            tab.kind, tab.t_hit, tab.line_id, tab.x_local, tab.y_offset, tab.side,
+            tab.scroll_hit, tab.scroll_end, tab.speed_mul,
+            lf.x, lf.y, lf.cos, lf.sin, lf.scroll,
+            float(flow_mul), bool(use_speed_mul), bool(keep_head),
+            ov, cx, cy, inv_expand, do_expand,
+            out.head_x, out.head_y, out.tail_x, out.tail_y,
+        )
+        return out
+
+    li = li_win
+    tx = lf.cos[li]
+    ty = lf.sin[li]
+    lx = lf.x[li]
+    ly = lf.y[li]
+    sc = lf.scroll[li]
+    xl = tab.x_local[lo:hi]
+    side = tab.side[lo:hi]
+    y_off = tab.y_offset[lo:hi]
+    speed = tab.speed_mul[lo:hi]
+    sh = tab.scroll_hit[lo:hi]
+    is_hold = tab.kind[lo:hi] == 3
+
+    target = np.where(is_hold & (tab.t_hit[lo:hi] <= float(t)) & (sc > sh), sc, sh)
+    dy = (target - sc) * float(flow_mul)
+    if keep_head:
+        dy = np.where(is_hold & (dy < 0.0), 0.0, dy)
+    if use_speed_mul:
+        dy = np.where(is_hold, dy, dy * speed)
+    y_local = side * dy + y_off
+    hx = (lx + tx * xl - ty * y_local) * ov
+    hy = (ly + ty * xl + tx * y_local) * ov
+
+    y_local = side * ((tab.scroll_end[lo:hi] - sc) * float(flow_mul)) * speed + y_off
+    ex = np.where(is_hold, (lx + tx * xl - ty * y_local) * ov, hx)
+    ey = np.where(is_hold, (ly + ty * xl + tx * y_local) * ov, hy)
+    if do_expand:
+        hx = cx + (hx - cx) * inv_expand
+        hy = cy + (hy - cy) * inv_expand
+        ex = cx + (ex - cx) * inv_expand
+        ey = cy + (ey - cy) * inv_expand
+    return NoteScreenXY(
+        head_x=hx.astype(np.float32),
+        head_y=hy.astype(np.float32),
+        tail_x=ex.astype(np.float32),
+        tail_y=ey.astype(np.float32),
+    )
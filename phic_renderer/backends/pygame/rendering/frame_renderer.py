@@ -2,20 +2,108 @@ from __future__ import annotations
 
 import math
 import os
-from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pygame
 
-from ....core.fx import prune_hitfx
-from ....math.util import apply_expand_xy, clamp, rect_corners
+from ....core.fx import prune_hitfx_inplace
+from ....core.render_args import render_args
+from ....engine.note_table import note_table_for, retired_mask, visible_bounds
+from ....math.util import clamp, make_expand_xy, rect_corners
 from ....runtime.kinematics import eval_line_state, note_world_pos
 from ....types import NoteState, RuntimeLine
+from ._note_math import build_line_frame, line_note_alpha_mul, note_screen_positions
 from .draw import draw_line_rgba, draw_poly_outline_rgba, draw_poly_rgba
 from ..effects.hitfx import draw_hitfx
 from ..hold.render import draw_hold_3slice
+from ..performance.glyph_atlas import get_glyph_atlas
+from ..resources.pixel_format import to_frame_format
 from ..utils.rendering import pick_note_image
 
 
+# Note sprites are rotated in 0.5 degree steps so animated lines reuse cached rotations.
+_NOTE_ANGLE_STEPS_PER_DEG = 2.0
+_RAD_TO_NOTE_STEPS = _NOTE_ANGLE_STEPS_PER_DEG * 180.0 / math.pi
+
+
+def _note_angle_deg(rot: float) -> float:
+    """Sprite rotation in degrees for a line rotation in radians, snapped to a bucket."""
+    return round(-float(rot) * _RAD_TO_NOTE_STEPS) / _NOTE_ANGLE_STEPS_PER_DEG
+
+
+# Rendered line text keyed by (font, text, alpha); text lines are usually static,
+# so most frames reuse the surface instead of calling Font.render again.
+_LINE_TEXT_CACHE: "OrderedDict[Tuple[int, str, int], pygame.Surface]" = OrderedDict()
+_LINE_TEXT_CACHE_MAX = 256
+
+
+def _render_line_text(font: Any, text: str, alpha8: int) -> pygame.Surface:
+    """White line text at the given alpha, from a small LRU of rendered strings."""
+    key = (id(font), text, int(alpha8))
+    surf = _LINE_TEXT_CACHE.get(key)
+    if surf is not None:
+        _LINE_TEXT_CACHE.move_to_end(key)
+        return surf
+    surf = font.render(text, True, (255, 255, 255))
+    try:
+        surf.set_alpha(int(alpha8))
+    except Exception:
+        pass
+    _LINE_TEXT_CACHE[key] = surf
+    if len(_LINE_TEXT_CACHE) > _LINE_TEXT_CACHE_MAX:
+        _LINE_TEXT_CACHE.popitem(last=False)
+    return surf
+
+
+def _hold_endpoints(
+    lx: float,
+    ly: float,
+    tx: float,
+    ty: float,
+    sc_now: float,
+    head_scroll: float,
+    scroll_end: float,
+    side: float,
+    x_local: float,
+    y_offset: float,
+    speed_mul: float,
+    flow_mul: float,
+    keep_head: bool,
+    overrender: float,
+    expand_xy: Callable[[float, float], Tuple[float, float]],
+) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+    """Screen-space hold head and tail for a head scroll chosen by the caller."""
+    dy = (head_scroll - sc_now) * flow_mul
+    if keep_head and dy < 0.0:
+        dy = 0.0
+    y_local = side * dy + y_offset
+    head_s = expand_xy((lx + tx * x_local - ty * y_local) * overrender, (ly + ty * x_local + tx * y_local) * overrender)
+    y_local = side * ((scroll_end - sc_now) * flow_mul) * speed_mul + y_offset
+    tail_s = expand_xy((lx + tx * x_local - ty * y_local) * overrender, (ly + ty * x_local + tx * y_local) * overrender)
+    return head_s, tail_s
+
+
+def _queue_centered_text(
+    out: List[Tuple], font: Any, text: str, cx: float, top: float, color: Tuple[int, int, int]
+) -> None:
+    """Queue text horizontally centered on cx; per-frame strings go through the glyph atlas."""
+    atlas = get_glyph_atlas(font, color)
+    if atlas.can_draw(text):
+        atlas.layout(text, int(cx - atlas.width(text) / 2), int(top), out)
+    else:
+        surf = font.render(text, True, color)
+        out.append((surf, (int(cx - surf.get_width() / 2), int(top))))
+
+
+def _flush_blits(dst: pygame.Surface, blit_list: List[Tuple]) -> None:
+    """Submit pending (surface, dest[, area]) blits in one call, keeping draw order."""
+    if blit_list:
+        dst.blits(blit_list, doreturn=False)
+        blit_list.clear()
+
+
 def render_frame(
     *,
     t_draw: float,
@@ -31,9 +119,9 @@ def render_frame(
     transform_cache: Any,
     bg_blurred: Optional[pygame.Surface],
     bg_dim_alpha: Optional[int],
-    bg_scaled_cache_key: Optional[Tuple[int, int, int]],
+    bg_scaled_cache_key: Optional[Tuple[int, int, int, int]],
     bg_scaled_cache: Optional[pygame.Surface],
-    dim_surf_cache_key: Optional[Tuple[int, int, int]],
+    dim_surf_cache_key: Optional[Tuple[int, int]],
     dim_surf_cache: Optional[pygame.Surface],
     lines: List[RuntimeLine],
     states: List[NoteState],
@@ -48,7 +136,7 @@ def render_frame(
     dot_r: int,
     line_len: int,
     chart_dir: str,
-    line_tex_cache: Dict[str, pygame.Surface],
+    line_tex_cache: Dict[str, Optional[pygame.Surface]],
     small: Any,
     note_dbg_cache: Dict[str, pygame.Surface],
     last_debug_ms: int,
@@ -58,45 +146,83 @@ def render_frame(
     bad_ghosts: List[Dict[str, Any]],
     MISS_FADE_SEC: float,
     BAD_GHOST_SEC: float,
+    sprite_atlas: Any = None,
+    frame_ring: Any = None,
+    overlay_ring: Any = None,
 ) -> Tuple[
     pygame.Surface,
     List[Tuple[int, pygame.Surface, float, float]],
     int,
     int,
-    Optional[Tuple[int, int, int]],
+    Optional[Tuple[int, int, int, int]],
     Optional[pygame.Surface],
-    Optional[Tuple[int, int, int]],
+    Optional[Tuple[int, int]],
     Optional[pygame.Surface],
 ]:
-    base = surface_pool.get(int(RW), int(RH), pygame.SRCALPHA)
+    # Ring surfaces are not cleared; an opaque background blit or the fill below covers every pixel.
+    if frame_ring is not None:
+        base = frame_ring.next(int(RW), int(RH))
+    else:
+        base = surface_pool.get(int(RW), int(RH), pygame.SRCALPHA)
+    dim = bg_dim_alpha if (bg_dim_alpha is not None) else clamp(getattr(args, "bg_dim", 120), 0, 255)
+    dim_baked = False
     if bg_blurred:
-        key = (id(bg_blurred), int(RW), int(RH))
+        # An opaque background gets the dim layer baked into its cached scaled copy,
+        # leaving one full-screen blit per frame. Dim is fixed per chart/segment.
+        bake_dim = int(dim) if (dim > 0 and not (bg_blurred.get_flags() & pygame.SRCALPHA)) else 0
+        key = (id(bg_blurred), int(RW), int(RH), bake_dim)
         if bg_scaled_cache is None or bg_scaled_cache_key != key:
-            bg_scaled_cache = pygame.transform.smoothscale(bg_blurred, (int(RW), int(RH)))
+            src_w, src_h = bg_blurred.get_size()
+            if (src_w, src_h) == (int(RW), int(RH)):
+                bg_scaled_cache = bg_blurred.copy() if bake_dim else bg_blurred
+            elif abs(float(RW) / max(1, src_w) - 1.0) < 0.1 and abs(float(RH) / max(1, src_h) - 1.0) < 0.1:
+                # Near 1:1 the source is already blurred; a plain resample is indistinguishable.
+                bg_scaled_cache = pygame.transform.scale(bg_blurred, (int(RW), int(RH)))
+            else:
+                bg_scaled_cache = pygame.transform.smoothscale(bg_blurred, (int(RW), int(RH)))
+            if bake_dim:
+                dim_layer = pygame.Surface((int(RW), int(RH)))
+                dim_layer.fill((0, 0, 0))
+                dim_layer.set_alpha(bake_dim)
+                bg_scaled_cache.blit(dim_layer, (0, 0))
             bg_scaled_cache_key = key
+        dim_baked = bake_dim > 0
+        if frame_ring is not None and (bg_scaled_cache.get_flags() & pygame.SRCALPHA):
+            base.fill((0, 0, 0, 0))
         base.blit(bg_scaled_cache, (0, 0))
     else:
         base.fill((10, 10, 14))
 
-    dim = bg_dim_alpha if (bg_dim_alpha is not None) else clamp(getattr(args, "bg_dim", 120), 0, 255)
-    if dim > 0:
-        dkey = (int(RW), int(RH), int(dim))
+    if dim > 0 and not dim_baked:
+        # One opaque black surface per size; the dim level is applied as surface alpha,
+        # so changing it never refills RW*RH pixels.
+        dkey = (int(RW), int(RH))
         if dim_surf_cache is None or dim_surf_cache_key != dkey:
-            dim_surf_cache = pygame.Surface((int(RW), int(RH)), pygame.SRCALPHA)
-            dim_surf_cache.fill((0, 0, 0, int(dim)))
+            dim_surf_cache = pygame.Surface(dkey)
+            dim_surf_cache.fill((0, 0, 0))
             dim_surf_cache_key = dkey
+        dim_surf_cache.set_alpha(int(dim))
         base.blit(dim_surf_cache, (0, 0))
 
-    overlay = surface_pool.get(int(RW), int(RH), pygame.SRCALPHA)
+    if overlay_ring is not None:
+        # The overlay is fully composited onto base before returning, so a single
+        # persistent surface is enough; it only needs clearing.
+        overlay = overlay_ring.next(int(RW), int(RH))
+        overlay.fill((0, 0, 0, 0))
+    else:
+        overlay = surface_pool.get(int(RW), int(RH), pygame.SRCALPHA)
+    # Consecutive sprite blits onto overlay are queued here and flushed before any
+    # primitive draw call (lines, polygons, holds) so the paint order is unchanged.
+    blit_list: List[Tuple] = []
 
-    line_text_draw_calls: List[Tuple[int, pygame.Surface, float, float]] = []
+    # Line labels bucketed by priority (last hit ms), flattened in order on return.
+    line_text_by_prio: Dict[int, List[Tuple[int, pygame.Surface, float, float]]] = {}
 
-    line_states: List[Tuple[float, float, float, float, float, float]] = []
-    line_trig: List[Tuple[float, float]] = []
-    for ln in lines:
-        lx, ly, lr, la01, sc, la_raw = eval_line_state(ln, float(t_draw))
-        line_states.append((lx, ly, lr, la01, sc, la_raw))
-        line_trig.append((math.cos(lr), math.sin(lr)))
+    # Line curves are evaluated per line; everything derived from them is done on the
+    # packed arrays. The tuple lists stay for the per-note Python path.
+    line_states = [eval_line_state(ln, float(t_draw)) for ln in lines]
+    lf = build_line_frame(line_states)
+    line_trig = list(zip(lf.cos.tolist(), lf.sin.tolist()))
 
     try:
         flow_mul = float(getattr(state_mod, "note_flow_speed_multiplier", 1.0) or 1.0)
@@ -105,8 +231,18 @@ def render_frame(
     hold_keep_head = bool(state_mod.respack and getattr(state_mod.respack, "hold_keep_head", False))
     speed_mul_affects_travel = bool(getattr(state_mod, "note_speed_mul_affects_travel", False))
 
+    # Per-frame invariants read inside the line and note loops.
+    expand_xy = make_expand_xy(int(RW), int(RH), float(expand))
+    linesize = int(small.get_linesize())
+    ra = render_args(args)
+    debug_line_label = ra.debug_line_label
+    basic_debug = ra.basic_debug
+    no_note_outline = ra.no_note_outline
+    debug_note_info = ra.debug_note_info
+    line_alpha_mode = ra.line_alpha_affects_notes
+
     # Draw judge lines
-    for ln, (lx, ly, lr, la01, _sc, _la_raw) in zip(lines, line_states):
+    for ln, (lx, ly, lr, la01, _sc, _la_raw), (tx, ty) in zip(lines, line_states, line_trig):
         try:
             seq_st = getattr(ln, "advance_seq_start_at", None)
             seq_en = getattr(ln, "advance_seq_end_at", None)
@@ -118,39 +254,38 @@ def render_frame(
         if la01 <= 1e-6:
             continue
 
-        if getattr(ln, "text", None) is not None:
+        alpha8 = int(255 * la01)
+        # Blits at alpha 0 are no-ops, so text below 1/255 is not even evaluated.
+        if alpha8 > 0 and getattr(ln, "text", None) is not None:
             try:
                 s = str(ln.text.eval(float(t_draw)) if hasattr(ln.text, "eval") else "")
             except Exception:
                 s = ""
-            rr, gg, bb = (255, 255, 255)
-            surf_lines = s.split("\n")
             y_off = 0
-            for part in surf_lines:
-                if not part:
-                    y_off += int(small.get_linesize())
-                    continue
-                txt = small.render(part, True, (int(rr), int(gg), int(bb)))
-                try:
-                    txt.set_alpha(int(255 * la01))
-                except Exception:
-                    pass
-                overlay.blit(txt, (int(lx * overrender), int((ly + y_off) * overrender)))
-                y_off += int(small.get_linesize())
+            for part in s.split("\n"):
+                if part:
+                    txt = _render_line_text(small, part, alpha8)
+                    blit_list.append((txt, (int(lx * overrender), int((ly + y_off) * overrender))))
+                y_off += linesize
 
         if getattr(ln, "texture_path", None):
             fp = str(getattr(ln, "texture_path"))
             if not os.path.isabs(fp):
                 fp = os.path.join(chart_dir, fp)
-            img = None
-            if os.path.exists(fp):
-                img = line_tex_cache.get(fp)
-                if img is None:
+            # Missing or unreadable textures are cached as None, so the file system is
+            # only touched once per path.
+            if fp in line_tex_cache:
+                img = line_tex_cache[fp]
+            else:
+                img = None
+                if os.path.exists(fp):
                     try:
-                        img = pygame.image.load(fp).convert_alpha()
-                        line_tex_cache[fp] = img
+                        img = to_frame_format(pygame.image.load(fp))
                     except Exception:
                         img = None
+                line_tex_cache[fp] = img
+            if img is not None and alpha8 <= 0:
+                continue
             if img is not None:
                 try:
                     ax, ay = getattr(ln, "anchor", (0.5, 0.5))
@@ -181,23 +316,25 @@ def render_frame(
                     scaled = pygame.transform.smoothscale(img, (target_w, target_h))
                     transform_cache.put_scaled(img, target_w, target_h, img_id, scaled)
 
-                # Cache rotation operation
+                # Cache rotation operation. get_scaled returns a fresh copy, so key the
+                # rotation on the source image and size (as notes do), not id(scaled).
                 angle_deg = -float(lr) * 180.0 / math.pi
-                scaled_id = id(scaled)
-                rotated = transform_cache.get_rotated(scaled, angle_deg, scaled_id)
+                scaled_key_id = (int(img_id), int(target_w), int(target_h))
+                rotated = transform_cache.get_rotated(scaled, angle_deg, scaled_key_id)
                 if rotated is None:
                     rotated = pygame.transform.rotate(scaled, angle_deg)
-                    transform_cache.put_rotated(scaled, angle_deg, scaled_id, rotated)
+                    transform_cache.put_rotated(scaled, angle_deg, scaled_key_id, rotated)
 
-                rotated.set_alpha(int(255 * la01))
+                rotated.set_alpha(alpha8)
                 axc = (float(ax) - 0.5) * float(target_w)
                 ayc = (float(ay) - 0.5) * float(target_h)
-                c0 = math.cos(-float(lr))
-                s0 = math.sin(-float(lr))
+                # Rotation by -lr: cos is even, sin is odd.
+                c0 = tx
+                s0 = -ty
                 dx = c0 * axc - s0 * ayc
                 dy = s0 * axc + c0 * ayc
-                cx, cy = apply_expand_xy(float(lx) * float(overrender), float(ly) * float(overrender), int(RW), int(RH), float(expand))
-                overlay.blit(rotated, (cx - rotated.get_width() / 2 - dx, cy - rotated.get_height() / 2 - dy))
+                cx, cy = expand_xy(float(lx) * float(overrender), float(ly) * float(overrender))
+                blit_list.append((rotated, (cx - rotated.get_width() / 2 - dx, cy - rotated.get_height() / 2 - dy)))
                 continue
 
         sx = 1.0
@@ -218,34 +355,83 @@ def render_frame(
         if sy <= 1e-6:
             sy = 1.0
 
-        tx, ty = math.cos(float(lr)), math.sin(float(lr))
         ex = tx * (float(line_len) * float(sx)) * 0.5
         ey = ty * (float(line_len) * 0.5)
         p0 = (float(lx) - float(ex), float(ly) - float(ey))
         p1 = (float(lx) + float(ex), float(ly) + float(ey))
-        p0s = apply_expand_xy(p0[0] * float(overrender), p0[1] * float(overrender), int(RW), int(RH), float(expand))
-        p1s = apply_expand_xy(p1[0] * float(overrender), p1[1] * float(overrender), int(RW), int(RH), float(expand))
-        rgba = (*ln.color_rgb, int(255 * la01))
-        draw_line_rgba(overlay, p0s, p1s, rgba, width=int(line_w))
-        lxs, lys = apply_expand_xy(float(lx) * float(overrender), float(ly) * float(overrender), int(RW), int(RH), float(expand))
-        pygame.draw.circle(overlay, (*ln.color_rgb, int(220 * la01)), (int(lxs), int(lys)), int(dot_r))
+        p0s = expand_xy(p0[0] * float(overrender), p0[1] * float(overrender))
+        p1s = expand_xy(p1[0] * float(overrender), p1[1] * float(overrender))
+        rr, gg, bb = ln.color_rgb
+        _flush_blits(overlay, blit_list)
+        draw_line_rgba(overlay, p0s, p1s, (rr, gg, bb, int(255 * la01)), width=int(line_w))
+        lxs, lys = expand_xy(float(lx) * float(overrender), float(ly) * float(overrender))
+        pygame.draw.circle(overlay, (rr, gg, bb, int(220 * la01)), (int(lxs), int(lys)), int(dot_r))
 
         pr = int(line_last_hit_ms.get(ln.lid, 0))
-        if getattr(args, "debug_line_label", False):
+        if debug_line_label:
             label = ln.name.strip() if ln.name.strip() else str(ln.lid)
             txt = small.render(label, True, (240, 240, 240))
-            lxs, lys = apply_expand_xy(float(lx) * float(overrender), float(ly) * float(overrender), int(RW), int(RH), float(expand))
-            line_text_draw_calls.append((pr, txt, (lxs - txt.get_width() / 2) / float(overrender), (lys - txt.get_height() / 2) / float(overrender)))
+            bucket = line_text_by_prio.get(pr)
+            if bucket is None:
+                bucket = line_text_by_prio[pr] = []
+            bucket.append((pr, txt, (lxs - txt.get_width() / 2) / float(overrender), (lys - txt.get_height() / 2) / float(overrender)))
 
     # draw notes
     note_render_count = 0
     note_dbg_drawn = 0
-    no_cull_all = bool(getattr(args, "no_cull", False))
-    no_cull_screen = bool(getattr(args, "no_cull_screen", False))
-    no_cull_enter_time = bool(getattr(args, "no_cull_enter_time", False))
+    no_cull_all = ra.no_cull
+    no_cull_screen = ra.no_cull_screen
+    no_cull_enter_time = ra.no_cull_enter_time
     st0 = max(0, int(idx_next) - 400)
     st1 = min(len(states), int(idx_next) + 1200)
-    for si in range(int(st0), int(st1)):
+    tab = note_table_for(states)
+    extra_after = max(0.25, ra.approach + 0.5)
+    if (not no_cull_all) and (not no_cull_enter_time):
+        vis_lo, vis_hi = visible_bounds(tab, float(t_draw), extra_after)
+        st0 = max(st0, vis_lo)
+        st1 = max(st0, min(st1, vis_hi))
+    scr = note_screen_positions(
+        tab, int(st0), int(st1), lf, float(t_draw), flow_mul, speed_mul_affects_travel, hold_keep_head,
+        float(overrender), int(RW), int(RH), float(expand),
+    )
+
+    # Static filters (fake notes, retired notes, enter/leave time) run over the note
+    # table columns for the whole window; the loop below only visits the survivors.
+    retired = retired_mask(tab)
+    keep = ~(tab.fake[st0:st1] | retired[st0:st1])
+    if (not no_cull_all) and (not no_cull_enter_time):
+        t_now = float(t_draw)
+        is_hold = tab.kind[st0:st1] == 3
+        t_leave = np.where(is_hold, tab.t_end[st0:st1] + 0.35, tab.t_hit[st0:st1] + extra_after)
+        keep &= (tab.t_enter[st0:st1] <= t_now) & (t_leave >= t_now)
+    if scr is not None and (not no_cull_all) and (not no_cull_screen):
+        # Screen cull for non-hold notes on the batched positions. Holds keep their
+        # per-note head/tail box test, since their head can depend on judge state.
+        m = int(120 * float(overrender))
+        off_screen = (scr.head_x < -m) | (scr.head_x > float(RW + m)) | (scr.head_y < -m) | (scr.head_y > float(RH + m))
+        keep &= ~(off_screen & (tab.kind[st0:st1] != 3))
+
+    # Chart-constant note columns for the surviving rows, as Python floats. Note
+    # alpha already includes the line alpha factor.
+    rows = np.flatnonzero(keep) + int(st0)
+    alpha_rows = tab.alpha01[rows] * line_note_alpha_mul(lf, line_alpha_mode)[tab.line_id[rows]]
+    note_rows = zip(
+        rows.tolist(),
+        alpha_rows.tolist(),
+        tab.size_px[rows].tolist(),
+        tab.side[rows].tolist(),
+        tab.x_local[rows].tolist(),
+        tab.y_offset[rows].tolist(),
+        tab.speed_mul[rows].tolist(),
+    )
+    ws_base = float(base_note_w) * float(note_scale_x)
+    hs_base = float(base_note_h) * float(note_scale_y)
+
+    # basic_debug prints for the first drawn note at most every 500 ms.
+    now_ms = int(float(t_draw) * 1000.0)
+    debug_print_due = basic_debug and (now_ms - int(last_debug_ms)) >= 500
+
+    for si, alpha0, size_px, side_n, x_local, y_off, speed_n in note_rows:
         s = states[si]
         n = s.note
         try:
@@ -258,10 +444,10 @@ def render_frame(
         except Exception:
             pass
         if n.kind != 3 and s.judged:
-            if bool(getattr(s, "miss", False)):
+            if s.miss:
                 show_miss_for_a_while = True
                 if show_miss_for_a_while:
-                    mt = getattr(s, "miss_t", None)
+                    mt = s.miss_t
                     if mt is None:
                         continue
                     if float(t_draw) <= float(mt) + float(MISS_FADE_SEC):
@@ -269,66 +455,50 @@ def render_frame(
                     else:
                         continue
             else:
+                retired[si] = True
                 continue
 
-        if n.kind == 3 and bool(getattr(s, "hold_finalized", False)):
-            if not bool(getattr(s, "miss", False)):
+        if n.kind == 3 and s.hold_finalized:
+            if not s.miss:
+                retired[si] = True
                 continue
             try:
-                if float(t_draw) > float(getattr(n, "t_end", 0.0) or 0.0) + float(MISS_FADE_SEC):
+                if float(t_draw) > float(n.t_end) + float(MISS_FADE_SEC):
                     continue
             except Exception:
                 pass
-        if n.fake:
-            continue
-        if (not no_cull_all) and (not no_cull_enter_time):
-            if float(t_draw) < float(n.t_enter):
-                continue
-            t_end_for_cull = float(n.t_end) if int(n.kind) == 3 else float(n.t_hit)
-            extra_after = max(0.25, float(getattr(args, "approach", 3.0)) + 0.5)
-            if int(n.kind) == 3:
-                extra_after = 0.35
-            if float(t_draw) > float(t_end_for_cull) + float(extra_after):
-                continue
 
         note_render_count += 1
 
         lx, ly, lr, la01, sc_now, la_raw = line_states[n.line_id]
         tx, ty = line_trig[n.line_id]
-        nx, ny = -ty, tx
 
-        if getattr(args, "basic_debug", False):
-            now_ms = int(float(t_draw) * 1000.0)
-            if (now_ms - int(last_debug_ms)) >= 500:
-                try:
-                    dy_dbg = float(n.scroll_hit) - float(sc_now)
-                    print(
-                        f"[dbg] t={float(t_draw):.3f} note={int(n.nid)} line={int(n.line_id)} t_hit={float(n.t_hit):.3f} "
-                        f"sc_now={float(sc_now):.3f} sc_hit={float(n.scroll_hit):.3f} dy={float(dy_dbg):.3f}"
-                    )
-                except Exception:
-                    pass
-                last_debug_ms = int(now_ms)
-
-        note_alpha = clamp(float(getattr(n, "alpha01", 1.0)), 0.0, 1.0)
-        if la01 < 0.0:
-            if str(getattr(args, "line_alpha_affects_notes", "negative_only")) != "never":
-                note_alpha *= clamp(1.0 + la01, 0.0, 1.0)
-        elif str(getattr(args, "line_alpha_affects_notes", "negative_only")) == "always":
-            note_alpha *= clamp(la01, 0.0, 1.0)
+        if debug_print_due:
+            try:
+                dy_dbg = float(n.scroll_hit) - float(sc_now)
+                print(
+                    f"[dbg] t={float(t_draw):.3f} note={int(n.nid)} line={int(n.line_id)} t_hit={float(n.t_hit):.3f} "
+                    f"sc_now={float(sc_now):.3f} sc_hit={float(n.scroll_hit):.3f} dy={float(dy_dbg):.3f}"
+                )
+            except Exception:
+                pass
+            last_debug_ms = now_ms
+            debug_print_due = False
+
+        note_alpha = alpha0
         if note_alpha <= 1e-6:
             continue
 
         miss_dim = 0.0
-        if bool(getattr(s, "miss", False)):
-            mt = getattr(s, "miss_t", None)
+        if s.miss:
+            mt = s.miss_t
             if mt is not None:
                 dtm = float(t_draw) - float(mt)
                 if dtm >= 0.0:
                     miss_dim = clamp(dtm / float(MISS_FADE_SEC), 0.0, 1.0)
                     if int(n.kind) == 3:
                         try:
-                            te = float(getattr(n, "t_end", 0.0) or 0.0)
+                            te = float(n.t_end)
                         except Exception:
                             te = float(t_draw)
                         if float(t_draw) <= float(te):
@@ -340,49 +510,34 @@ def render_frame(
                     else:
                         note_alpha *= (1.0 - float(miss_dim)) * 0.65
 
-        ws = float(base_note_w) * float(note_scale_x) * float(getattr(n, "size_px", 1.0))
-        hs = float(base_note_h) * float(note_scale_y) * float(getattr(n, "size_px", 1.0))
+        ws = ws_base * size_px
+        hs = hs_base * size_px
         rgba_fill = (255, 255, 255, int(255 * note_alpha))
         rgba_outline = (0, 0, 0, int(220 * note_alpha))
 
         if n.kind == 3:
-            hit_for_draw = bool(s.hit) and (not bool(getattr(n, "fake", False)))
-            if hit_for_draw and respack and bool(getattr(respack, "hold_keep_head", False)):
-                dy = (float(sc_now) - float(sc_now)) * float(flow_mul)
-                if hold_keep_head and dy < 0.0:
-                    dy = 0.0
-                y_local = (1.0 if bool(getattr(n, "above", True)) else -1.0) * dy + float(getattr(n, "y_offset_px", 0.0))
-                x_local = float(getattr(n, "x_local_px", 0.0))
-                head = (
-                    float(lx) + float(tx) * x_local + float(nx) * y_local,
-                    float(ly) + float(ty) * x_local + float(ny) * y_local,
-                )
+            hit_for_draw = bool(s.hit) and (not bool(n.fake))
+            keep_head_hit = bool(hit_for_draw and respack and bool(getattr(respack, "hold_keep_head", False)))
+            early_hit = (bool(s.hit) or bool(s.holding)) and float(t_draw) < float(n.t_hit)
+            if scr is not None and not keep_head_hit and not early_hit:
+                # Common case: the batched pass already placed head and tail.
+                j = si - st0
+                head_s = (float(scr.head_x[j]), float(scr.head_y[j]))
+                tail_s = (float(scr.tail_x[j]), float(scr.tail_y[j]))
             else:
-                if bool(getattr(s, "hit", False)) or bool(getattr(s, "holding", False)) or (float(t_draw) >= float(n.t_hit)):
-                    head_target_scroll = n.scroll_hit if float(sc_now) <= float(n.scroll_hit) else float(sc_now)
+                if keep_head_hit:
+                    # The respack pins hit heads to the judge line.
+                    head_scroll = float(sc_now)
+                elif bool(s.hit) or bool(s.holding) or (float(t_draw) >= float(n.t_hit)):
+                    head_scroll = max(float(n.scroll_hit), float(sc_now))
                 else:
-                    head_target_scroll = n.scroll_hit
-                dy = (float(head_target_scroll) - float(sc_now)) * float(flow_mul)
-                if hold_keep_head and dy < 0.0:
-                    dy = 0.0
-                y_local = (1.0 if bool(getattr(n, "above", True)) else -1.0) * dy + float(getattr(n, "y_offset_px", 0.0))
-                x_local = float(getattr(n, "x_local_px", 0.0))
-                head = (
-                    float(lx) + float(tx) * x_local + float(nx) * y_local,
-                    float(ly) + float(ty) * x_local + float(ny) * y_local,
+                    head_scroll = float(n.scroll_hit)
+                head_s, tail_s = _hold_endpoints(
+                    lx, ly, tx, ty, float(sc_now), head_scroll, float(n.scroll_end),
+                    side_n, x_local, y_off, speed_n, flow_mul, hold_keep_head,
+                    float(overrender), expand_xy,
                 )
 
-            dy = (float(getattr(n, "scroll_end", 0.0)) - float(sc_now)) * float(flow_mul)
-            mult = max(0.0, float(getattr(n, "speed_mul", 1.0)))
-            y_local = (1.0 if bool(getattr(n, "above", True)) else -1.0) * dy * mult + float(getattr(n, "y_offset_px", 0.0))
-            x_local = float(getattr(n, "x_local_px", 0.0))
-            tail = (
-                float(lx) + float(tx) * x_local + float(nx) * y_local,
-                float(ly) + float(ty) * x_local + float(ny) * y_local,
-            )
-            head_s = apply_expand_xy(head[0] * float(overrender), head[1] * float(overrender), int(RW), int(RH), float(expand))
-            tail_s = apply_expand_xy(tail[0] * float(overrender), tail[1] * float(overrender), int(RW), int(RH), float(expand))
-
             if (not no_cull_all) and (not no_cull_screen):
                 m = int(120 * float(overrender))
                 minx = min(float(head_s[0]), float(tail_s[0]))
@@ -395,13 +550,13 @@ def render_frame(
             hold_alpha = float(note_alpha)
             if s.hold_failed:
                 hold_alpha *= 0.35
-            mh = bool(getattr(n, "mh", False))
-            size_scale = float(getattr(n, "size_px", 1.0) or 1.0)
-            note_rgb = getattr(n, "tint_rgb", (255, 255, 255))
+            mh = bool(n.mh)
+            size_scale = size_px or 1.0
+            note_rgb = n.tint_rgb
             line_rgb = lines[n.line_id].color_rgb
             prog = None
             try:
-                if bool(getattr(s, "hit", False)) or bool(getattr(s, "holding", False)) or (float(t_draw) >= float(n.t_hit)):
+                if bool(s.hit) or bool(s.holding) or (float(t_draw) >= float(n.t_hit)):
                     den = float(n.scroll_end) - float(n.scroll_hit)
                     num = float(sc_now) - float(n.scroll_hit)
                     if abs(den) > 1e-6:
@@ -413,6 +568,7 @@ def render_frame(
             except Exception:
                 prog = None
 
+            _flush_blits(overlay, blit_list)
             draw_hold_3slice(
                 overlay=overlay,
                 head_xy=head_s,
@@ -425,55 +581,51 @@ def render_frame(
                 mh=bool(mh),
                 hold_body_w=max(1, int(float(hold_body_w) * float(overrender))),
                 progress=prog,
-                draw_outline=(not getattr(args, "no_note_outline", False)),
+                draw_outline=(not no_note_outline),
                 outline_width=max(1, int(float(outline_w) * float(overrender))),
             )
 
-            if getattr(args, "debug_note_info", False):
-                if int(note_dbg_drawn) >= 80:
+            if debug_note_info and note_dbg_drawn < 80:
+                try:
+                    dy_dbg = float(n.scroll_hit) - float(sc_now)
+                    dt_ms = (float(t_draw) - float(n.t_hit)) * 1000.0
+                    side_ch = "A" if side_n > 0.0 else "B"
+                    label_key = f"{int(n.nid)}:{int(n.kind)} L{int(n.line_id)}{side_ch}"
+                    surf = note_dbg_cache.get(label_key)
+                    if surf is None:
+                        surf = small.render(label_key, True, (240, 240, 240))
+                        note_dbg_cache[label_key] = surf
+                    extra = f"dt={dt_ms:+.0f}ms dy={float(dy_dbg):.1f}"
+                    if prog is not None:
+                        extra += f" p={float(prog)*100.0:4.1f}%"
+                    nxv = -ty
+                    nyv = tx
+                    off = (float(hs) * float(overrender) * 0.8 + 14.0 * float(overrender))
+                    tx0 = float(head_s[0]) + nxv * off * side_n
+                    ty0 = float(head_s[1]) + nyv * off * side_n
+                    blit_list.append((surf, (int(tx0 - surf.get_width() / 2), int(ty0 - surf.get_height() / 2))))
+                    # dt/dy change every frame, so this line is laid out from glyphs.
+                    _queue_centered_text(
+                        blit_list, small, extra, tx0, ty0 - small.get_height() / 2 + surf.get_height(), (200, 200, 200)
+                    )
+                    note_dbg_drawn += 1
+                except Exception:
                     pass
-                else:
-                    try:
-                        dy_dbg = float(n.scroll_hit) - float(sc_now)
-                        dt_ms = (float(t_draw) - float(n.t_hit)) * 1000.0
-                        side_ch = "A" if bool(getattr(n, "above", True)) else "B"
-                        label_key = f"{int(n.nid)}:{int(n.kind)} L{int(n.line_id)}{side_ch}"
-                        surf = note_dbg_cache.get(label_key)
-                        if surf is None:
-                            surf = small.render(label_key, True, (240, 240, 240))
-                            note_dbg_cache[label_key] = surf
-                        extra = f"dt={dt_ms:+.0f}ms dy={float(dy_dbg):.1f}"
-                        if prog is not None:
-                            extra += f" p={float(prog)*100.0:4.1f}%"
-                        surf2 = small.render(extra, True, (200, 200, 200))
-                        nxv = -math.sin(float(lr))
-                        nyv = math.cos(float(lr))
-                        side = 1.0 if bool(getattr(n, "above", True)) else -1.0
-                        off = (float(hs) * float(overrender) * 0.8 + 14.0 * float(overrender))
-                        tx0 = float(head_s[0]) + nxv * off * side
-                        ty0 = float(head_s[1]) + nyv * off * side
-                        overlay.blit(surf, (int(tx0 - surf.get_width() / 2), int(ty0 - surf.get_height() / 2)))
-                        overlay.blit(
-                            surf2,
-                            (int(tx0 - surf2.get_width() / 2), int(ty0 - surf2.get_height() / 2 + surf.get_height())),
-                        )
-                        note_dbg_drawn += 1
-                    except Exception:
-                        pass
         else:
-            dy = (float(getattr(n, "scroll_hit", 0.0)) - float(sc_now)) * float(flow_mul)
-            mult = 1.0
-            if speed_mul_affects_travel:
-                mult = max(0.0, float(getattr(n, "speed_mul", 1.0)))
-            y_local = (1.0 if bool(getattr(n, "above", True)) else -1.0) * dy * float(mult) + float(getattr(n, "y_offset_px", 0.0))
-            x_local = float(getattr(n, "x_local_px", 0.0))
-            p = (
-                float(lx) + float(tx) * x_local + float(nx) * y_local,
-                float(ly) + float(ty) * x_local + float(ny) * y_local,
-            )
-            ps = apply_expand_xy(p[0] * float(overrender), p[1] * float(overrender), int(RW), int(RH), float(expand))
+            if scr is not None:
+                ps = (float(scr.head_x[si - st0]), float(scr.head_y[si - st0]))
+            else:
+                dy = (float(n.scroll_hit) - float(sc_now)) * float(flow_mul)
+                if speed_mul_affects_travel:
+                    dy *= speed_n
+                y_local = side_n * dy + y_off
+                p = (
+                    float(lx) + float(tx) * x_local - float(ty) * y_local,
+                    float(ly) + float(ty) * x_local + float(tx) * y_local,
+                )
+                ps = expand_xy(p[0] * float(overrender), p[1] * float(overrender))
 
-            if (not no_cull_all) and (not no_cull_screen):
+            if scr is None and (not no_cull_all) and (not no_cull_screen):
                 m = int(120 * float(overrender))
                 if (float(ps[0]) < -m) or (float(ps[0]) > float(RW + m)) or (float(ps[1]) < -m) or (float(ps[1]) > float(RH + m)):
                     continue
@@ -485,8 +637,9 @@ def render_frame(
                     rgba_fill = (g, g, g, int(255 * note_alpha))
                     rgba_outline = (0, 0, 0, int(220 * note_alpha))
                 pts = rect_corners(ps[0], ps[1], ws * float(overrender), hs * float(overrender), float(lr))
+                _flush_blits(overlay, blit_list)
                 draw_poly_rgba(overlay, pts, rgba_fill)
-                if not getattr(args, "no_note_outline", False):
+                if not no_note_outline:
                     draw_poly_outline_rgba(overlay, pts, rgba_outline, width=int(outline_w))
             else:
                 iw, ih = img.get_width(), img.get_height()
@@ -494,66 +647,94 @@ def render_frame(
                 target_h = max(1, int(target_w * ih / max(1, iw) * float(note_scale_y)))
 
                 img_id = id(img)
-                scaled = transform_cache.get_scaled(img, target_w, target_h, img_id)
-                if scaled is None:
-                    scaled = pygame.transform.smoothscale(img, (target_w, target_h))
-                    transform_cache.put_scaled(img, target_w, target_h, img_id, scaled)
+                angle_deg = _note_angle_deg(lr)
+                tint = n.tint_rgb
+                alpha8 = int(255 * note_alpha)
+                atlas_ent = None
+                if sprite_atlas is not None and alpha8 >= 255 and miss_dim <= 1e-6 and tuple(tint) == (255, 255, 255):
+                    # Untinted, opaque sprites are drawn straight from a shared atlas page.
+                    akey = (int(img_id), int(target_w), int(target_h), int(round(angle_deg * _NOTE_ANGLE_STEPS_PER_DEG)))
+                    atlas_ent = sprite_atlas.get(akey)
+                    if atlas_ent is None:
+                        scaled = transform_cache.get_scaled(img, target_w, target_h, img_id)
+                        if scaled is None:
+                            scaled = pygame.transform.smoothscale(img, (target_w, target_h))
+                            transform_cache.put_scaled(img, target_w, target_h, img_id, scaled)
+                        atlas_ent = sprite_atlas.put(akey, pygame.transform.rotate(scaled, angle_deg))
+
+                if atlas_ent is not None:
+                    page, area = atlas_ent
+                    blit_list.append((page, (ps[0] - area.width / 2, ps[1] - area.height / 2), area))
+                else:
+                    try:
+                        trc, tgc, tbc = tint
+                        if miss_dim > 1e-6:
+                            g = int(220 * (1.0 - 0.7 * float(miss_dim)))
+                            trc = int(trc * (1.0 - 0.8 * float(miss_dim)) + g * (0.8 * float(miss_dim)))
+                            tgc = int(tgc * (1.0 - 0.8 * float(miss_dim)) + g * (0.8 * float(miss_dim)))
+                            tbc = int(tbc * (1.0 - 0.8 * float(miss_dim)) + g * (0.8 * float(miss_dim)))
+                        tint_q, alpha_q = transform_cache.quantize_tint((trc, tgc, tbc), alpha8)
+                    except Exception:
+                        tint_q, alpha_q = None, alpha8
 
-                angle_deg = -float(lr) * 180.0 / math.pi
-                scaled_key_id = (int(img_id), int(target_w), int(target_h))
-                rotated = transform_cache.get_rotated(scaled, angle_deg, scaled_key_id)
-                if rotated is None:
-                    rotated = pygame.transform.rotate(scaled, angle_deg)
-                    transform_cache.put_rotated(scaled, angle_deg, scaled_key_id, rotated)
+                    # The tinted, alpha'd sprite is cached as a whole, so repeated notes
+                    # skip the rotate copy, the tint fill and set_alpha.
+                    scaled_key_id = (int(img_id), int(target_w), int(target_h))
+                    final = transform_cache.get_final(scaled_key_id, angle_deg, tint_q, alpha_q)
+                    if final is None:
+                        scaled = transform_cache.get_scaled(img, target_w, target_h, img_id)
+                        if scaled is None:
+                            scaled = pygame.transform.smoothscale(img, (target_w, target_h))
+                            transform_cache.put_scaled(img, target_w, target_h, img_id, scaled)
+
+                        final = transform_cache.get_rotated(scaled, angle_deg, scaled_key_id)
+                        if final is None:
+                            final = pygame.transform.rotate(scaled, angle_deg)
+                            transform_cache.put_rotated(scaled, angle_deg, scaled_key_id, final)
+
+                        if tint_q is not None:
+                            try:
+                                final.fill((*tint_q, 255), special_flags=pygame.BLEND_RGBA_MULT)
+                            except Exception:
+                                pass
+                        final.set_alpha(alpha_q)
+                        transform_cache.put_final(scaled_key_id, angle_deg, tint_q, alpha_q, final)
+                    blit_list.append((final, (ps[0] - final.get_width() / 2, ps[1] - final.get_height() / 2)))
+                if not no_note_outline:
+                    pts = rect_corners(ps[0], ps[1], float(target_w), float(target_h), float(lr))
+                    _flush_blits(overlay, blit_list)
+                    draw_poly_outline_rgba(overlay, pts, rgba_outline, width=int(outline_w))
 
+            if debug_note_info and note_dbg_drawn < 80:
                 try:
-                    trc, tgc, tbc = getattr(n, "tint_rgb", (255, 255, 255))
-                    if miss_dim > 1e-6:
-                        g = int(220 * (1.0 - 0.7 * float(miss_dim)))
-                        trc = int(trc * (1.0 - 0.8 * float(miss_dim)) + g * (0.8 * float(miss_dim)))
-                        tgc = int(tgc * (1.0 - 0.8 * float(miss_dim)) + g * (0.8 * float(miss_dim)))
-                        tbc = int(tbc * (1.0 - 0.8 * float(miss_dim)) + g * (0.8 * float(miss_dim)))
-                    rotated.fill((int(trc), int(tgc), int(tbc), 255), special_flags=pygame.BLEND_RGBA_MULT)
+                    dy_dbg = float(n.scroll_hit) - float(sc_now)
+                    dt_ms = (float(t_draw) - float(n.t_hit)) * 1000.0
+                    side_ch = "A" if side_n > 0.0 else "B"
+                    label_key = f"{int(n.nid)}:{int(n.kind)} L{int(n.line_id)}{side_ch}"
+                    surf = note_dbg_cache.get(label_key)
+                    if surf is None:
+                        surf = small.render(label_key, True, (240, 240, 240))
+                        note_dbg_cache[label_key] = surf
+                    extra = f"dt={dt_ms:+.0f}ms dy={float(dy_dbg):.1f}"
+                    nxv = -ty
+                    nyv = tx
+                    off = (float(hs) * float(overrender) * 0.8 + 14.0 * float(overrender))
+                    tx0 = float(ps[0]) + nxv * off * side_n
+                    ty0 = float(ps[1]) + nyv * off * side_n
+                    blit_list.append((surf, (int(tx0 - surf.get_width() / 2), int(ty0 - surf.get_height() / 2))))
+                    # dt/dy change every frame, so this line is laid out from glyphs.
+                    _queue_centered_text(
+                        blit_list, small, extra, tx0, ty0 - small.get_height() / 2 + surf.get_height(), (200, 200, 200)
+                    )
+                    note_dbg_drawn += 1
                 except Exception:
                     pass
-                rotated.set_alpha(int(255 * note_alpha))
-                overlay.blit(rotated, (ps[0] - rotated.get_width() / 2, ps[1] - rotated.get_height() / 2))
-                pts = rect_corners(ps[0], ps[1], float(target_w), float(target_h), float(lr))
-                if not getattr(args, "no_note_outline", False):
-                    draw_poly_outline_rgba(overlay, pts, rgba_outline, width=int(outline_w))
-
-            if getattr(args, "debug_note_info", False):
-                if int(note_dbg_drawn) >= 80:
-                    pass
-                else:
-                    try:
-                        dy_dbg = float(n.scroll_hit) - float(sc_now)
-                        dt_ms = (float(t_draw) - float(n.t_hit)) * 1000.0
-                        side_ch = "A" if bool(getattr(n, "above", True)) else "B"
-                        label_key = f"{int(n.nid)}:{int(n.kind)} L{int(n.line_id)}{side_ch}"
-                        surf = note_dbg_cache.get(label_key)
-                        if surf is None:
-                            surf = small.render(label_key, True, (240, 240, 240))
-                            note_dbg_cache[label_key] = surf
-                        extra = f"dt={dt_ms:+.0f}ms dy={float(dy_dbg):.1f}"
-                        surf2 = small.render(extra, True, (200, 200, 200))
-                        nxv = -math.sin(float(lr))
-                        nyv = math.cos(float(lr))
-                        side = 1.0 if bool(getattr(n, "above", True)) else -1.0
-                        off = (float(hs) * float(overrender) * 0.8 + 14.0 * float(overrender))
-                        tx0 = float(ps[0]) + nxv * off * side
-                        ty0 = float(ps[1]) + nyv * off * side
-                        overlay.blit(surf, (int(tx0 - surf.get_width() / 2), int(ty0 - surf.get_height() / 2)))
-                        overlay.blit(
-                            surf2,
-                            (int(tx0 - surf2.get_width() / 2), int(ty0 - surf2.get_height() / 2 + surf.get_height())),
-                        )
-                        note_dbg_drawn += 1
-                    except Exception:
-                        pass
 
     # hitfx
-    hitfx[:] = prune_hitfx(hitfx, float(t_draw), (respack.hitfx_duration if respack else 0.18))
+    prune_hitfx_inplace(hitfx, float(t_draw), (respack.hitfx_duration if respack else 0.18))
+    if hitfx and not respack:
+        # Fallback rings are primitive draws, not blits.
+        _flush_blits(overlay, blit_list)
     for fx in hitfx:
         draw_hitfx(
             overlay,
@@ -563,8 +744,9 @@ def render_frame(
             W=int(RW),
             H=int(RH),
             expand=float(expand),
-            hitfx_scale_mul=float(getattr(args, "hitfx_scale_mul", 1.0)),
+            hitfx_scale_mul=ra.hitfx_scale_mul,
             overrender=float(overrender),
+            out=blit_list,
         )
 
     # BAD ghost indicators
@@ -582,14 +764,15 @@ def render_frame(
                 nn = g.get("note", None)
                 if nn is None:
                     continue
-                ps = apply_expand_xy(nx0 * float(overrender), ny0 * float(overrender), int(RW), int(RH), float(expand))
+                ps = expand_xy(nx0 * float(overrender), ny0 * float(overrender))
                 img = pick_note_image(nn, respack)
-                ws = float(base_note_w) * float(note_scale_x) * float(getattr(nn, "size_px", 1.0))
-                hs = float(base_note_h) * float(note_scale_y) * float(getattr(nn, "size_px", 1.0))
+                ws = float(base_note_w) * float(note_scale_x) * float(nn.size_px)
+                hs = float(base_note_h) * float(note_scale_y) * float(nn.size_px)
                 if img is None:
                     pts = rect_corners(ps[0], ps[1], ws * float(overrender), hs * float(overrender), float(nr))
+                    _flush_blits(overlay, blit_list)
                     draw_poly_rgba(overlay, pts, (255, 80, 80, int(180 * a01)))
-                    if not getattr(args, "no_note_outline", False):
+                    if not no_note_outline:
                         draw_poly_outline_rgba(overlay, pts, (0, 0, 0, int(160 * a01)), width=int(outline_w))
                 else:
                     iw, ih = img.get_width(), img.get_height()
@@ -600,7 +783,7 @@ def render_frame(
                     if scaled is None:
                         scaled = pygame.transform.smoothscale(img, (target_w, target_h))
                         transform_cache.put_scaled(img, target_w, target_h, img_id, scaled)
-                    angle_deg = -float(nr) * 180.0 / math.pi
+                    angle_deg = _note_angle_deg(nr)
                     scaled_key_id = (int(img_id), int(target_w), int(target_h))
                     rotated = transform_cache.get_rotated(scaled, angle_deg, scaled_key_id)
                     if rotated is None:
@@ -610,7 +793,7 @@ def render_frame(
                         rg = rotated.copy()
                         rg.fill((255, 80, 80, 255), special_flags=pygame.BLEND_RGBA_MULT)
                         rg.set_alpha(int(200 * a01))
-                        overlay.blit(rg, (ps[0] - rg.get_width() / 2, ps[1] - rg.get_height() / 2))
+                        blit_list.append((rg, (ps[0] - rg.get_width() / 2, ps[1] - rg.get_height() / 2)))
                     except Exception:
                         pass
                 kept.append(g)
@@ -618,8 +801,15 @@ def render_frame(
                 continue
         bad_ghosts[:] = kept
 
+    _flush_blits(overlay, blit_list)
     base.blit(overlay, (0, 0))
-    surface_pool.release(overlay)
+    if overlay_ring is None:
+        surface_pool.release(overlay)
+
+    # Sorted by priority; within a priority, in line order.
+    line_text_draw_calls: List[Tuple[int, pygame.Surface, float, float]] = []
+    for pr in sorted(line_text_by_prio):
+        line_text_draw_calls.extend(line_text_by_prio[pr])
 
     return (
         base,
@@ -1,10 +1,207 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+import itertools
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 import pygame
 
+from ....core.render_args import render_args
 from ....core.ui import compute_score, format_title, progress_ratio
+from ..performance.glyph_atlas import draw_text
+
+HINT_TEXT = "LMB/SPACE: hit   hold: keep pressed   P: pause   R: restart   ESC: quit"
+_SCORE_TMPL = "SCORE %07d   HIT %6.2f%%   MAX %d/%d"
+_FMT_TMPL = "fmt=%s  t=%7.3fs  next=%d/%d  lines=%d"
+_HIT_ROW_TMPL = "%+7.1fms  id=%6d  %s  hold=%s"
+# Judgement names pre-padded to the row's 7-column field.
+_JUDGE_LABELS: Dict[str, str] = {jd: "%-7s" % jd for jd in ("PERFECT", "GOOD", "BAD", "MISS")}
+
+
+class UILayout(NamedTuple):
+    pad: int
+    small_ls: int
+    combo_y: int
+    score_y: int
+    fmt_y: int
+    particles_y: int
+    hitdbg_y: int
+
+
+_HINT_CACHE: Dict[int, pygame.Surface] = {}
+# (font id, name, level, difficulty) -> combined title/subtitle surface; FIFO-trimmed.
+_TITLE_CACHE: Dict[Tuple[Any, ...], pygame.Surface] = {}
+_TITLE_CACHE_MAX = 8
+# Progress bar: background rect per screen width, foreground rect mutated in place.
+_PBAR_BG: Dict[int, pygame.Rect] = {}
+_PBAR_FG = pygame.Rect(0, 0, 0, 6)
+# Combo/score lines only change on judge events; keep the last rendered surface.
+_combo_cache: Dict[str, Any] = {"key": None, "surf": None}
+_score_cache: Dict[str, Any] = {"key": None, "surf": None}
+_LINESIZE: Dict[int, int] = {}
+# Last composed static overlay (combo/score/hit rows/title/hint) and the inputs it was built from.
+_ui_static: Dict[str, Any] = {"key": None, "blits": []}
+_LAYOUT_CACHE: Dict[Tuple[int, int], UILayout] = {}
+# Hit-debug rows keyed by record content; FIFO-trimmed.
+_HIT_CACHE: Dict[Tuple[Any, ...], pygame.Surface] = {}
+_HIT_CACHE_MAX = 64
+
+
+def _linesize(f: pygame.font.Font) -> int:
+    ls = _LINESIZE.get(id(f))
+    if ls is None:
+        ls = _LINESIZE[id(f)] = f.get_linesize()
+    return ls
+
+
+def _ui_layout(font: pygame.font.Font, small: pygame.font.Font) -> UILayout:
+    key = (id(font), id(small))
+    lay = _LAYOUT_CACHE.get(key)
+    if lay is None:
+        sls = _linesize(small)
+        fls = _linesize(font)
+        ui_pad = max(4, int(sls * 0.25))
+        ui_combo_y = 14
+        ui_score_y = ui_combo_y + fls + ui_pad
+        ui_fmt_y = ui_score_y + sls + max(2, ui_pad // 2)
+        lay = UILayout(
+            pad=ui_pad,
+            small_ls=sls,
+            combo_y=ui_combo_y,
+            score_y=ui_score_y,
+            fmt_y=ui_fmt_y,
+            particles_y=ui_fmt_y + sls + max(2, ui_pad // 2),
+            hitdbg_y=ui_fmt_y + sls + ui_pad,
+        )
+        _LAYOUT_CACHE[key] = lay
+    return lay
+
+
+def invalidate_title_cache() -> None:
+    """Drop cached title surfaces and font metrics (call when a new chart is loaded)."""
+    _TITLE_CACHE.clear()
+    # Keyed by id(font); a new run's fonts may reuse those ids.
+    _HINT_CACHE.clear()
+    _LINESIZE.clear()
+    _LAYOUT_CACHE.clear()
+    _ui_static["key"] = None
+
+
+def _segment_progress(t: float, st: float, en: float) -> Tuple[float, float]:
+    song_t = t - st
+    dur = en - st
+    if dur < 1e-6:
+        dur = 1e-6
+    song_p = 0.0 if song_t < 0.0 else (1.0 if song_t > dur else song_t / dur)
+    return song_t, song_p
+
+
+def _title_key(small: pygame.font.Font, chart_info: Dict[str, Any]) -> Tuple[Any, ...]:
+    # chart_info may be a fresh dict every frame (advance overrides), so key on content, not id().
+    return (id(small), chart_info.get("name", ""), chart_info.get("level", ""), chart_info.get("difficulty", None))
+
+
+def _title_surface(small: pygame.font.Font, chart_info: Dict[str, Any]) -> pygame.Surface:
+    """Title and subtitle as one surface, both lines right-aligned."""
+    key = _title_key(small, chart_info)
+    cached = _TITLE_CACHE.get(key)
+    if cached is None:
+        title, sub = format_title(chart_info)
+        t1 = small.render(title, True, (230, 230, 230))
+        if sub:
+            t2 = small.render(sub, True, (180, 180, 180))
+            sls = _linesize(small)
+            w = max(t1.get_width(), t2.get_width())
+            cached = _flatten([(t1, (w - t1.get_width(), 0)), (t2, (w - t2.get_width(), sls))])[0]
+        else:
+            cached = t1
+        _TITLE_CACHE[key] = cached
+        while len(_TITLE_CACHE) > _TITLE_CACHE_MAX:
+            del _TITLE_CACHE[next(iter(_TITLE_CACHE))]
+    return cached
+
+
+def _flatten(items: List[Tuple[pygame.Surface, Tuple[int, int]]]) -> Tuple[pygame.Surface, Tuple[int, int]]:
+    """Composite non-overlapping text blits into one tightly sized alpha surface."""
+    x0 = min(pos[0] for _surf, pos in items)
+    y0 = min(pos[1] for _surf, pos in items)
+    x1 = max(pos[0] + surf.get_width() for surf, pos in items)
+    y1 = max(pos[1] + surf.get_height() for surf, pos in items)
+    layer = pygame.Surface((max(1, x1 - x0), max(1, y1 - y0)), pygame.SRCALPHA)
+    for surf, (x, y) in items:
+        # RGBA_MAX copies glyph pixels as-is onto the transparent layer (no dark alpha fringes).
+        layer.blit(surf, (x - x0, y - y0), special_flags=pygame.BLEND_RGBA_MAX)
+    try:
+        layer = layer.convert_alpha()
+    except Exception:
+        pass
+    return layer, (x0, y0)
+
+
+def _compose_static(
+    *,
+    font: pygame.font.Font,
+    small: pygame.font.Font,
+    lay: UILayout,
+    W: int,
+    H: int,
+    judge: Any,
+    total_notes: int,
+    hit_recs: Tuple[Any, ...],
+    chart_info: Optional[Dict[str, Any]],
+) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+    """Build the blit list for the overlay parts that only change on judge events."""
+    ui_x = 16
+    sls = lay.small_ls
+    out: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+    block: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+
+    combo_key = (id(font), judge.combo)
+    if _combo_cache["key"] != combo_key:
+        _combo_cache["surf"] = font.render(f"COMBO {judge.combo}", True, (240, 240, 240))
+        _combo_cache["key"] = combo_key
+    block.append((_combo_cache["surf"], (ui_x, lay.combo_y)))
+
+    score_key = (id(small), judge.acc_sum, judge.judged_cnt, judge.max_combo, total_notes)
+    if _score_cache["key"] != score_key:
+        score, acc_ratio, _combo_ratio = compute_score(judge.acc_sum, judge.judged_cnt, judge.combo, judge.max_combo, total_notes)
+        _score_cache["surf"] = small.render(
+            _SCORE_TMPL % (score, acc_ratio * 100, judge.max_combo, total_notes),
+            True,
+            (200, 200, 200),
+        )
+        _score_cache["key"] = score_key
+    block.append((_score_cache["surf"], (ui_x, lay.score_y)))
+
+    # Records are HitRec instances typed by the producer, so no per-row validation here.
+    for shown, rec in enumerate(hit_recs):
+        dt_ms = rec.dt_ms
+        nid = rec.nid
+        jd = rec.judgement
+        hp = rec.hold_percent
+        key = (id(small), round(dt_ms, 1), nid, jd, hp)
+        txt = _HIT_CACHE.get(key)
+        if txt is None:
+            label = _JUDGE_LABELS.get(jd)
+            if label is None:
+                label = "%-7s" % jd
+            hp_s = "-" if hp is None else "%5.1f%%" % (hp * 100)
+            txt = small.render(_HIT_ROW_TMPL % (dt_ms, nid, label, hp_s), True, (200, 200, 200))
+            _HIT_CACHE[key] = txt
+            if len(_HIT_CACHE) > _HIT_CACHE_MAX:
+                del _HIT_CACHE[next(iter(_HIT_CACHE))]
+        block.append((txt, (ui_x, lay.hitdbg_y + shown * sls)))
+    out.append(_flatten(block))
+
+    if chart_info:
+        title_surf = _title_surface(small, chart_info)
+        out.append((title_surf, (W - 16 - title_surf.get_width(), 14)))
+
+    hint = _HINT_CACHE.get(id(small))
+    if hint is None:
+        hint = small.render(HINT_TEXT, True, (160, 160, 160))
+        _HINT_CACHE[id(small)] = hint
+    out.append((hint, (ui_x, H - sls - lay.pad)))
+    return out
 
 
 def render_ui_overlay(
@@ -34,95 +231,94 @@ def render_ui_overlay(
     clock: pygame.time.Clock,
 ):
     """Render the UI overlay (score, combo, debug info, etc.)."""
-    ui_pad = max(4, int(small.get_linesize() * 0.25))
+    lay = _ui_layout(font, small)
+    sls = lay.small_ls
+    ui_pad = lay.pad
     ui_x = 16
-    ui_y0 = 14
-    ui_combo_y = ui_y0
-    ui_score_y = ui_combo_y + font.get_linesize() + ui_pad
-    ui_fmt_y = ui_score_y + small.get_linesize() + max(2, ui_pad // 2)
-    ui_particles_y = ui_fmt_y + small.get_linesize() + max(2, ui_pad // 2)
-    ui_hitdbg_y = ui_fmt_y + small.get_linesize() + ui_pad
+    ui_fmt_y = lay.fmt_y
+    ui_particles_y = lay.particles_y
 
-    if getattr(args, "debug_particles", False):
-        txt = small.render(f"particles={particles_count}", True, (220, 220, 220))
-        screen.blit(txt, (ui_x, ui_particles_y))
+    ra = render_args(args)
+    show_title = bool(chart_info) and (not ra.no_title_overlay)
+    title_key = _title_key(small, chart_info) if show_title else None
+    if hit_debug and hit_debug_lines:
+        hit_recs = tuple(itertools.islice(hit_debug_lines, ra.hit_debug_cols))
+    else:
+        hit_recs = ()
 
-    if chart_end > 1e-6:
-        pbar = progress_ratio(t, chart_end, advance_active=advance_active, start_time=start_time)
-        pygame.draw.rect(screen, (40, 40, 40), pygame.Rect(0, 0, W, 6))
-        pygame.draw.rect(screen, (230, 230, 230), pygame.Rect(0, 0, int(W * pbar), 6))
+    # Combo, score, hit-debug rows, title and hint only change on judge events or chart
+    # switches; reuse the composed blit list until one of their inputs differs.
+    static_key = (
+        W,
+        H,
+        id(font),
+        id(small),
+        judge.combo,
+        judge.acc_sum,
+        judge.judged_cnt,
+        judge.max_combo,
+        total_notes,
+        tuple(rec.seq for rec in hit_recs),
+        title_key,
+    )
+    if _ui_static["key"] != static_key:
+        _ui_static["blits"] = _compose_static(
+            font=font,
+            small=small,
+            lay=lay,
+            W=W,
+            H=H,
+            judge=judge,
+            total_notes=total_notes,
+            hit_recs=hit_recs,
+            chart_info=(chart_info if show_title else None),
+        )
+        _ui_static["key"] = static_key
 
-    combo_txt = font.render(f"COMBO {judge.combo}", True, (240, 240, 240))
-    screen.blit(combo_txt, (ui_x, ui_combo_y))
+    # Text surfaces (and glyph-atlas sub-rects) are collected here and issued in one screen.blits() call.
+    blits: List[Tuple[Any, ...]] = list(_ui_static["blits"])
 
-    score, acc_ratio, _combo_ratio = compute_score(judge.acc_sum, judge.judged_cnt, judge.combo, judge.max_combo, total_notes)
-    score_txt = small.render(
-        f"SCORE {score:07d}   HIT {acc_ratio*100:6.2f}%   MAX {judge.max_combo}/{total_notes}",
-        True,
-        (200, 200, 200),
-    )
-    screen.blit(score_txt, (ui_x, ui_score_y))
+    if ra.debug_particles:
+        draw_text(blits, small, f"particles={particles_count}", ui_x, ui_particles_y, (220, 220, 220))
+
+    if chart_end > 1e-6:
+        pbar = progress_ratio(t, chart_end, advance_active=advance_active, start_time=start_time)
+        bg = _PBAR_BG.get(W)
+        if bg is None:
+            bg = _PBAR_BG[W] = pygame.Rect(0, 0, W, 6)
+        _PBAR_FG.width = int(W * pbar)
+        screen.fill((40, 40, 40), bg)
+        if _PBAR_FG.width > 0:
+            screen.fill((230, 230, 230), _PBAR_FG)
 
     extra_lines: List[str] = []
-    try:
-        if bool(getattr(args, "advance_seq_overlay", False)) and bool(advance_active):
-            ci = chart_info if isinstance(chart_info, dict) else {}
-            st = ci.get("seg_start_time", None)
-            en = ci.get("seg_end_time", None)
-            si = ci.get("seg_index", None)
-            ss = ci.get("seg_total", None)
-            if st is not None and en is not None:
-                song_t = float(t) - float(st)
-                dur = max(1e-6, float(en) - float(st))
-                song_p = clamp(song_t / dur, 0.0, 1.0)
-                if si is not None and ss is not None:
-                    extra_lines.append(f"seq={int(si)}/{int(ss)}  song_t={song_t:7.3f}s  song={song_p*100:6.2f}%")
-                else:
-                    extra_lines.append(f"song_t={song_t:7.3f}s  song={song_p*100:6.2f}%")
-            elif si is not None and ss is not None:
-                extra_lines.append(f"seq={int(si)}/{int(ss)}")
-    except Exception:
-        pass
+    if advance_active and ra.advance_seq_overlay and isinstance(chart_info, dict):
+        # The backend fills these fields with floats/ints when it builds the overlay dict.
+        st = chart_info.get("seg_start_time", None)
+        en = chart_info.get("seg_end_time", None)
+        si = chart_info.get("seg_index", None)
+        ss = chart_info.get("seg_total", None)
+        has_seq = si is not None and ss is not None
+        if st is not None and en is not None:
+            song_t, song_p = _segment_progress(t, st, en)
+            if has_seq:
+                extra_lines.append(f"seq={si}/{ss}  song_t={song_t:7.3f}s  song={song_p*100:6.2f}%")
+            else:
+                extra_lines.append(f"song_t={song_t:7.3f}s  song={song_p*100:6.2f}%")
+        elif has_seq:
+            extra_lines.append(f"seq={si}/{ss}")
 
-    fmt_txt = small.render(f"fmt={fmt}  t={t:7.3f}s  next={idx_next}/{states_len}  lines={lines_len}", True, (180, 180, 180))
-    screen.blit(fmt_txt, (ui_x, ui_fmt_y))
+    # Lines below change every frame; draw them from the glyph atlas instead of rasterizing.
+    draw_text(blits, small, _FMT_TMPL % (fmt, t, idx_next, states_len, lines_len), ui_x, ui_fmt_y, (180, 180, 180))
     if extra_lines:
         for j, s in enumerate(extra_lines, start=1):
-            txt = small.render(str(s), True, (180, 180, 180))
-            screen.blit(txt, (ui_x, ui_fmt_y + j * small.get_linesize()))
+            draw_text(blits, small, s, ui_x, ui_fmt_y + j * sls, (180, 180, 180))
 
-    if hit_debug and hit_debug_lines:
-        cols = max(1, int(getattr(args, "hit_debug_cols", 5) or 5))
-        shown = 0
-        for rec in list(hit_debug_lines)[:cols]:
-            try:
-                dt_ms = float(rec.get("dt_ms", 0.0))
-                nid = int(rec.get("nid", -1))
-                jd = str(rec.get("judgement", ""))
-                hp = rec.get("hold_percent", None)
-                hp_s = "-" if hp is None else f"{float(hp)*100:5.1f}%"
-                s = f"{dt_ms:+7.1f}ms  id={nid:6d}  {jd:7s}  hold={hp_s}"
-                txt = small.render(s, True, (200, 200, 200))
-                screen.blit(txt, (ui_x, ui_hitdbg_y + shown * small.get_linesize()))
-                shown += 1
-            except:
-                pass
-
-    if chart_info and (not getattr(args, "no_title_overlay", False)):
-        title, sub = format_title(chart_info)
-        t1 = small.render(title, True, (230, 230, 230))
-        t2 = small.render(sub, True, (180, 180, 180))
-        screen.blit(t1, (W - 16 - t1.get_width(), 14))
-        if sub:
-            screen.blit(t2, (W - 16 - t2.get_width(), 14 + small.get_linesize()))
-
-    hint = small.render("LMB/SPACE: hit   hold: keep pressed   P: pause   R: restart   ESC: quit", True, (160, 160, 160))
-    screen.blit(hint, (ui_x, H - small.get_linesize() - ui_pad))
-
-    if getattr(args, "basic_debug", False):
+    if ra.basic_debug:
         try:
             fps = float(clock.get_fps())
         except:
             fps = 0.0
-        dbg = small.render(f"FPS {fps:6.1f}   NOTE_RENDER {int(note_render_count)}", True, (220, 220, 220))
-        screen.blit(dbg, (ui_x, ui_particles_y + small.get_linesize() + ui_pad))
+        draw_text(blits, small, f"FPS {fps:6.1f}   NOTE_RENDER {int(note_render_count)}", ui_x, ui_particles_y + sls + ui_pad, (220, 220, 220))
+
+    screen.blits(blits, doreturn=False)
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Dict
+
+import pygame
+
+# Frames are composed on 32-bit SRCALPHA surfaces (SurfaceRing / SurfacePool), then
+# scaled onto the display; recording runs have no display at all. Images kept in the
+# same channel layout blit without a per-pixel format conversion.
+_REFS: Dict[bool, pygame.Surface] = {}
+
+
+def _ref(alpha: bool) -> pygame.Surface:
+    ref = _REFS.get(alpha)
+    if ref is None:
+        ref = pygame.Surface((1, 1), pygame.SRCALPHA if alpha else 0, 32)
+        _REFS[alpha] = ref
+    return ref
+
+
+def to_frame_format(surf: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """Convert surf to the pixel layout of the frame surfaces.
+
+    Works without a display mode. Pass alpha=False for opaque images such as the
+    background, which then blit as a straight copy.
+    """
+    try:
+        return surf.convert(_ref(bool(alpha)))
+    except Exception:
+        return surf
@@ -6,16 +6,9 @@ import pygame
 from typing import Any
 
 from ....assets.respack import Respack, load_respack_info
+from .pixel_format import to_frame_format
 
 
-def _maybe_convert_alpha(surf: pygame.Surface) -> pygame.Surface:
-    try:
-        if pygame.display.get_surface() is not None:
-            return surf.convert_alpha()
-    except:
-        pass
-    return surf
-
 def _parse_hex_rgba(v: Any, default: tuple[int, int, int, int]) -> tuple[int, int, int, int]:
     if v is None:
         return default
@@ -53,14 +46,14 @@ def load_respack(zip_path: str, *, audio: Any) -> Respack:
     ]
     img = {}
     for fn in required_imgs:
-        img[fn] = _maybe_convert_alpha(pygame.image.load(p(fn)))
+        img[fn] = to_frame_format(pygame.image.load(p(fn)))
 
     # Optional: GOOD hitfx atlas
     try:
         fn_good = "hit_fx.good.png"
         fp_good = p(fn_good)
         if os.path.exists(fp_good):
-            img[fn_good] = _maybe_convert_alpha(pygame.image.load(fp_good))
+            img[fn_good] = to_frame_format(pygame.image.load(fp_good))
     except Exception:
         pass
 
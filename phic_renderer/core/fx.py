@@ -11,3 +11,23 @@ def prune_hitfx(hitfx: List[HitFX], t: float, duration: float) -> List[HitFX]:
 
 def prune_particles(particles: List[ParticleBurst], now_ms: int) -> List[ParticleBurst]:
     return [p for p in particles if p.alive(now_ms)]
+
+
+def prune_hitfx_inplace(hitfx: List[HitFX], t: float, duration: float) -> None:
+    """prune_hitfx without building a new list; keeps survivors in order."""
+    w = 0
+    for fx in hitfx:
+        if (t - fx.t0) <= duration:
+            hitfx[w] = fx
+            w += 1
+    del hitfx[w:]
+
+
+def prune_particles_inplace(particles: List[ParticleBurst], now_ms: int) -> None:
+    """prune_particles without building a new list; keeps survivors in order."""
+    w = 0
+    for p in particles:
+        if now_ms < p.start + p.duration:
+            particles[w] = p
+            w += 1
+    del particles[w:]
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class RenderArgs(NamedTuple):
+    """Options the per-frame path reads from args, resolved once per run."""
+
+    judge_width: float
+    judge_height: float
+    flick_threshold: float
+    approach: float
+    hitfx_scale_mul: float
+    start_time: Optional[float]
+    line_alpha_affects_notes: str
+    debug_line_label: bool
+    basic_debug: bool
+    no_note_outline: bool
+    debug_note_info: bool
+    debug_particles: bool
+    hit_debug_cols: int
+    no_cull: bool
+    no_cull_screen: bool
+    no_cull_enter_time: bool
+    record_render_particles: bool
+    record_render_text: bool
+    advance_seq_overlay: bool
+    no_title_overlay: bool
+
+
+def _float_arg(args: Any, name: str, default: float) -> float:
+    try:
+        return float(getattr(args, name, default))
+    except Exception:
+        return float(default)
+
+
+# Keyed by id(args); cleared per run by invalidate_render_args().
+_CACHE: Dict[int, RenderArgs] = {}
+
+
+def render_args(args: Any) -> RenderArgs:
+    """Return the RenderArgs for args, resolving it on first use."""
+    ra = _CACHE.get(id(args))
+    if ra is None:
+        ra = RenderArgs(
+            judge_width=_float_arg(args, "judge_width", 0.12),
+            judge_height=_float_arg(args, "judge_height", 0.06),
+            flick_threshold=_float_arg(args, "flick_threshold", 0.02),
+            approach=float(getattr(args, "approach", 3.0)),
+            hitfx_scale_mul=float(getattr(args, "hitfx_scale_mul", 1.0)),
+            start_time=getattr(args, "start_time", None),
+            line_alpha_affects_notes=str(getattr(args, "line_alpha_affects_notes", "negative_only")),
+            debug_line_label=bool(getattr(args, "debug_line_label", False)),
+            basic_debug=bool(getattr(args, "basic_debug", False)),
+            no_note_outline=bool(getattr(args, "no_note_outline", False)),
+            debug_note_info=bool(getattr(args, "debug_note_info", False)),
+            debug_particles=bool(getattr(args, "debug_particles", False)),
+            hit_debug_cols=max(1, int(getattr(args, "hit_debug_cols", 5) or 5)),
+            no_cull=bool(getattr(args, "no_cull", False)),
+            no_cull_screen=bool(getattr(args, "no_cull_screen", False)),
+            no_cull_enter_time=bool(getattr(args, "no_cull_enter_time", False)),
+            record_render_particles=bool(getattr(args, "record_render_particles", False)),
+            record_render_text=bool(getattr(args, "record_render_text", False)),
+            advance_seq_overlay=bool(getattr(args, "advance_seq_overlay", False)),
+            no_title_overlay=bool(getattr(args, "no_title_overlay", False)),
+        )
+        _CACHE[id(args)] = ra
+    return ra
+
+
+def invalidate_render_args() -> None:
+    """Forget resolved args (call at the start of a run; args may be reused and mutated)."""
+    _CACHE.clear()
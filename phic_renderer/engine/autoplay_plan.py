@@ -0,0 +1,127 @@
+"""Per-note autoplay actions resolved once per chart.
+
+Autoplay used to look up the judge-script action, sanitize its grade and compute
+the shifted hit time for every note in its window on every frame. None of that
+depends on the frame, so it is resolved here once per (states, judge_plan) pair
+and the per-frame scan reduces to a binary search over the sorted fire times.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any, List, NamedTuple, Optional
+
+import numpy as np
+
+from ..types import NoteState
+from .judgment_helpers import sanitize_grade
+from .note_table import NoteTable, note_table_for
+
+
+class AutoplayPlan(NamedTuple):
+    """Resolved autoplay action per state index."""
+
+    table: NoteTable
+    t_fire: np.ndarray
+    t_fire_ms: List[int]
+    grade: List[Optional[str]]
+    hold_percent: List[float]
+    # Non-fake, non-hold state indices ordered by fire time, and those fire times.
+    fire_order: np.ndarray
+    fire_sorted: np.ndarray
+    # Non-fake hold state indices in chart order.
+    hold_rows: List[int]
+
+
+def build_autoplay_plan(states: List[NoteState], judge_plan: Any) -> AutoplayPlan:
+    """Resolve the autoplay grade, hit time and hold release point of every note.
+
+    Args:
+        states: Note states in chart order
+        judge_plan: JudgePlan from a judge script, or None for all-PERFECT autoplay
+
+    Returns:
+        AutoplayPlan indexed like states
+    """
+    tab = note_table_for(states)
+    n = len(states)
+    dt_ms = np.zeros(n, dtype=np.float64)
+    grades: List[Optional[str]] = [None] * n
+    hold_percent: List[float] = [1.0] * n
+    for i, s in enumerate(states):
+        note = s.note
+        act = None
+        if judge_plan is not None:
+            try:
+                act = judge_plan.action_for(note)
+            except Exception:
+                act = None
+        if act is None:
+            grade0 = "PERFECT"
+        else:
+            dt_ms[i] = float(getattr(act, "dt_ms", 0.0))
+            grade0 = getattr(act, "grade", None)
+            hp = getattr(act, "hold_percent", None)
+            if hp is not None:
+                hold_percent[i] = float(hp)
+        if (grade0 is not None) and str(grade0).upper() == "MISS":
+            grades[i] = "MISS"
+        else:
+            grades[i] = sanitize_grade(int(note.kind), grade0)
+    t_fire = tab.t_hit + dt_ms / 1000.0
+    live = ~tab.fake
+    taps = np.flatnonzero(live & (tab.kind != 3))
+    fire_order = taps[np.argsort(t_fire[taps], kind="stable")]
+    return AutoplayPlan(
+        table=tab,
+        t_fire=t_fire,
+        # Tick stamps for hit fx, particles and hitsounds; astype truncates like int().
+        t_fire_ms=(t_fire * 1000.0).astype(np.int64).tolist(),
+        grade=grades,
+        hold_percent=hold_percent,
+        fire_order=fire_order,
+        fire_sorted=t_fire[fire_order],
+        hold_rows=np.flatnonzero(live & (tab.kind == 3)).tolist(),
+    )
+
+
+# Single-slot cache: states and judge_plan are rebuilt together per chart/segment.
+_PLAN = {"states": None, "judge_plan": None, "plan": None}
+
+
+def autoplay_plan_for(states: List[NoteState], judge_plan: Any) -> AutoplayPlan:
+    """Return the AutoplayPlan for states/judge_plan, rebuilding it when either changes."""
+    plan = _PLAN["plan"]
+    if (
+        plan is None
+        or _PLAN["states"] is not states
+        or _PLAN["judge_plan"] is not judge_plan
+        or plan.table is not note_table_for(states)
+    ):
+        plan = build_autoplay_plan(states, judge_plan)
+        _PLAN["plan"] = plan
+        _PLAN["states"] = states
+        _PLAN["judge_plan"] = judge_plan
+    return plan
+
+
+def autoplay_candidates(plan: AutoplayPlan, lo: int, hi: int, t_prev: float, t: float) -> List[int]:
+    """State indices in [lo, hi) that autoplay may act on between t_prev and t, in chart order.
+
+    Non-hold notes only matter when their fire time falls in (t_prev, t], which is one
+    binary-searched slice of the fire-time order; holds are always returned because
+    their press/release state lives on NoteState. Fake notes are dropped. The caller
+    still skips states that are already judged.
+    """
+    if hi <= lo:
+        return []
+    lo = int(lo)
+    hi = int(hi)
+    fs = plan.fire_sorted
+    a = int(np.searchsorted(fs, float(t_prev), side="right"))
+    b = int(np.searchsorted(fs, float(t), side="right"))
+    rows = [i for i in plan.fire_order[a:b].tolist() if lo <= i < hi]
+    holds = plan.hold_rows
+    rows.extend(holds[bisect_left(holds, lo):bisect_left(holds, hi)])
+    rows.sort()
+    return rows
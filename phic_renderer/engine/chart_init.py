@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from ..types import RuntimeNote
 from ..assets.loader import load_chart
 from ..assets.chartpack import load_chart_pack
@@ -35,15 +37,24 @@ def filter_notes_by_time(
 
 def group_simultaneous_notes(notes: List[RuntimeNote], eps: float = 1e-4):
     """Mark notes that hit at the same time as multi-hit (mh)."""
-    i = 0
-    while i < len(notes):
-        j = i + 1
-        while j < len(notes) and abs(notes[j].t_hit - notes[i].t_hit) <= eps:
+    n = len(notes)
+    if n < 2:
+        return
+    t_hit = np.fromiter((x.t_hit for x in notes), dtype=np.float64, count=n)
+    # A group can only start where the next note is within eps, so walk just those
+    # starts; the span test is the same as before (against the group's first note).
+    starts = np.flatnonzero(np.abs(np.diff(t_hit)) <= eps)
+    pos = 0
+    for i in starts.tolist():
+        if i < pos:
+            continue
+        t0 = t_hit[i]
+        j = i + 2
+        while j < n and abs(t_hit[j] - t0) <= eps:
             j += 1
-        if (j - i) >= 2:
-            for k in range(i, j):
-                notes[k].mh = True
-        i = j
+        for k in range(i, j):
+            notes[k].mh = True
+        pos = j
 
 
 def compute_total_notes(
@@ -2,46 +2,59 @@ from __future__ import annotations
 
 import math
 import random as _rnd
-from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple
 
-@dataclass
 class HitFX:
-    x: float
-    y: float
-    t0: float
-    rgba: Tuple[int, int, int, int]
-    rot: float
-    variant: str = ""
+    __slots__ = ("x", "y", "t0", "rgba", "rot", "variant")
+
+    def __init__(self, x: float, y: float, t0: float, rgba: Tuple[int, int, int, int],
+                 rot: float, variant: str = ""):
+        self.x = x
+        self.y = y
+        self.t0 = t0
+        self.rgba = rgba
+        self.rot = rot
+        self.variant = variant
 
 
 class ParticleBurst:
+    # Dense sections spawn a burst per hit; slots keep each one a small fixed record.
+    __slots__ = ("x", "y", "start", "duration", "rgba", "pa")
+
     def __init__(self, x: float, y: float, start_ms: int, duration_ms: int,
                  rgba: Tuple[int, int, int, int], count: int = 4):
-        import random as _rnd
         self.x, self.y = float(x), float(y)
         self.start = int(start_ms)
         self.duration = max(1, int(duration_ms))
         self.rgba = rgba
-        self.pa = [(_rnd.uniform(185, 265), _rnd.uniform(0, 2 * math.pi))
-                   for _ in range(max(1, count))]
+        # (speed, cos, sin) per particle: the direction is fixed, so its trig is done once.
+        pa = []
+        for _ in range(max(1, count)):
+            spd = _rnd.uniform(185, 265)
+            ang = _rnd.uniform(0, 2 * math.pi)
+            pa.append((spd, math.cos(ang), math.sin(ang)))
+        self.pa = pa
 
     def alive(self, now_ms: int) -> bool:
         return now_ms < self.start + self.duration
 
-    def get_particles(self, now_ms: int) -> List[Dict[str, Any]]:
+    def frame(self, now_ms: int) -> Tuple[int, int, float]:
+        """(alpha, size, spread) at now_ms; a particle sits speed * spread / 2 from (x, y)."""
         tick = (now_ms - self.start) / self.duration
         tick = 0.0 if tick < 0 else 1.0 if tick > 1 else tick
         alpha = int(255 * (1 - tick))
         size = 30 * (((0.2078 * tick - 1.6524) * tick + 1.6399) * tick + 0.4988)
-        size = max(2, int(size))
+        return alpha, max(2, int(size)), 9 * tick / (8 * tick + 1)
+
+    def get_particles(self, now_ms: int) -> List[Dict[str, Any]]:
+        alpha, size, spread = self.frame(now_ms)
         r, g, b, _ = self.rgba
 
         particles = []
-        for spd, ang in self.pa:
-            dist = spd * (9 * tick / (8 * tick + 1)) / 2
-            px = self.x + dist * math.cos(ang)
-            py = self.y + dist * math.sin(ang)
+        for spd, ca, sa in self.pa:
+            dist = spd * spread / 2
+            px = self.x + dist * ca
+            py = self.y + dist * sa
             particles.append({
                 'x': int(px),
                 'y': int(py),
@@ -49,3 +62,28 @@ class ParticleBurst:
                 'color': (r, g, b, alpha)
             })
         return particles
+
+
+_WHITE = (255, 255, 255, 255)
+# tintHitEffects rgb -> rgba; charts use a handful of distinct tints.
+_TINT_RGBA: Dict[Tuple[int, int, int], Tuple[int, int, int, int]] = {}
+
+
+def hitfx_color(note: Any, respack: Any, grade: str = "PERFECT") -> Tuple[int, int, int, int]:
+    """Hit effect color of a note: its tintHitEffects if set, else the respack judge color.
+
+    Falls back to the PERFECT color for grades the respack has no color for, and to
+    white without a respack.
+    """
+    tint = note.tint_hitfx_rgb
+    if tint is not None:
+        c = _TINT_RGBA.get(tint)
+        if c is None:
+            rr, gg, bb = tint
+            c = (int(rr), int(gg), int(bb), 255)
+            _TINT_RGBA[tint] = c
+        return c
+    if not respack:
+        return _WHITE
+    colors = respack.judge_colors
+    return colors.get(grade) or colors.get("PERFECT") or _WHITE
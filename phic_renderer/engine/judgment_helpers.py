@@ -6,51 +6,46 @@ from .judge import JUDGE_WEIGHT
 from ..types import NoteState
 
 
+# Accepted grades per note kind: 1 tap, 2 drag, 3 hold, 4 flick.
+_GRADE_BY_KIND = {
+    1: {"PERFECT": "PERFECT", "GOOD": "GOOD", "BAD": "BAD"},
+    2: {"PERFECT": "PERFECT", "GOOD": "PERFECT"},
+    3: {"PERFECT": "PERFECT", "GOOD": "GOOD", "BAD": "GOOD"},
+    4: {"PERFECT": "PERFECT", "GOOD": "PERFECT"},
+}
+_NO_GRADES: dict = {}
+
+# grade -> (accuracy weight, breaks combo)
+_GRADE_EFFECT = {
+    "PERFECT": (JUDGE_WEIGHT.get("PERFECT", 1.0), False),
+    "GOOD": (JUDGE_WEIGHT.get("GOOD", 0.6), False),
+    "BAD": (JUDGE_WEIGHT.get("BAD", 0.0), True),
+}
+
+
 def sanitize_grade(note_kind: int, grade: Optional[str]) -> Optional[str]:
     """Sanitize a grade string based on note kind rules."""
     if grade is None:
         return None
-    g = str(grade).upper()
-    k = int(note_kind)
-    if k in (2, 4):
-        return "PERFECT" if g in ("PERFECT", "GOOD") else None
-    if k == 3:
-        if g == "PERFECT":
-            return "PERFECT"
-        if g in ("GOOD", "BAD"):
-            return "GOOD"
-        return None
-    if k == 1:
-        if g in ("PERFECT", "GOOD", "BAD"):
-            return g
-        return None
-    return None
+    return _GRADE_BY_KIND.get(int(note_kind), _NO_GRADES).get(str(grade).upper())
 
 
 def apply_grade(s: NoteState, grade: str, judge: Any):
     """Apply a grade to a note state and update judge accordingly."""
-    g = str(grade).upper()
-    if g == "PERFECT":
-        judge.bump()
-        s.judged = True
-        s.hit = True
-        judge.acc_sum += JUDGE_WEIGHT.get("PERFECT", 1.0)
-        judge.judged_cnt += 1
-        return
-    if g == "GOOD":
-        judge.bump()
-        s.judged = True
-        s.hit = True
-        judge.acc_sum += JUDGE_WEIGHT.get("GOOD", 0.6)
-        judge.judged_cnt += 1
-        return
-    if g == "BAD":
+    eff = _GRADE_EFFECT.get(grade)
+    if eff is None:
+        eff = _GRADE_EFFECT.get(str(grade).upper())
+        if eff is None:
+            return
+    weight, breaks = eff
+    if breaks:
         judge.break_combo()
-        s.judged = True
-        s.hit = True
-        judge.acc_sum += JUDGE_WEIGHT.get("BAD", 0.0)
-        judge.judged_cnt += 1
-        return
+    else:
+        judge.bump()
+    s.judged = True
+    s.hit = True
+    judge.acc_sum += weight
+    judge.judged_cnt += 1
 
 
 def finalize_hold(
@@ -80,16 +75,14 @@ def finalize_hold(
             s.hold_failed = True
             judge.break_combo()
         else:
-            g = s.hold_grade or "PERFECT"
-            judge.acc_sum += JUDGE_WEIGHT.get(g, 0.0)
+            judge.acc_sum += s.hold_weight
             judge.judged_cnt += 1
             s.hold_finalized = True
             return True
 
     if t >= n.t_end and (not s.hold_finalized):
         if s.hit and (not s.hold_failed):
-            g = s.hold_grade or "PERFECT"
-            judge.acc_sum += JUDGE_WEIGHT.get(g, 0.0)
+            judge.acc_sum += s.hold_weight
             judge.judged_cnt += 1
         else:
             judge.mark_miss(s)
@@ -123,16 +116,10 @@ def check_hold_release(
         except:
             prog_r = 0.0
         s.released_early = True
-        try:
-            setattr(s, "release_t", float(t))
-            setattr(s, "release_percent", float(prog_r))
-        except:
-            pass
+        s.release_t = float(t)
+        s.release_percent = float(prog_r)
         if float(prog_r) < float(hold_tail_tol):
-            try:
-                setattr(s, "miss_t", float(t))
-            except:
-                pass
+            s.miss_t = float(t)
             s.miss = True
             s.judged = True
             s.hold_failed = True
@@ -153,8 +140,5 @@ def detect_miss(s: NoteState, t: float, judge: Any, miss_window: float):
     if s.note.kind == 3:
         return
     if t > s.note.t_hit + miss_window:
-        try:
-            setattr(s, "miss_t", float(t))
-        except:
-            pass
+        s.miss_t = float(t)
         judge.mark_miss(s)
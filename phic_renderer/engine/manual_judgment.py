@@ -1,12 +1,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from ..runtime.judge import Judge
-from ..runtime.kinematics import eval_line_state, note_world_pos
+import numpy as np
+
+from ..core.render_args import render_args
+from ..runtime.judge import JUDGE_WEIGHT, Judge
+from ..runtime.effects import hitfx_color
+from ..runtime.kinematics import LineStateMemo, note_world_pos
 from ..types import NoteState, RuntimeLine, RuntimeNote
 from .judgment_helpers import apply_grade
+from .note_table import kind_index, note_table_for
+
+try:
+    from numba import njit  # type: ignore
+
+    _NUMBA_OK = True
+except Exception:  # pragma: no cover
+    njit = None  # type: ignore
+    _NUMBA_OK = False
 
 
 @dataclass
@@ -14,70 +27,98 @@ class ManualJudgementConfig:
     judge_width_ratio: float
 
 
-def _note_xy_at_time(lines: List[RuntimeLine], n: RuntimeNote, tt: float) -> Tuple[float, float]:
-    ln = lines[int(n.line_id)]
-    lx, ly, lr, la01, sc_now, la_raw = eval_line_state(ln, tt)
+def _note_xy_at_time(line_state: LineStateMemo, n: RuntimeNote) -> Tuple[float, float]:
+    lx, ly, lr, la01, sc_now, la_raw = line_state(int(n.line_id))
     scroll_target = float(n.scroll_hit)
     xw, yw = note_world_pos(lx, ly, lr, sc_now, n, scroll_target, for_tail=False)
     return float(xw), float(yw)
 
 
 def _in_judge_rect(
-    lines: List[RuntimeLine],
+    line_state: LineStateMemo,
     n: RuntimeNote,
-    tt: float,
     pointer_x: Optional[float],
     pointer_y: Optional[float],
-    judge_w_px: float,
-    judge_h_px: float,
+    half_w: float,
+    half_h: float,
 ) -> bool:
     if pointer_x is None and pointer_y is None:
         return True
     try:
-        nx, ny = _note_xy_at_time(lines, n, tt)
+        nx, ny = _note_xy_at_time(line_state, n)
     except Exception:
         return True
-    okx = True
-    oky = True
-    if pointer_x is not None:
-        okx = abs(float(pointer_x) - float(nx)) <= float(judge_w_px) * 0.5
-    if pointer_y is not None:
-        oky = abs(float(pointer_y) - float(ny)) <= float(judge_h_px) * 0.5
-    return bool(okx and oky)
+    if pointer_x is not None and abs(pointer_x - nx) > half_w:
+        return False
+    return pointer_y is None or abs(pointer_y - ny) <= half_h
+
+
+def _candidate_rows(t_hit, kind, fake, t, st0, st1, allow_mask, bad):
+    """State indices in [st0, st1) of non-fake notes of an allowed kind within bad of t.
+
+    Nearest first; the stable sort keeps chart order among equal dt, like the old
+    first-wins scan.
+    """
+    rows = np.empty(st1 - st0, dtype=np.int64)
+    dts = np.empty(st1 - st0, dtype=np.float64)
+    k = 0
+    for i in range(st0, st1):
+        if fake[i] or not ((allow_mask >> kind[i]) & 1):
+            continue
+        dt = abs(t - t_hit[i])
+        if dt <= bad:
+            rows[k] = i
+            dts[k] = dt
+            k += 1
+    return rows[:k][np.argsort(dts[:k], kind="mergesort")]
+
+
+_candidate_rows_impl = njit(cache=True)(_candidate_rows) if _NUMBA_OK else None
 
 
 def _pick_best_candidate(
     *,
     states: List[NoteState],
     idx_next: int,
-    allow_kinds: Set[int],
+    allow_mask: int,
     t: float,
     pointer_x: Optional[float],
     pointer_y: Optional[float],
-    judge_w_px: float,
-    judge_h_px: float,
-    lines: List[RuntimeLine],
+    half_w: float,
+    half_h: float,
+    line_state: LineStateMemo,
 ) -> Optional[NoteState]:
-    best_s: Optional[NoteState] = None
-    best_dt = 1e9
+    """Closest unjudged note of an allowed kind within the BAD window and judge rect.
+
+    allow_mask has bit k set for each allowed note kind k (e.g. 1 << 1 for taps).
+    Timing, kind and fake are filtered over the note table (in one numba loop when
+    available, else as one NumPy mask); only the few survivors are checked for
+    judged and, nearest first, against the judge rect.
+    """
     st0 = max(0, int(idx_next) - 80)
     st1 = min(len(states), int(idx_next) + 900)
-    for si in range(st0, st1):
+    if st1 <= st0:
+        return None
+    tab = note_table_for(states)
+    if _candidate_rows_impl is not None:
+        rows = _candidate_rows_impl(
+            tab.t_hit, tab.kind, tab.fake, float(t), st0, st1, int(allow_mask), float(Judge.BAD)
+        )
+    else:
+        dt = np.abs(float(t) - tab.t_hit[st0:st1])
+        mask = (dt <= float(Judge.BAD)) & ~tab.fake[st0:st1] & ((int(allow_mask) >> tab.kind[st0:st1]) & 1).astype(np.bool_)
+        rows = np.flatnonzero(mask)
+        # Stable sort keeps chart order among equal dt, like the old first-wins scan.
+        rows = rows[np.argsort(dt[rows], kind="stable")] + st0
+    if rows.size == 0:
+        return None
+    for si in rows.tolist():
         s = states[si]
-        if s.judged or s.note.fake:
-            continue
-        n = s.note
-        if int(n.kind) not in allow_kinds:
-            continue
-        dt = abs(float(t) - float(n.t_hit))
-        if dt > float(Judge.BAD):
-            continue
-        if not _in_judge_rect(lines, n, float(t), pointer_x, pointer_y, float(judge_w_px), float(judge_h_px)):
+        if s.judged:
             continue
-        if dt < best_dt:
-            best_dt = dt
-            best_s = s
-    return best_s
+        if _in_judge_rect(line_state, s.note, pointer_x, pointer_y, half_w, half_h):
+            return s
+    return None
 
 
 def apply_manual_judgement(
@@ -109,20 +150,24 @@ def apply_manual_judgement(
     hold_like_down: bool,
     press_edge: bool,
     pointers: Any = None,  # NEW: pass pointers manager for area judgment
+    line_state: Optional[LineStateMemo] = None,
 ) -> None:
-    try:
-        judge_w_px = float(getattr(args, "judge_width", 0.12)) * float(W)
-    except Exception:
-        judge_w_px = 0.12 * float(W)
+    if line_state is None:
+        line_state = LineStateMemo(lines, t)
+    ra = render_args(args)
+    judge_w_px = ra.judge_width * float(W)
     if judge_w_px < 1.0:
         judge_w_px = 1.0
-
-    try:
-        judge_h_px = float(getattr(args, "judge_height", 0.06)) * float(H)
-    except Exception:
-        judge_h_px = 0.06 * float(H)
+    judge_h_px = ra.judge_height * float(H)
     if judge_h_px < 1.0:
         judge_h_px = 1.0
+    half_w = judge_w_px * 0.5
+    half_h = judge_h_px * 0.5
+    good_s = float(Judge.GOOD)
+    perfect_s = float(Judge.PERFECT)
+    bad_s = float(Judge.BAD)
+    t_ms = int(t * 1000.0)
+    flick_threshold_px = ra.flick_threshold * float(min(int(W), int(H)))
 
     # 1) discrete gesture judgement (tap/flick) + in-progress flick detection
     cand = None
@@ -131,13 +176,13 @@ def apply_manual_judgement(
             cand = _pick_best_candidate(
                 states=states,
                 idx_next=idx_next,
-                allow_kinds={1},
+                allow_mask=1 << 1,
                 t=float(t),
                 pointer_x=pointer_x,
                 pointer_y=pointer_y,
-                judge_w_px=float(judge_w_px),
-                judge_h_px=float(judge_h_px),
-                lines=lines,
+                half_w=half_w,
+                half_h=half_h,
+                line_state=line_state,
             )
         elif gesture == "flick":
             fx = pointer_start_x if pointer_start_x is not None else pointer_x
@@ -145,40 +190,33 @@ def apply_manual_judgement(
             cand = _pick_best_candidate(
                 states=states,
                 idx_next=idx_next,
-                allow_kinds={4},
+                allow_mask=1 << 4,
                 t=float(t),
                 pointer_x=fx,
                 pointer_y=fy,
-                judge_w_px=float(judge_w_px),
-                judge_h_px=float(judge_h_px),
-                lines=lines,
+                half_w=half_w,
+                half_h=half_h,
+                line_state=line_state,
             )
     elif hold_like_down and (pointer_start_y is not None) and (pointer_y is not None):
         # In-progress flick detection: pointer is down and has moved vertically >= threshold
         # This allows flick notes to be hit while pointer is still down (for flick+hold combos)
         try:
-            flick_threshold_ratio = 0.02
-            try:
-                flick_threshold_ratio = float(getattr(args, "flick_threshold", 0.02))
-            except Exception:
-                pass
-            flick_threshold_px = float(flick_threshold_ratio) * float(min(int(W), int(H)))
-
             vertical_dist = abs(float(pointer_y) - float(pointer_start_y))
-            if vertical_dist >= float(flick_threshold_px):
+            if vertical_dist >= flick_threshold_px:
                 # Pointer has moved enough vertically, check for flick notes
                 fx = pointer_start_x if pointer_start_x is not None else pointer_x
                 fy = pointer_start_y if pointer_start_y is not None else pointer_y
                 cand = _pick_best_candidate(
                     states=states,
                     idx_next=idx_next,
-                    allow_kinds={4},
+                    allow_mask=1 << 4,
                     t=float(t),
                     pointer_x=fx,
                     pointer_y=fy,
-                    judge_w_px=float(judge_w_px),
-                    judge_h_px=float(judge_h_px),
-                    lines=lines,
+                    half_w=half_w,
+                    half_h=half_h,
+                    line_state=line_state,
                 )
         except Exception:
             pass
@@ -196,25 +234,14 @@ def apply_manual_judgement(
             if grade is None:
                 return
             apply_grade(cand, str(grade), judge)
-            ln = lines[n.line_id]
-            lx, ly, lr, la01, sc_now, la_raw = eval_line_state(ln, t)
+            lx, ly, lr, la01, sc_now, la_raw = line_state(n.line_id)
             x, y = note_world_pos(lx, ly, lr, sc_now, n, n.scroll_hit, for_tail=False)
-            c = (255, 255, 255, 255)
-            if getattr(n, "tint_hitfx_rgb", None) is not None:
-                rr, gg, bb = n.tint_hitfx_rgb
-                c = (int(rr), int(gg), int(bb), 255)
-            elif respack:
-                c = (
-                    respack.judge_colors.get(grade)
-                    or respack.judge_colors.get("GOOD")
-                    or respack.judge_colors.get("PERFECT")
-                    or c
-                )
+            c = hitfx_color(n, respack, grade)
             var = "good" if str(grade).upper() == "GOOD" else ""
             hitfx.append(HitFX_cls(x, y, t, c, lr, var))
             if respack and (not respack.hide_particles):
-                particles.append(ParticleBurst_cls(x, y, int(t * 1000.0), int(respack.hitfx_duration * 1000), c))
-            mark_line_hit_cb(n.line_id, int(t * 1000.0))
+                particles.append(ParticleBurst_cls(x, y, t_ms, int(respack.hitfx_duration * 1000), c))
+            mark_line_hit_cb(n.line_id, t_ms)
             push_hit_debug_cb(
                 t_now=float(t),
                 t_hit=float(n.t_hit),
@@ -226,7 +253,7 @@ def apply_manual_judgement(
                 source="manual",
             )
             if not record_enabled:
-                hitsound.play(n, int(t * 1000.0), respack=respack)
+                hitsound.play(n, t_ms, respack=respack)
 
     # 2) continuous drag judgement: ANY pointer holding down can judge kind=2
     # NEW: Area-based drag judgment - check ALL active pointers, not just current one
@@ -236,15 +263,12 @@ def apply_manual_judgement(
         drag_candidates: List[NoteState] = []
         st0 = max(0, int(idx_next) - 80)
         st1 = min(len(states), int(idx_next) + 900)
-        for si in range(st0, st1):
+        for si in kind_index(note_table_for(states), 2).window(states, st0, st1):  # Only drags
             s = states[si]
-            if s.judged or s.note.fake:
+            if s.judged:
                 continue
             n = s.note
-            if int(n.kind) != 2:  # Only drags
-                continue
-            dt = abs(float(t) - float(n.t_hit))
-            if dt > float(Judge.GOOD):
+            if abs(t - n.t_hit) > good_s:
                 continue
             drag_candidates.append(s)
 
@@ -255,15 +279,14 @@ def apply_manual_judgement(
 
             # Get note position
             try:
-                ln = lines[n.line_id]
-                lx, ly, lr, la01, sc_now, la_raw = eval_line_state(ln, t)
+                lx, ly, lr, la01, sc_now, la_raw = line_state(n.line_id)
                 nx, ny = note_world_pos(lx, ly, lr, sc_now, n, n.scroll_hit, for_tail=False)
             except Exception:
                 continue
 
             # Check current pointer first
             if pointer_x is not None and pointer_y is not None:
-                if _in_judge_rect(lines, n, float(t), pointer_x, pointer_y, float(judge_w_px), float(judge_h_px)):
+                if _in_judge_rect(line_state, n, pointer_x, pointer_y, half_w, half_h):
                     judged_by_pointer = True
 
             # If current pointer didn't hit, check ALL other active pointers
@@ -277,8 +300,8 @@ def apply_manual_judgement(
                         if px is None or py is None:
                             continue
                         # Check if this pointer is in judgment area
-                        if abs(float(px) - float(nx)) <= float(judge_w_px) * 0.5:
-                            if abs(float(py) - float(ny)) <= float(judge_h_px) * 0.5:
+                        if abs(px - nx) <= half_w:
+                            if abs(py - ny) <= half_h:
                                 judged_by_pointer = True
                                 break
                 except Exception:
@@ -287,16 +310,11 @@ def apply_manual_judgement(
             # If any pointer hit this drag, judge it
             if judged_by_pointer:
                 apply_grade(cand_drag, "PERFECT", judge)
-                c = (255, 255, 255, 255)
-                if getattr(n, "tint_hitfx_rgb", None) is not None:
-                    rr, gg, bb = n.tint_hitfx_rgb
-                    c = (int(rr), int(gg), int(bb), 255)
-                elif respack:
-                    c = respack.judge_colors.get("PERFECT", c)
+                c = hitfx_color(n, respack)
                 hitfx.append(HitFX_cls(nx, ny, t, c, lr, ""))
                 if respack and (not respack.hide_particles):
-                    particles.append(ParticleBurst_cls(nx, ny, int(t * 1000.0), int(respack.hitfx_duration * 1000), c))
-                mark_line_hit_cb(n.line_id, int(t * 1000.0))
+                    particles.append(ParticleBurst_cls(nx, ny, t_ms, int(respack.hitfx_duration * 1000), c))
+                mark_line_hit_cb(n.line_id, t_ms)
                 push_hit_debug_cb(
                     t_now=float(t),
                     t_hit=float(n.t_hit),
@@ -308,7 +326,7 @@ def apply_manual_judgement(
                     source="manual_area",
                 )
                 if not record_enabled:
-                    hitsound.play(n, int(t * 1000.0), respack=respack)
+                    hitsound.play(n, t_ms, respack=respack)
 
     # 3) hold head judgement: press_edge OR in-progress flick triggers kind=3
     # Support hold (head: flick) combinations - detect vertical movement while pointer is still down
@@ -318,18 +336,10 @@ def apply_manual_judgement(
     elif hold_like_down and (pointer_start_y is not None) and (pointer_y is not None):
         # In-progress flick detection: pointer is down and has moved vertically >= threshold
         # This allows "press and slide" to trigger hold heads that require flick
+        # (flick_threshold_px matches the PointerManager flick logic)
         try:
-            from ..backends.pygame.input.pointer import PointerManager
-            # Calculate flick threshold (matches PointerManager logic)
-            flick_threshold_ratio = 0.02
-            try:
-                flick_threshold_ratio = float(getattr(args, "flick_threshold", 0.02))
-            except Exception:
-                pass
-            flick_threshold_px = float(flick_threshold_ratio) * float(min(int(W), int(H)))
-
             vertical_dist = abs(float(pointer_y) - float(pointer_start_y))
-            if vertical_dist >= float(flick_threshold_px):
+            if vertical_dist >= flick_threshold_px:
                 should_try_hold = True
         except Exception:
             pass
@@ -338,47 +348,34 @@ def apply_manual_judgement(
         cand_hold = _pick_best_candidate(
             states=states,
             idx_next=idx_next,
-            allow_kinds={3},
+            allow_mask=1 << 3,
             t=float(t),
             pointer_x=pointer_x,
             pointer_y=pointer_y,
-            judge_w_px=float(judge_w_px),
-            judge_h_px=float(judge_h_px),
-            lines=lines,
+            half_w=half_w,
+            half_h=half_h,
+            line_state=line_state,
         )
         if cand_hold is not None:
             n = cand_hold.note
-            dt = abs(float(t) - float(n.t_hit))
-            grade_h = "PERFECT" if dt <= float(Judge.PERFECT) else ("GOOD" if dt <= float(Judge.BAD) else None)
+            dt = abs(t - n.t_hit)
+            grade_h = "PERFECT" if dt <= perfect_s else ("GOOD" if dt <= bad_s else None)
             if grade_h is not None:
                 cand_hold.hit = True
                 cand_hold.holding = True
                 cand_hold.hold_grade = str(grade_h)
-                try:
-                    setattr(cand_hold, "hold_pointer_id", int(pointer_id))
-                except Exception:
-                    pass
+                cand_hold.hold_weight = JUDGE_WEIGHT.get(cand_hold.hold_grade, 0.0)
+                cand_hold.hold_pointer_id = int(pointer_id)
                 judge.bump()
-                cand_hold.next_hold_fx_ms = int(t * 1000.0) + int(hold_fx_interval_ms)
-                ln = lines[n.line_id]
-                lx, ly, lr, la01, sc_now, la_raw = eval_line_state(ln, t)
+                cand_hold.next_hold_fx_ms = t_ms + int(hold_fx_interval_ms)
+                lx, ly, lr, la01, sc_now, la_raw = line_state(n.line_id)
                 x, y = note_world_pos(lx, ly, lr, sc_now, n, n.scroll_hit, for_tail=False)
-                c = (255, 255, 255, 255)
-                if getattr(n, "tint_hitfx_rgb", None) is not None:
-                    rr, gg, bb = n.tint_hitfx_rgb
-                    c = (int(rr), int(gg), int(bb), 255)
-                elif respack:
-                    c = (
-                        respack.judge_colors.get(grade_h)
-                        or respack.judge_colors.get("GOOD")
-                        or respack.judge_colors.get("PERFECT")
-                        or c
-                    )
+                c = hitfx_color(n, respack, grade_h)
                 var = "good" if str(grade_h).upper() == "GOOD" else ""
                 hitfx.append(HitFX_cls(x, y, t, c, lr, var))
                 if respack and (not respack.hide_particles):
-                    particles.append(ParticleBurst_cls(x, y, int(t * 1000.0), int(respack.hitfx_duration * 1000), c))
-                mark_line_hit_cb(n.line_id, int(t * 1000.0))
+                    particles.append(ParticleBurst_cls(x, y, t_ms, int(respack.hitfx_duration * 1000), c))
+                mark_line_hit_cb(n.line_id, t_ms)
                 push_hit_debug_cb(
                     t_now=float(t),
                     t_hit=float(n.t_hit),
@@ -391,4 +388,4 @@ def apply_manual_judgement(
                     source="manual_hold",
                 )
                 if not record_enabled:
-                    hitsound.play(n, int(t * 1000.0), respack=respack)
+                    hitsound.play(n, t_ms, respack=respack)
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from typing import Any, Callable, List, Optional
 
+import numpy as np
+
 from ..types import NoteState
+from .note_table import kind_index, note_table_for
 
 
 def detect_misses(
@@ -16,17 +19,19 @@ def detect_misses(
 ):
     st0 = max(0, int(idx_next) - 200)
     st1 = min(len(states), int(idx_next) + 800)
-    for si in range(st0, st1):
+    tab = note_table_for(states)
+    if tab.t_hit_sorted:
+        # Everything at or after the first note still inside its window cannot miss yet.
+        st1 = min(st1, int(np.searchsorted(tab.t_hit, float(t) - float(miss_window), side="left")))
+    if st1 <= st0:
+        return
+    # Non-fake, non-hold notes only; already-judged ones at the front are skipped for good.
+    for si in kind_index(tab, 3, negate=True).window(states, st0, st1):
         s = states[si]
-        if s.judged or s.note.fake:
-            continue
-        if s.note.kind == 3:
+        if s.judged:
             continue
         if float(t) > float(s.note.t_hit) + float(miss_window):
-            try:
-                setattr(s, "miss_t", float(t))
-            except Exception:
-                pass
+            s.miss_t = float(t)
             judge.mark_miss(s)
             if report_event_cb is not None:
                 try:
@@ -0,0 +1,226 @@
+"""Column-oriented view of per-note constants.
+
+NoteState objects stay the single owner of mutable judge flags (judged, hit,
+holding, miss, ...), since judge, hold and backend code all write them. The
+fields those loops only *read* (timing, kind, fake, placement) are copied once per chart
+into parallel NumPy arrays so per-frame scans can be filtered with one mask
+instead of an attribute lookup per note.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from ..types import NoteState
+
+
+class NoteTable(NamedTuple):
+    """Parallel arrays indexed like ``states``."""
+
+    t_hit: np.ndarray
+    t_end: np.ndarray
+    t_enter: np.ndarray
+    kind: np.ndarray
+    fake: np.ndarray
+    line_id: np.ndarray
+    x_local: np.ndarray
+    y_offset: np.ndarray
+    side: np.ndarray
+    scroll_hit: np.ndarray
+    scroll_end: np.ndarray
+    speed_mul: np.ndarray
+    size_px: np.ndarray
+    alpha01: np.ndarray
+    t_enter_suffix_min: np.ndarray
+    t_hit_sorted: bool
+
+
+def build_note_table(states: Sequence[NoteState]) -> NoteTable:
+    """Build the column view for a list of note states.
+
+    Args:
+        states: Note states in chart order
+
+    Returns:
+        NoteTable with one row per state
+    """
+    notes = [s.note for s in states]
+    n = len(notes)
+    t_hit = np.fromiter((float(x.t_hit) for x in notes), dtype=np.float64, count=n)
+    t_enter = np.fromiter((float(x.t_enter) for x in notes), dtype=np.float64, count=n)
+    return NoteTable(
+        t_hit=t_hit,
+        t_end=np.fromiter((float(x.t_end) for x in notes), dtype=np.float64, count=n),
+        t_enter=t_enter,
+        kind=np.fromiter((int(x.kind) for x in notes), dtype=np.int8, count=n),
+        fake=np.fromiter((bool(x.fake) for x in notes), dtype=np.bool_, count=n),
+        line_id=np.fromiter((int(x.line_id) for x in notes), dtype=np.int32, count=n),
+        x_local=np.fromiter((float(x.x_local_px) for x in notes), dtype=np.float64, count=n),
+        y_offset=np.fromiter((float(x.y_offset_px) for x in notes), dtype=np.float64, count=n),
+        side=np.fromiter((1.0 if x.above else -1.0 for x in notes), dtype=np.float64, count=n),
+        scroll_hit=np.fromiter((float(x.scroll_hit) for x in notes), dtype=np.float64, count=n),
+        scroll_end=np.fromiter((float(getattr(x, "scroll_end", 0.0)) for x in notes), dtype=np.float64, count=n),
+        speed_mul=np.fromiter((max(0.0, float(x.speed_mul)) for x in notes), dtype=np.float64, count=n),
+        size_px=np.fromiter((float(x.size_px) for x in notes), dtype=np.float64, count=n),
+        alpha01=np.clip(np.fromiter((float(x.alpha01) for x in notes), dtype=np.float64, count=n), 0.0, 1.0),
+        # min(t_enter[i:]) is non-decreasing, so it can be binary searched.
+        t_enter_suffix_min=np.minimum.accumulate(t_enter[::-1])[::-1],
+        t_hit_sorted=bool(np.all(t_hit[1:] >= t_hit[:-1])),
+    )
+
+
+# Single-slot cache: the backend rebuilds ``states`` as a new list per chart/segment.
+_TABLE = {"states": None, "table": None}
+
+
+def note_table_for(states: List[NoteState]) -> NoteTable:
+    """Return the NoteTable for states, rebuilding it when the list changes."""
+    if _TABLE["states"] is not states or len(_TABLE["table"].t_hit) != len(states):
+        _TABLE["table"] = build_note_table(states)
+        _TABLE["states"] = states
+    return _TABLE["table"]
+
+
+# Single-slot cache: one mask per NoteTable, i.e. per states list.
+_RETIRED = {"table": None, "mask": None}
+
+
+def retired_mask(tab: NoteTable) -> np.ndarray:
+    """Writable per-note flags for notes that will never be drawn again.
+
+    Once a note is judged (or a hold finalized) without a MISS it is done until its
+    judge flags are cleared. The renderer sets these flags as it meets such notes
+    and masks them out of later frames; reset_note_progress() clears them.
+    """
+    if _RETIRED["table"] is not tab:
+        _RETIRED["mask"] = np.zeros(len(tab.t_hit), dtype=np.bool_)
+        _RETIRED["table"] = tab
+    return _RETIRED["mask"]
+
+
+class KindIndex:
+    """Sorted state indices of one note kind plus a cursor past notes done for good.
+
+    The judge passes only care about one kind each (holds, drags, everything but
+    holds) and skip fake notes, so they walk this list instead of every state in
+    their window. A note is done once it is judged and, for holds, finalized.
+    ``head`` only moves forward, so code that clears judge flags (the R restart)
+    must call reset_note_progress().
+    """
+
+    __slots__ = ("rows", "head")
+
+    def __init__(self, rows: List[int]):
+        self.rows = rows
+        self.head = 0
+
+    def window(self, states: Sequence[NoteState], st0: int, st1: int) -> List[int]:
+        """State indices of this kind in [st0, st1), minus the done prefix.
+
+        Args:
+            states: Note states the table was built from
+            st0: First state index of the scan window
+            st1: End (exclusive) of the scan window
+
+        Returns:
+            Indices in chart order; callers still check the mutable flags
+        """
+        rows = self.rows
+        h = self.head
+        n = len(rows)
+        while h < n:
+            s = states[rows[h]]
+            if not (s.judged and (s.note.kind != 3 or s.hold_finalized)):
+                break
+            h += 1
+        self.head = h
+        return rows[max(h, bisect_left(rows, st0)):bisect_left(rows, st1)]
+
+
+# Single-slot cache: KindIndex objects of one NoteTable, keyed by (kind, negate).
+_KINDS = {"table": None, "index": {}}
+
+
+def kind_index(tab: NoteTable, kind: int, negate: bool = False) -> KindIndex:
+    """Return the KindIndex of non-fake notes with the given kind (or, negated, any other kind)."""
+    if _KINDS["table"] is not tab:
+        _KINDS["index"] = {}
+        _KINDS["table"] = tab
+    key = (int(kind), bool(negate))
+    idx = _KINDS["index"].get(key)
+    if idx is None:
+        match = (tab.kind != int(kind)) if negate else (tab.kind == int(kind))
+        idx = KindIndex(np.flatnonzero(match & ~tab.fake).tolist())
+        _KINDS["index"][key] = idx
+    return idx
+
+
+def reset_note_progress() -> None:
+    """Rewind the KindIndex cursors and clear the retired mask (call after clearing judge flags)."""
+    for idx in _KINDS["index"].values():
+        idx.head = 0
+    if _RETIRED["mask"] is not None:
+        _RETIRED["mask"][:] = False
+
+
+# Single-slot cache for the prefix max of leave times; depends on the approach time.
+# lo/hi/t remember the last answer so playback can advance it by pointer bumps.
+_LEAVE = {"table": None, "extra_after": None, "prefix_max": None, "enter_min": None, "lo": 0, "hi": 0, "t": None}
+
+# Beyond this many steps a seek is cheaper as a binary search.
+_MAX_BUMPS = 64
+
+
+def visible_bounds(tab: NoteTable, t: float, extra_after: float) -> Tuple[int, int]:
+    """Index range that can contain notes on screen at time t.
+
+    A note is visible while t_enter <= t <= t_leave, where t_leave is t_end + 0.35
+    for holds and t_hit + extra_after otherwise. Running extrema of those times are
+    monotonic in note order, so both ends are a binary search and draw order is kept.
+    While t moves forward the previous bounds are advanced in place instead.
+
+    Args:
+        tab: Note table
+        t: Chart time
+        extra_after: Seconds a non-hold note stays after t_hit
+
+    Returns:
+        (lo, hi) such that every note outside [lo, hi) is off screen
+    """
+    n = len(tab.t_hit)
+    if n == 0:
+        return 0, 0
+    t = float(t)
+    if _LEAVE["table"] is not tab or _LEAVE["extra_after"] != float(extra_after):
+        t_leave = np.where(tab.kind == 3, tab.t_end + 0.35, tab.t_hit + float(extra_after))
+        _LEAVE["prefix_max"] = np.maximum.accumulate(t_leave).tolist()
+        _LEAVE["enter_min"] = tab.t_enter_suffix_min.tolist()
+        _LEAVE["extra_after"] = float(extra_after)
+        _LEAVE["table"] = tab
+        _LEAVE["t"] = None
+    prefix_max = _LEAVE["prefix_max"]
+    enter_min = _LEAVE["enter_min"]
+    t_prev = _LEAVE["t"]
+    if t_prev is not None and t >= t_prev:
+        lo = _LEAVE["lo"]
+        hi = _LEAVE["hi"]
+        stop = lo + _MAX_BUMPS
+        while lo < n and prefix_max[lo] < t and lo < stop:
+            lo += 1
+        if lo == stop:
+            lo = bisect_left(prefix_max, t, lo)
+        stop = hi + _MAX_BUMPS
+        while hi < n and enter_min[hi] <= t and hi < stop:
+            hi += 1
+        if hi == stop:
+            hi = bisect_right(enter_min, t, hi)
+    else:
+        lo = bisect_left(prefix_max, t)
+        hi = bisect_right(enter_min, t)
+    _LEAVE["lo"] = lo
+    _LEAVE["hi"] = hi
+    _LEAVE["t"] = t
+    return lo, max(lo, hi)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 import time
+from typing import Callable
 
 def clamp(x, a, b):
     return a if x < a else b if x > b else x
@@ -52,6 +53,15 @@ def apply_expand_xy(x: float, y: float, W: int, H: int, expand: float) -> tuple[
     s = 1.0 / float(expand)
     return (cx + (float(x) - cx) * s, cy + (float(y) - cy) * s)
 
+def make_expand_xy(W: int, H: int, expand: float) -> Callable[[float, float], tuple[float, float]]:
+    """apply_expand_xy with W, H and expand bound once, for per-frame hot loops."""
+    if expand is None or expand <= 1.000001:
+        return lambda x, y: (x, y)
+    cx = W * 0.5
+    cy = H * 0.5
+    s = 1.0 / float(expand)
+    return lambda x, y: (cx + (x - cx) * s, cy + (y - cy) * s)
+
 def apply_expand_pts(pts, W: int, H: int, expand: float):
     if expand is None or expand <= 1.000001:
         return pts
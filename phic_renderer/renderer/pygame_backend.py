@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import bisect
+import functools
+import heapq
+import itertools
 import logging
 import math
 import os
@@ -13,12 +16,13 @@ import pygame
 from .. import state
 from ..io.chart_loader_impl import load_chart
 from ..io.chart_pack_impl import load_chart_pack
-from ..runtime.effects import HitFX, ParticleBurst
+from ..runtime.effects import HitFX, ParticleBurst, hitfx_color
 from ..core.fx import prune_hitfx, prune_particles
-from ..runtime.judge import Judge, JUDGE_WEIGHT
-from ..runtime.kinematics import eval_line_state, note_world_pos
+from ..runtime.judge import HitRec, Judge, JUDGE_WEIGHT
+from ..runtime.kinematics import LineStateMemo, eval_line_state, note_world_pos
 from ..runtime.judge_script import build_judge_plan, load_judge_script, parse_judge_script
 from ..core.constants import NOTE_TYPE_COLORS
+from ..core.render_args import invalidate_render_args
 from ..core.ui import compute_score, format_title, progress_ratio
 from ..math.util import (
     apply_expand_xy,
@@ -40,10 +44,17 @@ from ..backends.pygame.resources.background import load_background
 from ..backends.pygame.effects.particles import draw_particles
 from ..backends.pygame.resources.audio import HitsoundPlayer
 from ..backends.pygame.effects.hitfx import draw_hitfx
+from ..backends.pygame.performance.glyph_atlas import reset_glyph_atlases
 from ..backends.pygame.performance.transform_cache import get_global_transform_cache
-from ..backends.pygame.performance.texture_atlas import get_global_atlas, get_global_texture_map, set_global_texture_map
+from ..backends.pygame.performance.texture_atlas import (
+    get_global_atlas,
+    get_global_sprite_atlas,
+    get_global_texture_map,
+    reset_global_sprite_atlas,
+    set_global_texture_map,
+)
 from ..backends.pygame.rendering.batch_renderer import get_global_batch_renderer
-from ..backends.pygame.performance.surface_pool import get_global_pool
+from ..backends.pygame.performance.surface_pool import SurfaceRing, get_global_pool
 
 from ..backends.pygame.utils.rendering import (
     pick_note_image,
@@ -54,7 +65,7 @@ from ..backends.pygame.utils.rendering import (
     track_seg_state,
     scroll_speed_px_per_sec,
 )
-from ..backends.pygame.rendering.ui_rendering import render_ui_overlay
+from ..backends.pygame.rendering.ui_rendering import invalidate_title_cache, render_ui_overlay
 from ..recording.utils import (
     print_recording_progress,
     print_recording_notes,
@@ -70,7 +81,6 @@ from ..engine.chart_init import (
     filter_notes_by_time,
 )
 from ..engine.judgment_helpers import (
-    sanitize_grade,
     apply_grade,
     finalize_hold,
     check_hold_release,
@@ -79,10 +89,12 @@ from ..engine.judgment_helpers import (
 from ..ui.headless.curses import render_curses_ui
 from ..backends.pygame.input.pointer import PointerManager
 from ..engine.manual_judgment import apply_manual_judgement
-from ..backends.pygame.hold.logic import hold_finalize, hold_maintenance, hold_tick_fx
+from ..backends.pygame.hold.logic import hold_update
 from ..engine.miss_detection import detect_misses
+from ..engine.note_table import reset_note_progress
+from ..engine.autoplay_plan import autoplay_candidates, autoplay_plan_for
 from ..backends.pygame.debug.judge_windows import draw_debug_judge_windows
-from ..backends.pygame.effects.trail_effect import apply_trail
+from ..backends.pygame.effects.trail_effect import TrailConfig, apply_trail, resolve_trail_config, trail_state_key
 from ..backends.pygame.rendering.frame_renderer import render_frame as render_frame_impl
 from ..backends.pygame.recording.writer import save_record_png, write_record_frame
 from ..backends.pygame.effects.post_ui import post_render_non_headless, post_render_record_headless_overlay
@@ -90,6 +102,90 @@ from ..backends.pygame.effects.motion_blur import apply_motion_blur
 from ..engine.simulateplay import SimulatePlayer
 from ..backends.pygame.debug.pointer import draw_debug_pointer
 
+
+class _RenderCtx:
+    """Arguments for render_frame_impl that live across frames, plus the caches it hands back."""
+
+    __slots__ = (
+        "args", "state_mod", "RW", "RH", "W", "H", "expand", "overrender",
+        "surface_pool", "transform_cache", "bg_blurred", "bg_dim_alpha",
+        "bg_scaled_cache_key", "bg_scaled_cache", "dim_surf_cache_key", "dim_surf_cache",
+        "lines", "states", "idx_next",
+        "base_note_w", "base_note_h", "note_scale_x", "note_scale_y",
+        "hold_body_w", "outline_w", "line_w", "dot_r", "line_len",
+        "chart_dir", "line_tex_cache", "small", "note_dbg_cache", "last_debug_ms",
+        "line_last_hit_ms", "respack", "hitfx", "bad_ghosts",
+        "MISS_FADE_SEC", "BAD_GHOST_SEC", "sprite_atlas", "frame_ring", "overlay_ring",
+        "note_render_count",
+    )
+
+    def __init__(self, **kw: Any):
+        for name in self.__slots__:
+            setattr(self, name, None)
+        self.last_debug_ms = 0
+        self.note_render_count = 0
+        for name, value in kw.items():
+            setattr(self, name, value)
+
+
+def _render_frame(ctx: _RenderCtx, t_draw: float) -> Tuple[pygame.Surface, List[Tuple[int, pygame.Surface, float, float]]]:
+    """Render one frame at t_draw and store the returned caches back on ctx."""
+    (
+        base,
+        line_text_draw_calls,
+        ctx.note_render_count,
+        ctx.last_debug_ms,
+        ctx.bg_scaled_cache_key,
+        ctx.bg_scaled_cache,
+        ctx.dim_surf_cache_key,
+        ctx.dim_surf_cache,
+    ) = render_frame_impl(
+        t_draw=float(t_draw),
+        args=ctx.args,
+        state_mod=ctx.state_mod,
+        RW=ctx.RW,
+        RH=ctx.RH,
+        W=ctx.W,
+        H=ctx.H,
+        expand=ctx.expand,
+        overrender=ctx.overrender,
+        surface_pool=ctx.surface_pool,
+        transform_cache=ctx.transform_cache,
+        bg_blurred=ctx.bg_blurred,
+        bg_dim_alpha=ctx.bg_dim_alpha,
+        bg_scaled_cache_key=ctx.bg_scaled_cache_key,
+        bg_scaled_cache=ctx.bg_scaled_cache,
+        dim_surf_cache_key=ctx.dim_surf_cache_key,
+        dim_surf_cache=ctx.dim_surf_cache,
+        lines=ctx.lines,
+        states=ctx.states,
+        idx_next=ctx.idx_next,
+        base_note_w=ctx.base_note_w,
+        base_note_h=ctx.base_note_h,
+        note_scale_x=ctx.note_scale_x,
+        note_scale_y=ctx.note_scale_y,
+        hold_body_w=ctx.hold_body_w,
+        outline_w=ctx.outline_w,
+        line_w=ctx.line_w,
+        dot_r=ctx.dot_r,
+        line_len=ctx.line_len,
+        chart_dir=ctx.chart_dir,
+        line_tex_cache=ctx.line_tex_cache,
+        small=ctx.small,
+        note_dbg_cache=ctx.note_dbg_cache,
+        last_debug_ms=ctx.last_debug_ms,
+        line_last_hit_ms=ctx.line_last_hit_ms,
+        respack=ctx.respack,
+        hitfx=ctx.hitfx,
+        bad_ghosts=ctx.bad_ghosts,
+        MISS_FADE_SEC=ctx.MISS_FADE_SEC,
+        BAD_GHOST_SEC=ctx.BAD_GHOST_SEC,
+        sprite_atlas=ctx.sprite_atlas,
+        frame_ring=ctx.frame_ring,
+        overlay_ring=ctx.overlay_ring,
+    )
+    return base, line_text_draw_calls
+
 def run(
     args: Any,
     *,
@@ -190,7 +286,7 @@ def run(
     last_judge_events_frame: List[Dict[str, Any]] = []
 
     def _report_judge_event(ev: Dict[str, Any]):
-        nonlocal last_judge_event, last_judge_events_frame
+        nonlocal last_judge_event
         try:
             last_judge_event = dict(ev or {})
             last_judge_events_frame.append(dict(ev or {}))
@@ -660,6 +756,7 @@ def run(
     chart_speed = float(getattr(args, "chart_speed", 1.0) or 1.0)
     if chart_speed <= 1e-9:
         chart_speed = 1.0
+    bgm_volume = clamp(getattr(args, "bgm_volume", 0.8), 0.0, 1.0)
     start_time_sec = 0.0
     end_time_sec = None
     if getattr(args, "start_time", None) is not None:
@@ -681,7 +778,7 @@ def run(
         if (not record_enabled) and bgm_file:
             audio.play_music_file(
                 str(bgm_file),
-                volume=clamp(getattr(args, "bgm_volume", 0.8), 0.0, 1.0),
+                volume=bgm_volume,
                 start_pos_sec=float(music_start_pos_sec),
             )
             try:
@@ -693,7 +790,7 @@ def run(
             logger.info(
                 "[pygame] bgm play (file=%s, volume=%s, start_pos=%s)",
                 str(bgm_file),
-                clamp(getattr(args, "bgm_volume", 0.8), 0.0, 1.0),
+                bgm_volume,
                 float(music_start_pos_sec),
             )
         elif record_enabled and bgm_file:
@@ -748,7 +845,7 @@ def run(
                         if not record_enabled:
                             audio.play_music_file(
                                 str(advance_segment_bgm[0]),
-                                volume=clamp(getattr(args, "bgm_volume", 0.8), 0.0, 1.0),
+                                volume=bgm_volume,
                                 start_pos_sec=float(music_start_pos_sec),
                             )
                             try:
@@ -763,7 +860,7 @@ def run(
                     if not record_enabled:
                         audio.play_music_file(
                             str(bgm_file),
-                            volume=clamp(getattr(args, "bgm_volume", 0.8), 0.0, 1.0),
+                            volume=bgm_volume,
                             start_pos_sec=float(music_start_pos_sec),
                         )
                         try:
@@ -847,25 +944,8 @@ def run(
             screen = pygame.display.set_mode((W, H))
         pygame.display.set_caption("Mini Phigros Renderer (Official + RPE, rot/alpha/color)")
         if respack and getattr(respack, "img", None):
+            # Respack images are already in the frame pixel format (see load_respack).
             try:
-                for k, surf in list(respack.img.items()):
-                    try:
-                        respack.img[k] = surf.convert_alpha()
-                    except:
-                        respack.img[k] = surf
-                try:
-                    respack.hitfx_sheet = respack.img.get("hit_fx.png", respack.hitfx_sheet)
-                except:
-                    pass
-
-                try:
-                    respack.hitfx_sheet_good = respack.img.get(
-                        "hit_fx.good.png",
-                        getattr(respack, "hitfx_sheet_good", respack.hitfx_sheet),
-                    )
-                except:
-                    pass
-
                 # Build texture atlas for performance optimization
                 if not getattr(args, "disable_atlas", False):
                     try:
@@ -882,13 +962,14 @@ def run(
                 pass
 
     font, small = load_fonts(getattr(args, "font_path", None), float(getattr(args, "font_size_multiplier", 1.0) or 1.0))
+    invalidate_title_cache()
+    reset_glyph_atlases()
+    invalidate_render_args()
 
     # chart directory for RPE hitsound relative paths
     chart_dir = os.path.dirname(os.path.abspath(chart_path)) if chart_path else ((advance_base_dir or os.getcwd()) if advance_active else os.getcwd())
 
-    line_tex_cache: Dict[str, pygame.Surface] = {}
-
-    last_debug_ms = 0
+    line_tex_cache: Dict[str, Optional[pygame.Surface]] = {}
 
     # Apply start_time/end_time filtering for single charts.
     # Important: do NOT trim notes during recording; recording uses record_start_time to align timeline.
@@ -949,52 +1030,10 @@ def run(
             judge_plan = None
             judge_plan_err = str(e)
 
-    def _sanitize_grade(note_kind: int, grade: Optional[str]) -> Optional[str]:
-        if grade is None:
-            return None
-        g = str(grade).upper()
-        k = int(note_kind)
-        if k in (2, 4):
-            return "PERFECT" if g in ("PERFECT", "GOOD") else None
-        if k == 3:
-            if g == "PERFECT":
-                return "PERFECT"
-            if g in ("GOOD", "BAD"):
-                return "GOOD"
-            return None
-        if k == 1:
-            if g in ("PERFECT", "GOOD", "BAD"):
-                return g
-            return None
-        return None
-
-    def _apply_grade(s: NoteState, grade: str):
-        g = str(grade).upper()
-        if g == "PERFECT":
-            judge.bump()
-            s.judged = True
-            s.hit = True
-            judge.acc_sum += JUDGE_WEIGHT.get("PERFECT", 1.0)
-            judge.judged_cnt += 1
-            return
-        if g == "GOOD":
-            judge.bump()
-            s.judged = True
-            s.hit = True
-            judge.acc_sum += JUDGE_WEIGHT.get("GOOD", 0.6)
-            judge.judged_cnt += 1
-            return
-        if g == "BAD":
-            judge.break_combo()
-            s.judged = True
-            s.hit = True
-            judge.acc_sum += JUDGE_WEIGHT.get("BAD", 0.0)
-            judge.judged_cnt += 1
-            return
-
     hit_debug = bool(getattr(args, "hit_debug", False))
-    hit_debug_lines: deque = deque(maxlen=64)
-    hit_debug_seq = 0
+    # Consumers check `hit_debug and hit_debug_lines`, so an empty tuple stands in when off.
+    hit_debug_lines: Any = deque(maxlen=64) if hit_debug else ()
+    hit_debug_seq = itertools.count(1)
     cui_events_incoming: List[str] = []
     cui_events_past: deque = deque(maxlen=256)
 
@@ -1011,6 +1050,7 @@ def run(
     if (not use_bgm_clock) and start_time_sec > 1e-9:
         t0 = now_sec() - float(music_start_pos_sec)
     paused = False
+    pause_drawn = False
     pause_t = 0.0
     pause_frame = None
     record_frame_idx = 0
@@ -1073,13 +1113,15 @@ def run(
     transform_cache = get_global_transform_cache()
 
     surface_pool = get_global_pool()
-    bg_scaled_cache_key: Optional[Tuple[int, int, int]] = None
-    bg_scaled_cache: Optional[pygame.Surface] = None
-    dim_surf_cache_key: Optional[Tuple[int, int, int]] = None
-    dim_surf_cache: Optional[pygame.Surface] = None
+    # Frame bases are owned by this ring, not the pool: never release them.
+    frame_ring = SurfaceRing(3)
+    # Note/line overlay: one surface, cleared and composited within each render.
+    overlay_ring = SurfaceRing(1)
+    # Motion blur: accumulator per output frame and one scaled-sample buffer.
+    mb_acc_ring = SurfaceRing(2)
+    mb_scratch_ring = SurfaceRing(1)
 
     running = True
-    note_render_count_last = 0
     note_dbg_cache: Dict[str, pygame.Surface] = {}
     tui_frame_step = 1
     if record_enabled and record_fps > 1e-6:
@@ -1098,6 +1140,138 @@ def run(
         if not cui_ok:
             record_use_curses = False
             cui = None
+    # args does not change while a chart is playing; read per-frame options once.
+    # Values that runtime mods can override live on `state` and are still read per frame.
+    autoplay_on = bool(getattr(args, "autoplay", False))
+    debug_judge_windows_on = bool(getattr(args, "debug_judge_windows", False))
+    debug_pointer_on = bool(getattr(args, "debug_pointer", False))
+    approach_sec = float(getattr(args, "approach", 3.0) or 3.0)
+    default_overrender = float(getattr(args, "overrender", 2.0) or 2.0)
+    default_trail_alpha = clamp(float(getattr(args, "trail_alpha", 0.0) or 0.0), 0.0, 1.0)
+    default_trail_blur = int(getattr(args, "trail_blur", 0) or 0)
+    default_trail_dim = clamp(int(getattr(args, "trail_dim", 0) or 0), 0, 255)
+    # Trail options parsed from state; re-resolved only when the raw overrides change.
+    trail_cfg: Optional[TrailConfig] = None
+    trail_cfg_key: Optional[Tuple[Any, ...]] = None
+    # Sprite atlas entries are keyed by id() of respack images, which are per run.
+    reset_global_sprite_atlas()
+    sprite_atlas = None if bool(getattr(args, "disable_atlas", False)) else get_global_sprite_atlas()
+
+    line_last_hit_ms: Dict[int, int] = {}
+    rctx = _RenderCtx(
+        args=args,
+        state_mod=state,
+        W=int(W),
+        H=int(H),
+        expand=float(expand),
+        surface_pool=surface_pool,
+        transform_cache=transform_cache,
+        bg_dim_alpha=bg_dim_alpha,
+        base_note_w=int(base_note_w),
+        base_note_h=int(base_note_h),
+        note_scale_x=float(note_scale_x),
+        note_scale_y=float(note_scale_y),
+        hold_body_w=int(hold_body_w),
+        outline_w=int(outline_w),
+        line_w=int(line_w),
+        dot_r=int(dot_r),
+        line_len=int(line_len),
+        line_tex_cache=line_tex_cache,
+        small=small,
+        note_dbg_cache=note_dbg_cache,
+        line_last_hit_ms=line_last_hit_ms,
+        respack=respack,
+        hitfx=hitfx,
+        bad_ghosts=bad_ghosts,
+        MISS_FADE_SEC=float(MISS_FADE_SEC),
+        BAD_GHOST_SEC=float(BAD_GHOST_SEC),
+        sprite_atlas=sprite_atlas,
+        frame_ring=frame_ring,
+        overlay_ring=overlay_ring,
+    )
+    # Motion blur renders sub-frames through this callback.
+    render_frame_cb = functools.partial(_render_frame, rctx)
+
+    # Only the textual/curses UIs read the event log.
+    cui_events_on = bool(tui_ok and tui is not None) or bool(record_use_curses and cui_ok and cui is not None)
+    # Judge events feed the event log and should_stop_cb; with neither (and no hit
+    # debug overlay) hit reports have no reader, so call sites skip building them.
+    judge_events_on = cui_events_on or (should_stop_cb is not None)
+    hit_events_on = hit_debug or judge_events_on
+
+    def _mark_line_hit(lid: int, now_ms: int):
+        line_last_hit_ms[lid] = int(now_ms)
+
+    def _push_hit_debug(
+        *,
+        t_now: float,
+        t_hit: float,
+        note_id: int,
+        judgement: str,
+        hold_percent: Optional[float] = None,
+        note_kind: Optional[int] = None,
+        mh: Optional[bool] = None,
+        line_id: Optional[int] = None,
+        source: Optional[str] = None,
+    ):
+        if not hit_debug:
+            # still report judge event for playlist even if debug overlay is disabled
+            if not judge_events_on:
+                return
+            try:
+                _report_judge_event(
+                    {
+                        "grade": str(judgement),
+                        "t_now": float(t_now),
+                        "t_hit": float(t_hit),
+                        "note_id": int(note_id),
+                        "note_kind": (int(note_kind) if note_kind is not None else None),
+                        "mh": (bool(mh) if mh is not None else None),
+                        "line_id": (int(line_id) if line_id is not None else None),
+                        "source": (str(source) if source is not None else None),
+                        "hold_percent": (float(hold_percent) if hold_percent is not None else None),
+                    }
+                )
+            except Exception:
+                pass
+            return
+        dt_ms = (float(t_now) - float(t_hit)) * 1000.0
+        hp = None
+        if hold_percent is not None:
+            try:
+                hp = clamp(float(hold_percent), 0.0, 1.0)
+            except:
+                hp = None
+        hit_debug_lines.appendleft(HitRec(next(hit_debug_seq), dt_ms, note_id, judgement, hp))
+        if not cui_events_on:
+            return
+        try:
+            if hp is None:
+                _push_cui_event(f"{str(judgement):7s} nid={int(note_id):6d} dt={float(dt_ms):+7.1f}ms", t_now=float(t_now))
+            else:
+                _push_cui_event(f"{str(judgement):7s} nid={int(note_id):6d} dt={float(dt_ms):+7.1f}ms hold={float(hp)*100:5.1f}%", t_now=float(t_now))
+        except:
+            pass
+
+    # Advance mixed sounds: min-heaps of (start_at, idx) still to start and (end_at, idx) still to stop.
+    adv_pending_start: List[Tuple[float, int]] = [
+        (float(tr.get("start_at", 0.0)), i) for i, tr in enumerate(advance_sound_tracks) if not tr.get("started")
+    ]
+    heapq.heapify(adv_pending_start)
+    adv_pending_stop: List[Tuple[float, int]] = []
+
+    mousemotion_type = getattr(pygame, "MOUSEMOTION", -4)
+    pointer_event_types = frozenset(
+        {
+            getattr(pygame, "MOUSEBUTTONDOWN", -2),
+            getattr(pygame, "MOUSEBUTTONUP", -3),
+            mousemotion_type,
+            getattr(pygame, "FINGERDOWN", -5),
+            getattr(pygame, "FINGERUP", -6),
+            getattr(pygame, "FINGERMOTION", -7),
+        }
+    )
+
     while running:
         # Clear per-frame transform cache
         transform_cache.next_frame()
@@ -1123,25 +1297,29 @@ def run(
             _dt_frame = 1.0 / float(record_fps)
         else:
             _dt_frame = clock.tick(120) / 1000.0
+        # One clock read per frame, shared by the scheduler, input, pause and timebase below.
+        _now = now_sec()
 
         # schedule advance mixed sounds
-        if (not record_enabled or record_preview_audio) and advance_active and advance_sound_tracks:
-            now_t = ((now_sec() - t0) - float(offset)) * float(getattr(args, "chart_speed", 1.0))
-            for tr in advance_sound_tracks:
-                if tr.get("stopped"):
-                    continue
-                st_at = float(tr.get("start_at", 0.0))
+        if (not record_enabled or record_preview_audio) and advance_active and (adv_pending_start or adv_pending_stop):
+            now_t = ((_now - t0) - float(offset)) * float(chart_speed)
+            while adv_pending_start and adv_pending_start[0][0] <= now_t:
+                _, ti = heapq.heappop(adv_pending_start)
+                tr = advance_sound_tracks[ti]
+                try:
+                    ch = audio.play_sound(tr["sound"], volume=bgm_volume)
+                    tr["channel"] = ch
+                    tr["started"] = True
+                except:
+                    tr["started"] = True
                 en_at = tr.get("end_at", None)
-                if (not tr.get("started")) and now_t >= st_at:
-                    try:
-                        ch = audio.play_sound(tr["sound"], volume=clamp(getattr(args, "bgm_volume", 0.8), 0.0, 1.0))
-                        tr["channel"] = ch
-                        tr["started"] = True
-                    except:
-                        tr["started"] = True
-                if en_at is not None and tr.get("started") and now_t >= float(en_at):
-                    audio.stop_channel(tr.get("channel"))
-                    tr["stopped"] = True
+                if en_at is not None:
+                    heapq.heappush(adv_pending_stop, (float(en_at), ti))
+            while adv_pending_stop and adv_pending_stop[0][0] <= now_t:
+                _, ti = heapq.heappop(adv_pending_stop)
+                tr = advance_sound_tracks[ti]
+                audio.stop_channel(tr.get("channel"))
+                tr["stopped"] = True
 
         if record_headless:
             evs = []
@@ -1168,7 +1346,16 @@ def run(
                 pass
         pointers.begin_frame()
 
+        log_events = bool((tui_ok and tui is not None) or (record_use_curses and cui_ok and cui is not None))
         for ev in evs:
+            # Hover motion (left button up) is a no-op for the pointer manager; skip the whole
+            # dispatch for it unless events are being logged to the TUI.
+            if ev.type == mousemotion_type and not log_events:
+                try:
+                    if not ev.buttons[0]:
+                        continue
+                except Exception:
+                    pass
             # In simulateplay mode, block real pointer input from interfering with simulated pointers.
             # We still keep non-pointer control keys (quit/pause/restart) functional.
             if sim_player is not None:
@@ -1176,14 +1363,7 @@ def run(
                     et = int(getattr(ev, "type", -1))
                 except Exception:
                     et = -1
-                if et in {
-                    getattr(pygame, "MOUSEBUTTONDOWN", -2),
-                    getattr(pygame, "MOUSEBUTTONUP", -3),
-                    getattr(pygame, "MOUSEMOTION", -4),
-                    getattr(pygame, "FINGERDOWN", -5),
-                    getattr(pygame, "FINGERUP", -6),
-                    getattr(pygame, "FINGERMOTION", -7),
-                }:
+                if et in pointer_event_types:
                     # Ignore real pointer input.
                     pass
                 else:
@@ -1197,8 +1377,8 @@ def run(
                 except Exception:
                     pass
             try:
-                if (tui_ok and tui is not None) or (record_use_curses and cui_ok and cui is not None):
-                    _push_cui_event(f"pygame ev={getattr(ev, 'type', None)}", t_now=float((now_sec() - t0) * float(getattr(args, 'chart_speed', 1.0))))
+                if log_events:
+                    _push_cui_event(f"pygame ev={getattr(ev, 'type', None)}", t_now=float((_now - t0) * float(chart_speed)))
             except:
                 pass
             if ev.type == pygame.QUIT:
@@ -1211,8 +1391,9 @@ def run(
                         pointers.set_keyboard_down(True)
                 elif ev.key == pygame.K_p:
                     paused = not paused
+                    pause_drawn = False
                     if paused:
-                        pause_t = now_sec()
+                        pause_t = _now
                         try:
                             pause_frame = screen.copy()
                         except:
@@ -1223,19 +1404,19 @@ def run(
                         if use_bgm_clock:
                             audio.unpause_music()
                         else:
-                            t0 += now_sec() - pause_t
+                            t0 += _now - pause_t
                         pause_frame = None
                 elif ev.key == pygame.K_r:
                     if (not use_bgm_clock) and start_time_sec > 1e-9:
-                        t0 = now_sec() - float(music_start_pos_sec)
+                        t0 = _now - float(music_start_pos_sec)
                     else:
-                        t0 = now_sec()
+                        t0 = _now
                     paused = False
                     if use_bgm_clock and bgm_file:
                         audio.stop_music()
                         audio.play_music_file(
                             str(bgm_file),
-                            volume=clamp(getattr(args, "bgm_volume", 0.8), 0.0, 1.0),
+                            volume=bgm_volume,
                             start_pos_sec=float(music_start_pos_sec),
                         )
                         try:
@@ -1250,7 +1431,7 @@ def run(
                                 audio.stop_music()
                                 audio.play_music_file(
                                     str(advance_segment_bgm[0]),
-                                    volume=clamp(getattr(args, "bgm_volume", 0.8), 0.0, 1.0),
+                                    volume=bgm_volume,
                                     start_pos_sec=float(music_start_pos_sec),
                                 )
                                 if hasattr(audio, "set_music_speed"):
@@ -1259,6 +1440,7 @@ def run(
                             pass
                     for s in states:
                         s.judged = s.hit = s.holding = s.released_early = s.miss = False
+                    reset_note_progress()
                     idx_next = 0
                     judge.combo = 0
                     hitfx.clear()
@@ -1268,12 +1450,15 @@ def run(
                         pointers.set_keyboard_down(False)
 
         if paused:
-            if pause_frame is not None:
-                screen.blit(pause_frame, (0, 0))
-            else:
-                screen.fill((10, 10, 15))
-            txt = font.render("PAUSED (P to resume)", True, (220, 220, 220))
-            screen.blit(txt, (W // 2 - txt.get_width() // 2, H // 2))
+            # The paused screen is static: compose it once, then only present it.
+            if not pause_drawn:
+                if pause_frame is not None:
+                    screen.blit(pause_frame, (0, 0))
+                else:
+                    screen.fill((10, 10, 15))
+                txt = font.render("PAUSED (P to resume)", True, (220, 220, 220))
+                screen.blit(txt, (W // 2 - txt.get_width() // 2, H // 2))
+                pause_drawn = True
             pygame.display.flip()
 
             if record_headless:
@@ -1287,7 +1472,7 @@ def run(
             audio_t = audio.music_pos_sec() or 0.0
             t = (audio_t - offset) * float(chart_speed)
         else:
-            t = ((now_sec() - t0) - offset) * float(chart_speed)
+            t = ((_now - t0) - offset) * float(chart_speed)
 
         if advance_lazy_sequence:
             try:
@@ -1379,7 +1564,7 @@ def run(
                         audio.stop_music()
                         audio.play_music_file(
                             str(pth),
-                            volume=clamp(getattr(args, "bgm_volume", 0.8), 0.0, 1.0),
+                            volume=bgm_volume,
                             start_pos_sec=0.0,
                         )
                         try:
@@ -1407,10 +1592,11 @@ def run(
             running = False
             break
 
-        overrender = float(getattr(args, "overrender", 2.0) or 2.0)
-        if getattr(state, "render_overrender", None) is not None:
+        overrender = default_overrender
+        ov = getattr(state, "render_overrender", None)
+        if ov is not None:
             try:
-                overrender = float(getattr(state, "render_overrender"))
+                overrender = float(ov)
             except:
                 pass
         if overrender < 1.0:
@@ -1430,296 +1616,148 @@ def run(
                 mb_shutter = clamp(float(getattr(state, "motion_blur_shutter")), 0.0, 2.0)
             except:
                 mb_shutter = 0.0
-
-        def _render_frame(t_draw: float) -> Tuple[pygame.Surface, List[Tuple[int, pygame.Surface, float, float]]]:
-            nonlocal last_debug_ms
-            nonlocal bg_scaled_cache_key
-            nonlocal bg_scaled_cache
-            nonlocal dim_surf_cache_key
-            nonlocal dim_surf_cache
-
-            base, line_text_draw_calls, note_render_count, last_debug_ms_new, bg_scaled_cache_key_new, bg_scaled_cache_new, dim_surf_cache_key_new, dim_surf_cache_new = render_frame_impl(
-                t_draw=float(t_draw),
-                args=args,
-                state_mod=state,
-                RW=int(RW),
-                RH=int(RH),
-                W=int(W),
-                H=int(H),
-                expand=float(expand),
-                overrender=float(overrender),
-                surface_pool=surface_pool,
-                transform_cache=transform_cache,
-                bg_blurred=bg_blurred,
-                bg_dim_alpha=bg_dim_alpha,
-                bg_scaled_cache_key=bg_scaled_cache_key,
-                bg_scaled_cache=bg_scaled_cache,
-                dim_surf_cache_key=dim_surf_cache_key,
-                dim_surf_cache=dim_surf_cache,
-                lines=lines,
-                states=states,
-                idx_next=int(idx_next),
-                base_note_w=int(base_note_w),
-                base_note_h=int(base_note_h),
-                note_scale_x=float(note_scale_x),
-                note_scale_y=float(note_scale_y),
-                hold_body_w=int(hold_body_w),
-                outline_w=int(outline_w),
-                line_w=int(line_w),
-                dot_r=int(dot_r),
-                line_len=int(line_len),
-                chart_dir=str(chart_dir),
-                line_tex_cache=line_tex_cache,
-                small=small,
-                note_dbg_cache=note_dbg_cache,
-                last_debug_ms=int(last_debug_ms),
-                line_last_hit_ms=line_last_hit_ms,
-                respack=respack,
-                hitfx=hitfx,
-                bad_ghosts=bad_ghosts,
-                MISS_FADE_SEC=float(MISS_FADE_SEC),
-                BAD_GHOST_SEC=float(BAD_GHOST_SEC),
-            )
-
-            last_debug_ms = int(last_debug_ms_new)
-            bg_scaled_cache_key = bg_scaled_cache_key_new
-            bg_scaled_cache = bg_scaled_cache_new
-            dim_surf_cache_key = dim_surf_cache_key_new
-            dim_surf_cache = dim_surf_cache_new
-
-            note_render_count_last = int(note_render_count)
-            return base, line_text_draw_calls
-
-        if "line_last_hit_ms" not in locals():
-            line_last_hit_ms: Dict[int, int] = {}
-
-        def _mark_line_hit(lid: int, now_ms: int):
-            line_last_hit_ms[lid] = int(now_ms)
-
-        def _push_hit_debug(
-            *,
-            t_now: float,
-            t_hit: float,
-            note_id: int,
-            judgement: str,
-            hold_percent: Optional[float] = None,
-            note_kind: Optional[int] = None,
-            mh: Optional[bool] = None,
-            line_id: Optional[int] = None,
-            source: Optional[str] = None,
-        ):
-            nonlocal hit_debug_seq
-            if not hit_debug:
-                # still report judge event for playlist even if debug overlay is disabled
-                try:
-                    _report_judge_event(
-                        {
-                            "grade": str(judgement),
-                            "t_now": float(t_now),
-                            "t_hit": float(t_hit),
-                            "note_id": int(note_id),
-                            "note_kind": (int(note_kind) if note_kind is not None else None),
-                            "mh": (bool(mh) if mh is not None else None),
-                            "line_id": (int(line_id) if line_id is not None else None),
-                            "source": (str(source) if source is not None else None),
-                            "hold_percent": (float(hold_percent) if hold_percent is not None else None),
-                        }
-                    )
-                except Exception:
-                    pass
-                return
-            hit_debug_seq += 1
-            dt_ms = (float(t_now) - float(t_hit)) * 1000.0
-            hp = None
-            if hold_percent is not None:
-                try:
-                    hp = clamp(float(hold_percent), 0.0, 1.0)
-                except:
-                    hp = None
-            hit_debug_lines.appendleft({
-                "seq": int(hit_debug_seq),
-                "dt_ms": float(dt_ms),
-                "nid": int(note_id),
-                "judgement": str(judgement),
-                "hold_percent": hp,
-            })
-            try:
-                if hp is None:
-                    _push_cui_event(f"{str(judgement):7s} nid={int(note_id):6d} dt={float(dt_ms):+7.1f}ms", t_now=float(t_now))
-                else:
-                    _push_cui_event(f"{str(judgement):7s} nid={int(note_id):6d} dt={float(dt_ms):+7.1f}ms hold={float(hp)*100:5.1f}%", t_now=float(t_now))
-            except:
-                pass
+        # The main frame must survive the motion-blur sub-frame renders.
+        frame_ring.ensure(mb_samples + 1)
+
+        # Inputs that can change between frames (overrender, advance segment swaps).
+        rctx.RW = int(RW)
+        rctx.RH = int(RH)
+        rctx.overrender = float(overrender)
+        rctx.bg_blurred = bg_blurred
+        rctx.lines = lines
+        rctx.states = states
+        rctx.idx_next = int(idx_next)
+        rctx.chart_dir = str(chart_dir)
 
         # Autoplay
-        if getattr(args, "autoplay", False):
+        if autoplay_on:
             if "prev_autoplay_t" not in locals():
                 prev_autoplay_t = float(t) - 1e-6
             _st0 = max(0, idx_next - 20)
             _st1 = min(len(states), idx_next + 300)
-            for _si in range(int(_st0), int(_st1)):
+            ap = autoplay_plan_for(states, judge_plan)
+            ap_t_fire = ap.t_fire
+            for _si in autoplay_candidates(ap, int(_st0), int(_st1), float(prev_autoplay_t), float(t)):
                 s = states[_si]
-                if s.judged or s.note.fake:
+                if s.judged:
                     continue
                 n = s.note
+                grade = ap.grade[_si]
+                t_hit = float(ap_t_fire[_si])
                 if n.kind != 3:
-                    act = None
-                    if judge_plan is not None:
-                        try:
-                            act = judge_plan.action_for(n)
-                        except:
-                            act = None
-                    dt_ms = float(getattr(act, "dt_ms", 0.0) if act is not None else 0.0)
-                    grade0 = getattr(act, "grade", None) if act is not None else "PERFECT"
-                    if (grade0 is not None) and str(grade0).upper() == "MISS":
-                        grade = "MISS"
-                    else:
-                        grade = _sanitize_grade(int(n.kind), grade0)
-                    t_hit = float(n.t_hit) + dt_ms / 1000.0
 
                     if (grade is not None) and float(prev_autoplay_t) < float(t_hit) <= float(t):
                         if str(grade).upper() == "MISS":
-                            try:
-                                setattr(s, "miss_t", float(t_hit))
-                            except:
-                                pass
+                            s.miss_t = float(t_hit)
                             s.miss = True
                             s.judged = True
                             judge.mark_miss(s)
-                            _push_hit_debug(
-                                t_now=float(t_hit),
-                                t_hit=float(n.t_hit),
-                                note_id=int(getattr(n, "nid", -1)),
-                                judgement="MISS",
-                                note_kind=int(getattr(n, "kind", 0) or 0),
-                                mh=bool(getattr(n, "mh", False)),
-                                line_id=int(getattr(n, "line_id", -1)),
-                                source="autoplay",
-                            )
+                            if hit_events_on:
+                                _push_hit_debug(
+                                    t_now=float(t_hit),
+                                    t_hit=float(n.t_hit),
+                                    note_id=int(getattr(n, "nid", -1)),
+                                    judgement="MISS",
+                                    note_kind=int(getattr(n, "kind", 0) or 0),
+                                    mh=bool(getattr(n, "mh", False)),
+                                    line_id=int(getattr(n, "line_id", -1)),
+                                    source="autoplay",
+                                )
                             continue
-                        _apply_grade(s, str(grade))
+                        apply_grade(s, str(grade), judge)
                         s.judged = True
                         s.hit = True
                         ln = lines[n.line_id]
                         t_fx = float(t_hit)
+                        t_fx_ms = ap.t_fire_ms[_si]
                         lx, ly, lr, la, sc, _la_raw = eval_line_state(ln, t_fx)
                         x, y = note_world_pos(lx, ly, lr, sc, n, n.scroll_hit, for_tail=False)
-                        c = (255, 255, 255, 255)
-                        if getattr(n, "tint_hitfx_rgb", None) is not None:
-                            rr, gg, bb = n.tint_hitfx_rgb
-                            c = (int(rr), int(gg), int(bb), 255)
-                        elif respack:
-                            c = respack.judge_colors.get("PERFECT", c)
+                        c = hitfx_color(n, respack)
                         var = "good" if str(grade).upper() == "GOOD" else ""
                         hitfx.append(HitFX(x, y, t_fx, c, lr, var))
                         if respack and (not respack.hide_particles):
-                            particles.append(ParticleBurst(x, y, int(t_fx * 1000.0), int(respack.hitfx_duration * 1000), c))
-                        _mark_line_hit(n.line_id, int(t_fx * 1000.0))
-                        _push_hit_debug(
-                            t_now=float(t_fx),
-                            t_hit=float(n.t_hit),
-                            note_id=int(getattr(n, "nid", -1)),
-                            judgement=str(grade),
-                            note_kind=int(getattr(n, "kind", 0) or 0),
-                            mh=bool(getattr(n, "mh", False)),
-                            line_id=int(getattr(n, "line_id", -1)),
-                            source="autoplay",
-                        )
+                            particles.append(ParticleBurst(x, y, t_fx_ms, int(respack.hitfx_duration * 1000), c))
+                        _mark_line_hit(n.line_id, t_fx_ms)
+                        if hit_events_on:
+                            _push_hit_debug(
+                                t_now=float(t_fx),
+                                t_hit=float(n.t_hit),
+                                note_id=int(getattr(n, "nid", -1)),
+                                judgement=str(grade),
+                                note_kind=int(getattr(n, "kind", 0) or 0),
+                                mh=bool(getattr(n, "mh", False)),
+                                line_id=int(getattr(n, "line_id", -1)),
+                                source="autoplay",
+                            )
                         if not record_enabled:
-                            hitsound.play(n, int(t_fx * 1000.0), respack=respack)
+                            hitsound.play(n, t_fx_ms, respack=respack)
                 else:
-                    act = None
-                    if judge_plan is not None:
-                        try:
-                            act = judge_plan.action_for(n)
-                        except:
-                            act = None
-                    dt_ms = float(getattr(act, "dt_ms", 0.0) if act is not None else 0.0)
-                    grade0 = getattr(act, "grade", None) if act is not None else "PERFECT"
-                    if (grade0 is not None) and str(grade0).upper() == "MISS":
-                        grade = "MISS"
-                    else:
-                        grade = _sanitize_grade(int(n.kind), grade0)
-                    hp = getattr(act, "hold_percent", None) if act is not None else None
-                    t_hit = float(n.t_hit) + dt_ms / 1000.0
-                    if hp is None:
-                        hp = 1.0
+                    hp = ap.hold_percent[_si]
 
                     if (not s.holding) and str(grade).upper() == "MISS" and float(prev_autoplay_t) < float(t_hit) <= float(t):
-                        try:
-                            setattr(s, "miss_t", float(t_hit))
-                        except:
-                            pass
+                        s.miss_t = float(t_hit)
                         s.miss = True
                         s.judged = True
                         s.hold_failed = True
                         s.hold_finalized = True
                         s.holding = False
                         judge.mark_miss(s)
-                        _push_hit_debug(
-                            t_now=float(t_hit),
-                            t_hit=float(n.t_hit),
-                            note_id=int(getattr(n, "nid", -1)),
-                            judgement="MISS",
-                            hold_percent=None,
-                            note_kind=int(getattr(n, "kind", 0) or 0),
-                            mh=bool(getattr(n, "mh", False)),
-                            line_id=int(getattr(n, "line_id", -1)),
-                            source="autoplay_hold",
-                        )
+                        if hit_events_on:
+                            _push_hit_debug(
+                                t_now=float(t_hit),
+                                t_hit=float(n.t_hit),
+                                note_id=int(getattr(n, "nid", -1)),
+                                judgement="MISS",
+                                hold_percent=None,
+                                note_kind=int(getattr(n, "kind", 0) or 0),
+                                mh=bool(getattr(n, "mh", False)),
+                                line_id=int(getattr(n, "line_id", -1)),
+                                source="autoplay_hold",
+                            )
                         continue
 
                     if (not s.holding) and (grade is not None) and float(prev_autoplay_t) < float(t_hit) <= float(t):
                         s.hit = True
                         s.holding = True
                         s.hold_grade = str(grade)
+                        s.hold_weight = JUDGE_WEIGHT.get(s.hold_grade, 0.0)
                         # Hold counts into combo at press time
                         judge.bump()
                         t_fx = float(t_hit)
-                        s.next_hold_fx_ms = int(t_fx * 1000.0) + hold_fx_interval_ms
+                        t_fx_ms = ap.t_fire_ms[_si]
+                        s.next_hold_fx_ms = t_fx_ms + hold_fx_interval_ms
                         ln = lines[n.line_id]
                         lx, ly, lr, la, sc, _la_raw = eval_line_state(ln, t_fx)
                         x, y = note_world_pos(lx, ly, lr, sc, n, sc, for_tail=False)
-                        c = (255, 255, 255, 255)
-                        if getattr(n, "tint_hitfx_rgb", None) is not None:
-                            rr, gg, bb = n.tint_hitfx_rgb
-                            c = (int(rr), int(gg), int(bb), 255)
-                        elif respack:
-                            c = respack.judge_colors.get(grade, c)
-                            c = respack.judge_colors.get("PERFECT", c)
+                        c = hitfx_color(n, respack)
                         var = "good" if str(grade).upper() == "GOOD" else ""
                         hitfx.append(HitFX(x, y, t_fx, c, lr, var))
                         if respack and (not respack.hide_particles):
-                            particles.append(ParticleBurst(x, y, int(t_fx * 1000.0), int(respack.hitfx_duration * 1000), c))
-                        _push_hit_debug(
-                            t_now=float(t_fx),
-                            t_hit=float(n.t_hit),
-                            note_id=int(getattr(n, "nid", -1)),
-                            judgement=str(grade),
-                            hold_percent=0.0,
-                            note_kind=int(getattr(n, "kind", 0) or 0),
-                            mh=bool(getattr(n, "mh", False)),
-                            line_id=int(getattr(n, "line_id", -1)),
-                            source="autoplay_hold",
-                        )
+                            particles.append(ParticleBurst(x, y, t_fx_ms, int(respack.hitfx_duration * 1000), c))
+                        if hit_events_on:
+                            _push_hit_debug(
+                                t_now=float(t_fx),
+                                t_hit=float(n.t_hit),
+                                note_id=int(getattr(n, "nid", -1)),
+                                judgement=str(grade),
+                                hold_percent=0.0,
+                                note_kind=int(getattr(n, "kind", 0) or 0),
+                                mh=bool(getattr(n, "mh", False)),
+                                line_id=int(getattr(n, "line_id", -1)),
+                                source="autoplay_hold",
+                            )
                         if not record_enabled:
-                            hitsound.play(n, int(t_fx * 1000.0), respack=respack)
+                            hitsound.play(n, t_fx_ms, respack=respack)
 
                     if s.holding:
                         dur = max(1e-6, float(n.t_end) - float(n.t_hit))
                         t_rel = float(n.t_hit) + float(hp) * dur
                         if float(t) >= float(t_rel) and float(t_rel) >= float(n.t_hit) and float(t) < float(n.t_end) - 1e-6:
-                            try:
-                                s.released_early = True
-                                setattr(s, "release_t", float(t_rel))
-                                setattr(s, "release_percent", float(hp))
-                            except:
-                                pass
+                            s.released_early = True
+                            s.release_t = float(t_rel)
+                            s.release_percent = float(hp)
                             if float(hp) < float(hold_tail_tol):
-                                try:
-                                    setattr(s, "miss_t", float(t_rel))
-                                except:
-                                    pass
+                                s.miss_t = float(t_rel)
                                 s.miss = True
                                 s.judged = True
                                 s.hold_failed = True
@@ -1733,12 +1771,15 @@ def run(
 
             prev_autoplay_t = float(t)
 
+        # Line states at t, shared by the judge passes below (evaluated lazily per line).
+        frame_line_state = LineStateMemo(lines, t)
+
         # Manual judgement (pointer-driven)
         # - tap: press/release without flick
         # - flick: move >= flick_threshold*W during a press, then release
         # - hold: long press on hold note head (kind=3)
         # - drag: holding (down) can judge kind=2 notes
-        if not getattr(args, "autoplay", False):
+        if not autoplay_on:
             for pf in pointers.frame_pointers():
                 try:
                     apply_manual_judgement(
@@ -1769,56 +1810,35 @@ def run(
                         hold_like_down=bool(pf.down),
                         press_edge=bool(pf.press_edge),
                         pointers=pointers,  # NEW: pass pointers for area judgment
+                        line_state=frame_line_state,
                     )
                 except Exception:
                     pass
 
-        # hold maintenance
-        if not getattr(args, "autoplay", False):
-            try:
-                hold_maintenance(
-                    args=args,
-                    states=states,
-                    idx_next=int(idx_next),
-                    t=float(t),
-                    hold_tail_tol=float(hold_tail_tol),
-                    W=int(W),
-                    H=int(H),
-                    lines=lines,
-                    pointers=pointers,
-                    judge=judge,
-                )
-            except Exception:
-                pass
-
-        # hold finalize
+        # hold maintenance (manual play only), finalize and tick fx in one sweep
         try:
-            hold_finalize(
+            hold_update(
+                args=args,
                 states=states,
                 idx_next=int(idx_next),
                 t=float(t),
                 hold_tail_tol=float(hold_tail_tol),
                 miss_window=float(MISS_WINDOW),
-                judge=judge,
-                push_hit_debug_cb=_push_hit_debug,
-            )
-        except Exception:
-            pass
-
-        # hold tick fx
-        try:
-            hold_tick_fx(
-                states=states,
-                idx_next=int(idx_next),
-                t=float(t),
                 hold_fx_interval_ms=int(hold_fx_interval_ms),
+                W=int(W),
+                H=int(H),
                 lines=lines,
+                pointers=pointers,
+                judge=judge,
+                maintain=not autoplay_on,
                 respack=respack,
                 hitfx=hitfx,
                 particles=particles,
                 HitFX_cls=HitFX,
                 ParticleBurst_cls=ParticleBurst,
                 mark_line_hit_cb=_mark_line_hit,
+                push_hit_debug_cb=_push_hit_debug,
+                line_state=frame_line_state,
             )
         except Exception:
             pass
@@ -1831,7 +1851,7 @@ def run(
                 t=float(t),
                 miss_window=float(MISS_WINDOW),
                 judge=judge,
-                report_event_cb=_report_judge_event,
+                report_event_cb=(_report_judge_event if judge_events_on else None),
             )
         except Exception:
             pass
@@ -1882,10 +1902,10 @@ def run(
         except Exception:
             last_judge_events_frame = []
 
-        display_frame, line_text_draw_calls = _render_frame(t)
+        display_frame, line_text_draw_calls = _render_frame(rctx, t)
 
         # Debug: judge windows (draw judge area for each note)
-        if getattr(args, "debug_judge_windows", False):
+        if debug_judge_windows_on:
             try:
                 draw_debug_judge_windows(
                     display_frame=display_frame,
@@ -1900,11 +1920,12 @@ def run(
                     idx_next=int(idx_next),
                     RW=int(RW),
                     RH=int(RH),
+                    line_state=frame_line_state,
                 )
             except Exception:
                 pass
 
-        if getattr(args, "debug_pointer", False):
+        if debug_pointer_on:
             try:
                 draw_debug_pointer(
                     display_frame=display_frame,
@@ -1960,6 +1981,20 @@ def run(
                 )
             except Exception:
                 pass
+        trail_raw = trail_state_key(state)
+        if trail_raw != trail_cfg_key:
+            trail_cfg = resolve_trail_config(
+                trail_raw,
+                default_alpha=default_trail_alpha,
+                default_blur=default_trail_blur,
+                default_dim=default_trail_dim,
+            )
+            trail_cfg_key = trail_raw
+        trail_frames = trail_cfg.frames
+
+        # Trail history keeps the last trail_frames results alive, so the ring that
+        # owns motion-blur accumulators must be at least one longer.
+        mb_acc_ring.ensure(trail_frames + 1)
         if mb_samples > 1 and mb_shutter > 1e-6:
             try:
                 display_frame_cur = apply_motion_blur(
@@ -1970,62 +2005,19 @@ def run(
                     mb_shutter=float(mb_shutter),
                     W=int(W),
                     H=int(H),
-                    render_frame_cb=_render_frame,
-                    surface_pool=surface_pool,
+                    render_frame_cb=render_frame_cb,
+                    acc_ring=mb_acc_ring,
+                    scratch_ring=mb_scratch_ring,
                 )
             except Exception:
                 display_frame_cur = pygame.transform.smoothscale(display_frame, (W, H))
+        elif (int(RW), int(RH)) == (int(W), int(H)):
+            # Same size: smoothscale would only copy. Present the ring frame itself and
+            # keep it alive for as long as trail history may hold it.
+            frame_ring.ensure(trail_frames + 1)
+            display_frame_cur = display_frame
         else:
             display_frame_cur = pygame.transform.smoothscale(display_frame, (W, H))
-        surface_pool.release(display_frame)
-
-        trail_alpha = clamp(float(getattr(args, "trail_alpha", 0.0) or 0.0), 0.0, 1.0)
-        if getattr(state, "trail_alpha", None) is not None:
-            try:
-                trail_alpha = clamp(float(getattr(state, "trail_alpha")), 0.0, 1.0)
-            except:
-                pass
-
-        trail_frames = 1
-        if getattr(state, "trail_frames", None) is not None:
-            try:
-                trail_frames = max(1, int(getattr(state, "trail_frames")))
-            except:
-                trail_frames = 1
-
-        trail_decay = 0.85
-        if getattr(state, "trail_decay", None) is not None:
-            try:
-                trail_decay = clamp(float(getattr(state, "trail_decay")), 0.0, 1.0)
-            except:
-                trail_decay = 0.85
-
-        trail_blur = int(getattr(args, "trail_blur", 0) or 0)
-        if getattr(state, "trail_blur", None) is not None:
-            try:
-                trail_blur = int(getattr(state, "trail_blur"))
-            except:
-                pass
-        trail_dim = clamp(int(getattr(args, "trail_dim", 0) or 0), 0, 255)
-        if getattr(state, "trail_dim", None) is not None:
-            try:
-                trail_dim = clamp(int(getattr(state, "trail_dim")), 0, 255)
-            except:
-                pass
-
-        trail_blur_ramp = False
-        if getattr(state, "trail_blur_ramp", None) is not None:
-            try:
-                trail_blur_ramp = bool(getattr(state, "trail_blur_ramp"))
-            except:
-                trail_blur_ramp = False
-
-        trail_blend = "normal"
-        if getattr(state, "trail_blend", None) is not None:
-            try:
-                trail_blend = str(getattr(state, "trail_blend")).strip().lower()
-            except:
-                trail_blend = "normal"
 
         try:
             display_frame, trail_hist, trail_hist_cap, trail_dim_cache, trail_dim_cache_key = apply_trail(
@@ -2033,13 +2025,13 @@ def run(
                 W=int(W),
                 H=int(H),
                 display_frame_cur=display_frame_cur,
-                trail_alpha=float(trail_alpha),
-                trail_frames=int(trail_frames),
-                trail_decay=float(trail_decay),
-                trail_blur=int(trail_blur),
-                trail_blur_ramp=bool(trail_blur_ramp),
-                trail_dim=int(trail_dim),
-                trail_blend=str(trail_blend),
+                trail_alpha=trail_cfg.alpha,
+                trail_frames=trail_cfg.frames,
+                trail_decay=trail_cfg.decay,
+                trail_blur=trail_cfg.blur,
+                trail_blur_ramp=trail_cfg.blur_ramp,
+                trail_dim=trail_cfg.dim,
+                trail_blend=trail_cfg.blend,
                 trail_hist=locals().get("trail_hist", None),
                 trail_hist_cap=int(locals().get("trail_hist_cap", int(trail_frames))),
                 trail_dim_cache=trail_dim_cache,
@@ -2102,7 +2094,7 @@ def run(
                                 note_lines: List[str] = []
                                 if lids:
                                     lid = int(lids[sel_idx])
-                                    approach_t = float(getattr(args, 'approach', 3.0) or 3.0)
+                                    approach_t = approach_sec
                                     past4, inc4 = line_note_counts_kind(note_times_by_line_kind, int(lid), float(t), float(approach_t))
                                     try:
                                         past_all, inc_all = line_note_counts(note_times_by_kind, float(t), float(approach_t))
@@ -2282,7 +2274,7 @@ def run(
                         particles_count=int(len(particles)),
                         note_times_by_kind=note_times_by_kind,
                         note_times_by_line_kind=note_times_by_line_kind,
-                        approach=float(getattr(args, "approach", 3.0) or 3.0),
+                        approach=approach_sec,
                         args=args,
                         events_incoming=list(cui_events_incoming),
                         events_past=list(cui_events_past),
@@ -2402,7 +2394,7 @@ def run(
             fmt=str(fmt),
             expand=float(expand),
             particles_count=int(len(particles)),
-            note_render_count=int(note_render_count_last),
+            note_render_count=int(rctx.note_render_count),
             hit_debug=bool(hit_debug),
             hit_debug_lines=hit_debug_lines,
             advance_active=bool(advance_active),
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Optional
+
 JUDGE_WEIGHT = {
     "PERFECT": 1.0,
     "GOOD": 0.6,
@@ -7,6 +9,18 @@ JUDGE_WEIGHT = {
     "MISS": 0.0,
 }
 
+class HitRec:
+    """One row of the hit-debug overlay; fields are typed at construction."""
+
+    __slots__ = ("seq", "dt_ms", "nid", "judgement", "hold_percent")
+
+    def __init__(self, seq: int, dt_ms: float, nid: int, judgement: str, hold_percent: Optional[float] = None):
+        self.seq = int(seq)
+        self.dt_ms = float(dt_ms)
+        self.nid = int(nid)
+        self.judgement = str(judgement)
+        self.hold_percent = None if hold_percent is None else float(hold_percent)
+
 class Judge:
     PERFECT = 0.045
     GOOD    = 0.090
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import math
-from typing import Tuple
+from typing import List, Optional, Sequence, Tuple
 
 from ..types import RuntimeLine, RuntimeNote
 from ..math.util import clamp
@@ -31,6 +31,30 @@ def eval_line_state(line: RuntimeLine, t: float) -> Tuple[float, float, float, f
             pass
     return x, y, rot, a01, s, a_raw
 
+LineState = Tuple[float, float, float, float, float, float]
+
+class LineStateMemo:
+    """eval_line_state at one time t, evaluated at most once per line.
+
+    The judge passes of a frame (manual judgement, hold upkeep, hold tick fx, judge
+    window debug) all look lines up at the frame time; sharing one memo between
+    them costs one evaluation per touched line instead of one per note.
+    """
+
+    __slots__ = ("lines", "t", "_states")
+
+    def __init__(self, lines: Sequence[RuntimeLine], t: float):
+        self.lines = lines
+        self.t = float(t)
+        self._states: List[Optional[LineState]] = [None] * len(lines)
+
+    def __call__(self, lid: int) -> LineState:
+        v = self._states[lid]
+        if v is None:
+            v = eval_line_state(self.lines[lid], self.t)
+            self._states[lid] = v
+        return v
+
 def note_world_pos(line_x, line_y, rot, scroll_now, note: RuntimeNote, scroll_target, for_tail=False) -> Tuple[float, float]:
     # tangent & normal
     tx, ty = math.cos(rot), math.sin(rot)
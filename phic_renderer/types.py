@@ -3,32 +3,59 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional, Tuple
 
-@dataclass
 class RuntimeNote:
-    nid: int
-    line_id: int
-    kind: int             # 1 tap, 2 drag, 3 hold, 4 flick
-    above: bool
-    fake: bool
-    t_hit: float
-    t_end: float
-    x_local_px: float     # along tangent
-    y_offset_px: float
-    speed_mul: float      # hold tail multiplier (official), general multiplier (rpe)
-    size_px: float        # width scale
-    alpha01: float
-
-    tint_rgb: Tuple[int, int, int] = (255, 255, 255)
-    tint_hitfx_rgb: Optional[Tuple[int, int, int]] = None
-
-    # cached scroll at key times (pixel scroll)
-    scroll_hit: float = 0.0
-    scroll_end: float = 0.0
+    # slots: the render and judge loops read these fields per note per frame.
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10.
+    __slots__ = (
+        "nid", "line_id", "kind", "above", "fake", "t_hit", "t_end",
+        "x_local_px", "y_offset_px", "speed_mul", "size_px", "alpha01",
+        "tint_rgb", "tint_hitfx_rgb", "scroll_hit", "scroll_end",
+        "hitsound_path", "t_enter", "mh",
+    )
 
-    # RPE custom hitsound + precomputed visibility
-    hitsound_path: Optional[str] = None  # RPE: custom hitsound path
-    t_enter: float = -1e9                # first time note enters screen (precomputed)
-    mh: bool = False                     # multi-hit: for simultaneous notes (hold_mh)
+    def __init__(
+        self,
+        nid: int,
+        line_id: int,
+        kind: int,             # 1 tap, 2 drag, 3 hold, 4 flick
+        above: bool,
+        fake: bool,
+        t_hit: float,
+        t_end: float,
+        x_local_px: float,     # along tangent
+        y_offset_px: float,
+        speed_mul: float,      # hold tail multiplier (official), general multiplier (rpe)
+        size_px: float,        # width scale
+        alpha01: float,
+        tint_rgb: Tuple[int, int, int] = (255, 255, 255),
+        tint_hitfx_rgb: Optional[Tuple[int, int, int]] = None,
+        # cached scroll at key times (pixel scroll)
+        scroll_hit: float = 0.0,
+        scroll_end: float = 0.0,
+        # RPE custom hitsound + precomputed visibility
+        hitsound_path: Optional[str] = None,  # RPE: custom hitsound path
+        t_enter: float = -1e9,                # first time note enters screen (precomputed)
+        mh: bool = False,                     # multi-hit: for simultaneous notes (hold_mh)
+    ):
+        self.nid = nid
+        self.line_id = line_id
+        self.kind = kind
+        self.above = above
+        self.fake = fake
+        self.t_hit = t_hit
+        self.t_end = t_end
+        self.x_local_px = x_local_px
+        self.y_offset_px = y_offset_px
+        self.speed_mul = speed_mul
+        self.size_px = size_px
+        self.alpha01 = alpha01
+        self.tint_rgb = tint_rgb
+        self.tint_hitfx_rgb = tint_hitfx_rgb
+        self.scroll_hit = scroll_hit
+        self.scroll_end = scroll_end
+        self.hitsound_path = hitsound_path
+        self.t_enter = t_enter
+        self.mh = mh
 
 
 @dataclass
@@ -54,15 +81,28 @@ class RuntimeLine:
     event_counts: Dict[str, int] = field(default_factory=dict)
 
 
-@dataclass
 class NoteState:
-    note: RuntimeNote
-    judged: bool = False
-    hit: bool = False
-    holding: bool = False
-    released_early: bool = False
-    miss: bool = False
-    next_hold_fx_ms: int = 0
-    hold_grade: Optional[str] = None
-    hold_finalized: bool = False
-    hold_failed: bool = False
+    # slots: judge passes write these flags per note per frame, so every attribute
+    # they set is declared here rather than attached ad hoc.
+    __slots__ = (
+        "note", "judged", "hit", "holding", "released_early", "miss", "next_hold_fx_ms",
+        "hold_grade", "hold_weight", "hold_finalized", "hold_failed",
+        "miss_t", "release_t", "release_percent", "hold_pointer_id",
+    )
+
+    def __init__(self, note: RuntimeNote):
+        self.note = note
+        self.judged = False
+        self.hit = False
+        self.holding = False
+        self.released_early = False
+        self.miss = False
+        self.next_hold_fx_ms = 0
+        self.hold_grade: Optional[str] = None
+        self.hold_weight = 1.0                          # JUDGE_WEIGHT of hold_grade (PERFECT when unset)
+        self.hold_finalized = False
+        self.hold_failed = False
+        self.miss_t: Optional[float] = None             # time the MISS was registered
+        self.release_t: Optional[float] = None          # time a hold was released early
+        self.release_percent: Optional[float] = None    # hold progress at that release
+        self.hold_pointer_id: Optional[int] = None      # pointer currently covering the hold